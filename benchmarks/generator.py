@@ -0,0 +1,63 @@
+"""Synthetic feature data for benchmarks"""
+
+import datetime
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class Scale:
+    """
+    The size of the generated feature data
+
+    Parameters
+    ----------
+    rows:
+        Rows per feature group
+    features:
+        Feature columns per feature group
+    groups:
+        Number of feature groups
+    entities:
+        Number of distinct entity ids. Rows are spread over dates so each
+        entity has rows // entities snapshots
+    """
+
+    rows: int = 100_000
+    features: int = 4
+    groups: int = 2
+    entities: int = 10_000
+
+    @property
+    def dates(self) -> int:
+        return max(self.rows // self.entities, 1)
+
+
+def generate_feature_group(
+    scale: Scale, group: int, prefix: Optional[str] = None, seed: int = 42
+) -> tuple[list[str], pd.DataFrame]:
+    """Generate one feature group's data, returning its feature names and rows
+
+    Feature names are prefixed with the group name, as the registry requires feature
+    names to be unique
+    """
+    rng = np.random.default_rng(seed + group)
+    n_rows = scale.entities * scale.dates
+    start = datetime.date(2022, 1, 1)
+
+    prefix = prefix or f"g{group}"
+    feature_names = [f"{prefix}_f{i}" for i in range(scale.features)]
+    df = pd.DataFrame(
+        {
+            "entity_id": np.tile(np.arange(scale.entities), scale.dates),
+            "date_time": np.repeat(
+                [start + datetime.timedelta(days=d) for d in range(scale.dates)],
+                scale.entities,
+            ),
+            **{name: rng.random(n_rows) for name in feature_names},
+        }
+    )
+    return feature_names, df.head(scale.rows)
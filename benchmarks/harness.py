@@ -0,0 +1,120 @@
+"""Timing and memory measurement for benchmarks"""
+
+import gc
+import statistics
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional
+
+import pyarrow as pa
+
+
+@dataclass
+class Result:
+    name: str
+    rows: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    rows_per_second: float
+    peak_arrow_bytes: int
+    peak_python_bytes: int
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _PeakSampler:
+    """Polls Arrow's allocated bytes in a thread, recording the highest value seen"""
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, pa.total_allocated_bytes())
+            time.sleep(self.interval)
+
+    def __enter__(self) -> "_PeakSampler":
+        self.baseline = pa.total_allocated_bytes()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, pa.total_allocated_bytes()) - self.baseline
+
+
+def _percentile(timings: list[float], percentile: float) -> float:
+    if len(timings) == 1:
+        return timings[0]
+    return statistics.quantiles(timings, n=100, method="inclusive")[percentile - 1]
+
+
+def _peak_python_bytes(func: Callable[[], object]) -> int:
+    """Peak bytes traced by tracemalloc during one call, which covers Python objects and
+    NumPy buffers but not Arrow's memory pool"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    rows: int,
+    repeat: int = 10,
+    warmup: int = 1,
+    setup: Optional[Callable[[], None]] = None,
+) -> Result:
+    """Time `func` over `repeat` runs, after `warmup` untimed runs
+
+    `setup` is called before every run, outside the timing, for benchmarks that need
+    fresh state such as an empty table to upload to. Arrow's peak allocation is sampled
+    during the timed runs; the Python heap peak comes from one extra run under
+    tracemalloc, so its overhead does not skew the timings
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+
+    timings = []
+    with _PeakSampler() as sampler:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            gc.collect()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    peak_python_bytes = _peak_python_bytes(func)
+
+    mean = statistics.fmean(timings)
+    return Result(
+        name=name,
+        rows=rows,
+        mean=mean,
+        p50=_percentile(timings, 50),
+        p95=_percentile(timings, 95),
+        p99=_percentile(timings, 99),
+        rows_per_second=rows / mean if mean else 0.0,
+        peak_arrow_bytes=sampler.peak,
+        peak_python_bytes=peak_python_bytes,
+    )
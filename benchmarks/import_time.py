@@ -0,0 +1,77 @@
+"""
+Time imports of the feature store in fresh interpreters, and list the heavy
+dependencies each one loads
+
+Usage: python -m benchmarks.import_time [--repeat 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+HEAVY_MODULES = ["numpy", "pyarrow", "pandas", "sqlalchemy", "polars", "yaml"]
+
+STATEMENTS = [
+    "import feature_store",
+    "from feature_store import Client",
+    "from feature_store import AsyncClient",
+    "from feature_store.feature_storage.discovery import get_store_class; "
+    "get_store_class('parquet')",
+    "from feature_store.feature_storage.discovery import get_store_class; "
+    "get_store_class('sqlalchemy')",
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+seconds = time.perf_counter() - start
+print(json.dumps([seconds, [m for m in {modules!r} if m in sys.modules]]))
+"""
+
+
+@dataclass
+class ImportResult:
+    statement: str
+    p50: float
+    modules: list[str]
+
+
+def measure_import(statement: str, repeat: int = 5) -> ImportResult:
+    """Run `statement` in `repeat` new interpreters, timing it each time"""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _PROBE.format(statement=statement, modules=HEAVY_MODULES),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        seconds, modules = json.loads(output)
+        times.append(seconds)
+    return ImportResult(statement, statistics.median(times), modules)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'statement':<60} {'p50 (ms)':>9}  loaded")
+    for statement in STATEMENTS:
+        result = measure_import(statement, repeat=args.repeat)
+        name = statement.split("; ")[-1]
+        print(f"{name:<60} {result.p50 * 1000:>9.1f}  {', '.join(result.modules)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
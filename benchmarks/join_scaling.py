@@ -0,0 +1,84 @@
+"""
+Compare the multi-way join in Dataset.data with pairwise pa.Table.join as features are added
+
+Usage: python benchmarks/join_scaling.py [--rows 200000] [--features 2 4 8 16 32]
+"""
+
+import argparse
+import datetime
+import statistics
+import time
+from functools import reduce
+from typing import Callable
+
+import numpy as np
+import pyarrow as pa
+
+from feature_store.feature import _multi_join
+
+KEYS = ["entity_id", "date_time"]
+
+
+def make_feature_tables(n_rows: int, n_features: int, seed: int = 42) -> list[pa.Table]:
+    rng = np.random.default_rng(seed)
+    n_dates = 12
+    entity_ids = np.repeat(np.arange(n_rows // n_dates), n_dates)
+    dates = pa.array(
+        np.tile(np.arange(n_dates) * 30, n_rows // n_dates).astype("int32"),
+        type=pa.int32(),
+    ).cast(pa.date32())
+    tables = []
+    for i in range(n_features):
+        order = rng.permutation(len(entity_ids))
+        tables.append(
+            pa.table(
+                {
+                    "entity_id": entity_ids[order],
+                    "date_time": dates.take(order),
+                    f"feature_{i}": rng.random(len(entity_ids)),
+                }
+            )
+        )
+    return tables
+
+
+def pairwise_join(tables: list[pa.Table]) -> pa.Table:
+    return reduce(lambda left, right: left.join(right, keys=KEYS), tables)
+
+
+def multi_way_join(tables: list[pa.Table]) -> pa.Table:
+    return _multi_join(tables, KEYS)
+
+
+def time_join(
+    join: Callable[[list[pa.Table]], pa.Table], tables: list[pa.Table], repeat: int
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        join(tables)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--features", type=int, nargs="+", default=[2, 4, 8, 16, 32])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{datetime.date.today()} rows={args.rows}")
+    print(f"{'features':>8} {'pairwise (s)':>13} {'multi-way (s)':>14} {'speedup':>8}")
+    for n_features in args.features:
+        tables = make_feature_tables(args.rows, n_features)
+        pairwise = time_join(pairwise_join, tables, args.repeat)
+        multi_way = time_join(multi_way_join, tables, args.repeat)
+        print(
+            f"{n_features:>8} {pairwise:>13.3f} {multi_way:>14.3f} "
+            f"{pairwise / multi_way:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Run the benchmark suite, optionally saving or comparing against a baseline
+
+Usage: python -m benchmarks.run [--rows 100000] [--save baselines/default.json]
+                                [--compare baselines/default.json]
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+from typing import Optional, Sequence
+
+from benchmarks.generator import Scale
+from benchmarks.harness import Result
+from benchmarks.suites import run_suite
+
+
+def _format_row(result: Result, baseline: Optional[dict]) -> str:
+    change = ""
+    if baseline is not None:
+        change = f"{result.p50 / baseline['p50'] - 1:>+8.0%}"
+    return (
+        f"{result.name:<40} {result.p50 * 1000:>9.2f} {result.p95 * 1000:>9.2f} "
+        f"{result.p99 * 1000:>9.2f} {result.rows_per_second:>12,.0f} "
+        f"{result.peak_arrow_bytes / 2**20:>9.1f} "
+        f"{result.peak_python_bytes / 2**20:>9.1f} {change}"
+    )
+
+
+def compare(
+    results: list[Result], baselines: dict[str, dict], threshold: float
+) -> list[str]:
+    """Names of benchmarks whose median is more than `threshold` slower than baseline"""
+    return [
+        result.name
+        for result in results
+        if result.name in baselines
+        and result.p50 > baselines[result.name]["p50"] * (1 + threshold)
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=Scale.rows)
+    parser.add_argument("--features", type=int, default=Scale.features)
+    parser.add_argument("--groups", type=int, default=Scale.groups)
+    parser.add_argument("--entities", type=int, default=Scale.entities)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--save", type=pathlib.Path, help="Write results as a baseline")
+    parser.add_argument("--compare", type=pathlib.Path, help="Baseline to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fail if a median is this much slower than its baseline",
+    )
+    args = parser.parse_args(argv)
+
+    scale = Scale(
+        rows=args.rows,
+        features=args.features,
+        groups=args.groups,
+        entities=args.entities,
+    )
+    baselines = {}
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        if baseline["scale"] != vars(scale):
+            print(f"Warning: baseline was run at {Scale(**baseline['scale'])}")
+        baselines = baseline["results"]
+
+    print(scale)
+    print(
+        f"{'benchmark':<40} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} "
+        f"{'rows/s':>12} {'arrow MiB':>9} {'py MiB':>9} "
+        f"{'vs base' if baselines else ''}"
+    )
+    results = []
+    for result in run_suite(scale, repeat=args.repeat):
+        results.append(result)
+        print(_format_row(result, baselines.get(result.name)), flush=True)
+
+    if args.save is not None:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(
+            json.dumps(
+                {
+                    "scale": vars(scale),
+                    "results": {result.name: result.as_dict() for result in results},
+                },
+                indent=2,
+            )
+        )
+
+    regressions = compare(results, baselines, args.threshold)
+    if regressions:
+        print(f"Slower than baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
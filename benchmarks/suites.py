@@ -0,0 +1,160 @@
+"""Benchmarks of the retrieval, join and upload hot paths"""
+
+import pathlib
+import random
+import tempfile
+from dataclasses import dataclass, field
+from typing import Iterator
+
+import pandas as pd
+import yaml
+
+from benchmarks.generator import Scale, generate_feature_group
+from benchmarks.harness import Result, measure
+from feature_store import Client
+from feature_store.auth.file_auth import FileAuth
+from feature_store.feature import Dataset
+from feature_store.online_storage import SQLiteOnlineStorage
+from feature_store.registry_backends.local import LocalRegistryBackend
+
+BACKENDS = {"parquet": "local", "fsspec": "local_fsspec", "sql": "local_sqlite"}
+
+
+@dataclass
+class Workspace:
+    """A feature store in a temporary directory, loaded with generated feature groups"""
+
+    path: pathlib.Path
+    scale: Scale
+    client: Client = field(init=False)
+    feature_names: dict[str, list[str]] = field(init=False, default_factory=dict)
+    frames: dict[str, pd.DataFrame] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        config = self.path.joinpath("featurestore.yaml")
+        config.write_text(
+            yaml.safe_dump(
+                {
+                    "sources": {
+                        "local": {"type": "parquet", "uri": f"file://{self.path}"},
+                        "local_fsspec": {
+                            "type": "fsspec_parquet",
+                            "uri": f"file://{self.path.joinpath('fsspec')}",
+                        },
+                        "local_sqlite": {
+                            "type": "sqlalchemy",
+                            "db_url": f"sqlite:///{self.path.joinpath('features.db')}",
+                        },
+                    }
+                }
+            )
+        )
+        self.client = Client(
+            registry=LocalRegistryBackend(
+                database_url=f"sqlite:///{self.path.joinpath('registry.db')}"
+            ),
+            auth=FileAuth(config_file=config),
+            online_storage=SQLiteOnlineStorage(
+                db_url=f"sqlite:///{self.path.joinpath('online.db')}"
+            ),
+        )
+        for backend in BACKENDS:
+            for group in range(self.scale.groups):
+                self.add_group(f"{backend}_{group}", backend, seed=group)
+
+    def add_group(self, name: str, backend: str, seed: int = 0) -> None:
+        """Register a feature group with generated data and upload it"""
+        names, df = generate_feature_group(self.scale, seed, prefix=name)
+        source = BACKENDS[backend]
+        location = (
+            f"{source}::main.{name}"
+            if backend == "sql"
+            else f"{source}::{name}.parquet"
+        )
+        self._register(name, location, names)
+        self.client.upload_feature_data(name, df)
+        self.frames[name] = df
+
+    def _register(self, name: str, location: str, feature_names: list[str]) -> None:
+        self.client.register_feature_group(
+            name,
+            location=location,
+            id_column="entity_id",
+            description="Benchmark data",
+            features=feature_names,
+        )
+        self.feature_names[name] = feature_names
+
+    def features(self, backend: str) -> list[str]:
+        return [
+            f"{backend}_{group}.{feature}"
+            for group in range(self.scale.groups)
+            for feature in self.feature_names[f"{backend}_{group}"]
+        ]
+
+
+def run_suite(scale: Scale, repeat: int = 10) -> Iterator[Result]:
+    """Run every benchmark at the given scale, yielding results as they finish"""
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Workspace(pathlib.Path(tmp), scale)
+        client = workspace.client
+        total_rows = scale.rows * scale.groups
+        group_names = list(workspace.feature_names)
+
+        yield measure(
+            "registry.get_feature_groups_metadata",
+            lambda: client.registry.get_feature_groups_metadata(group_names),
+            rows=len(group_names),
+            repeat=repeat,
+        )
+
+        for backend in BACKENDS:
+            features = workspace.features(backend)
+            yield measure(
+                f"get_features[{backend}]",
+                lambda: client.get_features(features).data,
+                rows=total_rows,
+                repeat=repeat,
+            )
+
+            entity_ids = random.Random(0).sample(
+                range(scale.entities), min(100, scale.entities)
+            )
+            yield measure(
+                f"get_features[{backend}, 100 entities]",
+                lambda: client.get_features(features, entity_ids=entity_ids).data,
+                rows=len(entity_ids) * scale.dates * scale.groups,
+                repeat=repeat,
+            )
+
+        features = client.get_features(workspace.features("parquet")).features
+        yield measure(
+            "Dataset.data",
+            lambda: Dataset(features=features).data,
+            rows=total_rows,
+            repeat=repeat,
+        )
+
+        for backend in BACKENDS:
+            name = f"upload_{backend}"
+            workspace.add_group(name, backend)
+            yield measure(
+                f"upload_feature_data[{backend}]",
+                lambda: client.upload_feature_data(name, workspace.frames[name]),
+                rows=scale.rows,
+                repeat=repeat,
+            )
+
+        client.sync_online_storage("parquet_0")
+        online_ids = random.Random(1).sample(
+            range(scale.entities), min(10, scale.entities)
+        )
+        online_features = [
+            f"parquet_0.{f}" for f in workspace.feature_names["parquet_0"]
+        ]
+        yield measure(
+            "get_online_features[10 entities]",
+            lambda: client.get_online_features(online_features, online_ids),
+            rows=10,
+            repeat=repeat * 10,
+        )
@@ -1,3 +1,21 @@
-from feature_store.client import Client
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Client"]
+if TYPE_CHECKING:
+    from feature_store.async_client import AsyncClient
+    from feature_store.client import Client
+
+
+def __getattr__(name: str) -> Any:
+    # The clients are imported on first access, keeping `import feature_store` cheap
+    if name == "Client":
+        from feature_store.client import Client
+
+        return Client
+    if name == "AsyncClient":
+        from feature_store.async_client import AsyncClient
+
+        return AsyncClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["AsyncClient", "Client"]
@@ -0,0 +1,219 @@
+import asyncio
+import datetime
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+import pyarrow as pa
+
+from feature_store.auth.base import AuthType
+from feature_store.auth.file_auth import FileAuth
+from feature_store.client import (
+    _build_dataset,
+    _group_feature_names,
+    _implicit_latest,
+    _merge_snapshot,
+    _order_feature_groups,
+    _requested_columns,
+    _snapshot_group,
+    _use_snapshot,
+)
+from feature_store.exceptions import FeatureNotFoundException
+from feature_store.feature import Dataset, Feature, FeatureGroup, FeatureSource
+from feature_store.online_storage.base import _latest_per_entity
+from feature_store.registry_backends.base import (
+    AsyncRegistryBackend,
+    ThreadedRegistryBackend,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _default_registry() -> AsyncRegistryBackend:
+    from feature_store.registry_backends.local import LocalRegistryBackend
+
+    return ThreadedRegistryBackend(LocalRegistryBackend())
+
+
+@dataclass
+class AsyncClient:
+    """
+    An asyncio version of Client, which never blocks the event loop
+
+    Parameters
+    ----------
+    registry:
+        The async backend storing feature metadata. Defaults to the local registry,
+        run in a thread
+    auth:
+        Resolves feature group locations to async storage backends
+    """
+
+    registry: AsyncRegistryBackend = field(default_factory=_default_registry)
+    auth: AuthType = field(default_factory=FileAuth)
+
+    async def get_available_features(self) -> list[str]:
+        """Get all features stored in the feature store"""
+        feature_groups = await self.registry.get_available_feature_metadata()
+        return [
+            f"{feature_group.name}.{feature.name}"
+            for feature_group in feature_groups
+            for feature in feature_group.features
+        ]
+
+    async def get_features(
+        self,
+        feature_names: list[str],
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+        latest: Optional[bool] = None,
+    ) -> Dataset:
+        """Get a given dataset by specifying the features that should be in the dataset.
+        Feature groups are downloaded concurrently
+
+        Parameters
+        ----------
+        feature_names
+            The list of features that should be included in the dataset
+        start
+            Only include rows where the datetime column is on or after this date
+        end
+            Only include rows where the datetime column is on or before this date
+        entity_ids
+            Only include rows for these ids
+        latest
+            Only include the latest row per entity. By default, feature groups with a
+            materialized snapshot read it when no time range is given, so once a group
+            is materialized the dataset holds its latest rows rather than its history.
+            False always reads the full history. Such datasets can't be joined
+            point-in-time with `Dataset.as_of`
+        """
+        if entity_ids is not None:
+            entity_ids = list(entity_ids)
+
+        feature_dict = _group_feature_names(feature_names)
+        feature_groups = _order_feature_groups(
+            feature_dict,
+            await self.registry.get_feature_groups_metadata(list(feature_dict)),
+        )
+
+        async def download(group: FeatureGroup) -> pa.Table:
+            columns = _requested_columns(group, feature_dict[group.name])
+            store = self.auth.get_async_store(group.location)
+            if _use_snapshot(group, start, end, latest):
+                snapshot = _snapshot_group(group, group.snapshot.location)
+                snapshot_rows, recent_rows = await asyncio.gather(
+                    self.auth.get_async_store(snapshot.location).download_data(
+                        snapshot, columns=columns, entity_ids=entity_ids
+                    ),
+                    store.download_data(
+                        group,
+                        columns=columns,
+                        start=group.snapshot.watermark,
+                        entity_ids=entity_ids,
+                    ),
+                )
+                return _merge_snapshot(group, snapshot_rows, recent_rows)
+
+            table = await store.download_data(
+                group, columns=columns, start=start, end=end, entity_ids=entity_ids
+            )
+            if latest:
+                return _latest_per_entity(table, group.id_column, group.datetime_column)
+            return table
+
+        results = await asyncio.gather(
+            *(download(group) for group in feature_groups), return_exceptions=True
+        )
+        # Raise the error of the first failing group, regardless of which finished first
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        tables: list[Union[pa.Table, FeatureSource]] = list(results)
+        for i, group in enumerate(feature_groups):
+            if latest is None and _use_snapshot(group, start, end, latest):
+                tables[i] = _implicit_latest(tables[i])
+        return _build_dataset(feature_groups, tables, feature_dict)
+
+    async def get_feature(self, feature_name: str) -> Optional[Dataset]:
+        """Get a single feature from the store
+
+        Parameters
+        ----------
+        feature_name
+            The name of the feature to get
+        """
+        return await self.get_features([feature_name])
+
+    async def register_feature_group(
+        self,
+        feature_group_name: str,
+        location: str,
+        id_column: str,
+        description: str,
+        date_column: str = "date_time",
+        features: list[str] = None,
+    ) -> FeatureGroup:
+        """Register a new feature to the feature store.
+
+        Parameters
+        ----------
+        feature_group_name
+            The name of the feature group.
+        location
+            The location of the data. Passed to the backend.
+        id_column
+            The column that is used for joining to other columns
+        description
+            A description of the feature group
+        date_column
+            The column that identifies the date for which this feature is valid
+        features
+            A list of features contained in the feature group
+        """
+        new_feature = FeatureGroup(
+            name=feature_group_name,
+            location=location,
+            id_column=id_column,
+            datetime_column=date_column,
+            description=description,
+            features=[
+                Feature(name=f, id_column=id_column, datetime_column=date_column)
+                for f in features
+            ],
+        )
+        await self.registry.add_feature_group_metadata(new_feature)
+        return new_feature
+
+    async def upload_feature_data(
+        self, feature_group_name: str, data: "pd.DataFrame"
+    ) -> FeatureGroup:
+        """
+        Upload data to the backend for a given feature
+
+        Parameters
+        ----------
+        feature_group_name
+            The name of the feature
+        data
+            The data to be stored in the backend
+
+        Returns
+        -------
+        Feature
+            The feature that the data was stored to
+        """
+        feature_group = await self.registry.get_feature_group_metadata(
+            feature_group_name
+        )
+        if feature_group is None:
+            raise FeatureNotFoundException(
+                f"Feature group not found: {feature_group_name}"
+            )
+        store = self.auth.get_async_store(feature_group.location)
+        source = FeatureSource.from_table(await store.upload_data(data, feature_group))
+        for feature in feature_group.features:
+            feature.read_source(source)
+        return feature_group
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import Protocol
 
-from feature_store.feature_storage import FeatureStorage
+from feature_store.feature_storage import AsyncFeatureStorage, FeatureStorage
 
 
 class AuthType(Protocol):
     def get_store(self, location: str) -> FeatureStorage: ...
+
+    def get_async_store(self, location: str) -> AsyncFeatureStorage: ...
@@ -1,33 +1,130 @@
-import functools
+import hashlib
+import json
 import pathlib
-from dataclasses import dataclass
-from typing import Any
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
-import yaml
+from feature_store.feature_storage import (
+    AsyncFeatureStorage,
+    FeatureStorage,
+    ThreadedFeatureStorage,
+)
+from feature_store.feature_storage.cache import CachedFeatureStorage
+from feature_store.feature_storage.discovery import (
+    get_async_store_class,
+    get_store_class,
+)
 
-from feature_store.feature import STORES
-from feature_store.feature_storage import FeatureStorage
+# Source options only read by native async stores, left out when building sync stores
+_ASYNC_ONLY_OPTIONS = ("async_db_url",)
 
 
 @dataclass
 class FileAuth:
+    """
+    Builds storage backends from the sources in a config file
+
+    Stores are pooled per source key, so connection pools and caches are reused
+    across calls. Changes to the config file are picked up on the next call, and
+    only the stores of sources whose config changed are rebuilt
+    """
+
     config_file: pathlib.Path = pathlib.Path("featurestore.yaml")
+    _config: dict = field(init=False, default_factory=dict, repr=False)
+    _config_version: Optional[tuple[int, int]] = field(
+        init=False, default=None, repr=False
+    )
+    _stores: dict[str, FeatureStorage] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _async_stores: dict[str, AsyncFeatureStorage] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _lock: threading.RLock = field(
+        init=False, default_factory=threading.RLock, repr=False
+    )
 
     def _get_sources_key(self, key: str) -> dict[str, Any]:
         if key in self._file_config.get("sources", {}):
             return self._file_config["sources"][key]
         return {}
 
-    @functools.cached_property
+    @property
     def _file_config(self) -> dict:
-        if not self.config_file.exists():
-            return {}
-        with self.config_file.open() as f:
-            config = yaml.safe_load(f)
-        return config
+        with self._lock:
+            self._reload_config()
+            return self._config
+
+    def _reload_config(self) -> None:
+        """Re-read the config file if its mtime or size changed since it was last read,
+        dropping the pooled stores of sources whose config changed"""
+        try:
+            stat = self.config_file.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            version = None
+        if version == self._config_version:
+            return
+
+        config = {}
+        if version is not None:
+            import yaml
+
+            with self.config_file.open() as f:
+                config = yaml.safe_load(f) or {}
+        old_sources = self._config.get("sources", {})
+        new_sources = config.get("sources", {})
+        for key in old_sources:
+            if old_sources[key] != new_sources.get(key):
+                self._stores.pop(key, None)
+                self._async_stores.pop(key, None)
+        self._config = config
+        self._config_version = version
 
     def get_store(self, location: str) -> FeatureStorage:
+        key, _, _ = location.partition("::")
+        with self._lock:
+            self._reload_config()
+            if key not in self._stores:
+                self._stores[key] = self._build_store(key)
+            return self._stores[key]
+
+    def _build_store(self, key: str) -> FeatureStorage:
+        config = {**self._get_sources_key(key)}
+        cache_config = config.pop("cache", None)
+        store_type = config.pop("type")
+        for option in _ASYNC_ONLY_OPTIONS:
+            config.pop(option, None)
+        store = get_store_class(store_type)(**config)
+        if cache_config is None:
+            return store
+
+        namespace = json.dumps([key, store_type, config], sort_keys=True, default=str)
+        return CachedFeatureStorage(
+            store,
+            namespace=hashlib.sha256(namespace.encode()).hexdigest(),
+            **cache_config,
+        )
+
+    def get_async_store(self, location: str) -> AsyncFeatureStorage:
+        """Get an async store, running store types with no native async version, or whose
+        config the native version doesn't support, in a thread"""
+        key, _, _ = location.partition("::")
+        with self._lock:
+            self._reload_config()
+            if key not in self._async_stores:
+                self._async_stores[key] = self._build_async_store(location)
+            return self._async_stores[key]
+
+    def _build_async_store(self, location: str) -> AsyncFeatureStorage:
         key, _, _ = location.partition("::")
         config = {**self._get_sources_key(key)}
         store_type = config.pop("type")
-        return STORES[store_type](**config)
+        config.pop("cache", None)
+        async_store = get_async_store_class(store_type)
+        # Native async stores can decline configs they can't serve, e.g. a sync driver
+        supports = getattr(async_store, "supports", None)
+        if async_store is not None and (supports is None or supports(config)):
+            return async_store(**config)
+        return ThreadedFeatureStorage(self.get_store(location))
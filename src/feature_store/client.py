@@ -1,21 +1,209 @@
+import contextlib
+import dataclasses
+import datetime
+import functools
+import threading
+import uuid
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from feature_store.auth.base import AuthType
 from feature_store.auth.file_auth import FileAuth
 from feature_store.exceptions import FeatureNotFoundException
-from feature_store.feature import Dataset, Feature, FeatureGroup
+from feature_store.feature import (
+    Dataset,
+    Feature,
+    FeatureGroup,
+    FeatureSource,
+    Snapshot,
+)
+from feature_store.online_storage.base import OnlineStorage, _latest_per_entity
 from feature_store.registry_backends.base import RegistryBackend
-from feature_store.registry_backends.local import LocalRegistryBackend
+from feature_store.stats import ClientStats
+from feature_store.tracing import Instrumentation
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+T = TypeVar("T")
+
+
+def _group_feature_names(feature_names: list[str]) -> dict[str, list[str]]:
+    """Split "group.feature" names into the requested features per group"""
+    if any("." not in feature for feature in feature_names):
+        raise FeatureNotFoundException("Features must contain a period ('.')")
+
+    feature_dict = defaultdict(list)
+    for feature_group_name, feature_name in (
+        feature.split(".") for feature in feature_names
+    ):
+        feature_dict[feature_group_name].append(feature_name)
+    return feature_dict
+
+
+def _order_feature_groups(
+    feature_dict: dict[str, list[str]], found_groups: dict[str, FeatureGroup]
+) -> list[FeatureGroup]:
+    missing_groups = [name for name in feature_dict if name not in found_groups]
+    if missing_groups:
+        raise FeatureNotFoundException(
+            f"Feature groups not found: {', '.join(missing_groups)}"
+        )
+    return [found_groups[name] for name in feature_dict]
+
+
+def _requested_columns(group: FeatureGroup, feature_names: list[str]) -> list[str]:
+    return [
+        group.id_column,
+        group.datetime_column,
+        *(feature.name for feature in group.features if feature.name in feature_names),
+    ]
+
+
+def _use_snapshot(
+    group: FeatureGroup,
+    start: Optional[datetime.date],
+    end: Optional[datetime.date],
+    latest: Optional[bool],
+) -> bool:
+    """Snapshots hold the latest rows over all time, so they can't answer a time range"""
+    return (
+        group.snapshot is not None
+        and start is None
+        and end is None
+        and latest is not False
+    )
+
+
+def _snapshot_group(group: FeatureGroup, location: str) -> FeatureGroup:
+    return dataclasses.replace(group, location=location, snapshot=None)
+
+
+def _merge_snapshot(
+    group: FeatureGroup, snapshot_rows: pa.Table, recent_rows: pa.Table
+) -> pa.Table:
+    """Combine a snapshot with rows added since its watermark"""
+    return _latest_per_entity(
+        pa.concat_tables([snapshot_rows, recent_rows], promote_options="permissive"),
+        group.id_column,
+        group.datetime_column,
+    )
+
+
+def _deferred_source(download: Callable[[], pa.Table]) -> FeatureSource:
+    """A source for tables that have to be computed in full before they can be streamed"""
+    return FeatureSource(
+        lambda batch_size: iter(download().to_batches(max_chunksize=batch_size))
+    )
+
+
+def _implicit_latest(
+    table: Union[pa.Table, FeatureSource], history: Optional[FeatureSource] = None
+) -> FeatureSource:
+    """Mark a group read from its snapshot by default, so point-in-time joins can
+    read its full history instead"""
+    if isinstance(table, FeatureSource):
+        table.latest_only, table.history = True, history
+        return table
+    return FeatureSource.from_table(table, latest_only=True, history=history)
+
+
+def _build_dataset(
+    feature_groups: list[FeatureGroup],
+    tables: list[Union[pa.Table, FeatureSource]],
+    feature_dict: dict[str, list[str]],
+    instrumentation: Optional[Instrumentation] = None,
+) -> Dataset:
+    for group, table in zip(feature_groups, tables):
+        # Features of a group share one source, so the dataset takes their columns
+        # from the same table instead of joining them back together
+        source = (
+            table
+            if isinstance(table, FeatureSource)
+            else FeatureSource.from_table(table)
+        )
+        for feature in group.features:
+            if feature.name in feature_dict[group.name]:
+                feature.read_source(source)
+
+    return Dataset(
+        features=[
+            feature
+            for feature_group in feature_groups
+            for feature in feature_group.features
+            if feature.name in feature_dict[feature_group.name]
+        ],
+        instrumentation=instrumentation,
+    )
+
+
+def _default_registry() -> RegistryBackend:
+    from feature_store.registry_backends.local import LocalRegistryBackend
+
+    return LocalRegistryBackend()
+
+
+def _default_online_storage() -> OnlineStorage:
+    from feature_store.online_storage.sqlite import SQLiteOnlineStorage
+
+    return SQLiteOnlineStorage()
 
 
 @dataclass
 class Client:
-    registry: RegistryBackend = field(default_factory=LocalRegistryBackend)
+    """
+    The entrypoint to the feature store
+
+    Parameters
+    ----------
+    registry:
+        The backend storing feature metadata
+    auth:
+        Resolves feature group locations to storage backends
+    max_workers:
+        The number of feature groups to download concurrently. 1 downloads them one by one
+    source_concurrency:
+        Limits on concurrent downloads per source key, for sources that can't take
+        `max_workers` parallel requests
+    online_storage:
+        Serves the latest feature values per entity for `get_online_features`
+    instrumentation:
+        Times each stage of a request, passing spans to its tracers and keeping
+        cumulative stats
+    """
+
+    registry: RegistryBackend = field(default_factory=_default_registry)
     auth: AuthType = field(default_factory=FileAuth)
+    max_workers: int = 1
+    source_concurrency: dict[str, int] = field(default_factory=dict)
+    online_storage: OnlineStorage = field(default_factory=_default_online_storage)
+    instrumentation: Instrumentation = field(default_factory=Instrumentation)
+    _source_semaphores: dict[str, threading.Semaphore] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _semaphores_lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False
+    )
+
+    @property
+    def stats(self) -> ClientStats:
+        """Cumulative stats per stage of all requests made through this client"""
+        return self.instrumentation.stats
 
     def get_available_features(self) -> list[str]:
         """Get all features stored in the feature store"""
@@ -26,45 +214,228 @@ class Client:
             for feature in feature_group.features
         ]
 
-    def get_features(self, feature_names: list[str]) -> Dataset:
+    def get_features(
+        self,
+        feature_names: list[str],
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+        lazy: bool = False,
+        latest: Optional[bool] = None,
+    ) -> Dataset:
         """Get a given dataset by specifying the features that should be in the dataset
 
         Parameters
         ----------
         feature_names
             The list of features that should be included in the dataset
+        start
+            Only include rows where the datetime column is on or after this date
+        end
+            Only include rows where the datetime column is on or before this date
+        entity_ids
+            Only include rows for these ids
+        lazy
+            Download feature groups when their data is first used, streaming them in
+            batches where possible
+        latest
+            Only include the latest row per entity. By default, feature groups with a
+            materialized snapshot read it when no time range is given, so once a group
+            is materialized the dataset holds its latest rows rather than its history.
+            False always reads the full history. Datasets joined point-in-time with
+            `Dataset.as_of` read the full history of such groups instead
         """
 
-        if any("." not in feature for feature in feature_names):
-            raise FeatureNotFoundException("Features must contain a period ('.')")
+        if entity_ids is not None:
+            entity_ids = list(entity_ids)
 
-        feature_dict = defaultdict(list)
+        feature_dict = _group_feature_names(feature_names)
+        feature_groups = self._get_feature_groups(feature_dict)
 
-        for feature_group_name, feature_name in (
-            feature.split(".") for feature in feature_names
-        ):
-            feature_dict[feature_group_name].append(feature_name)
+        def download(group: FeatureGroup) -> pa.Table:
+            columns = _requested_columns(group, feature_dict[group.name])
+            if _use_snapshot(group, start, end, latest):
+                return self._download_snapshot(
+                    group, columns=columns, entity_ids=entity_ids
+                )
+            table = self._download_group(
+                group, columns=columns, start=start, end=end, entity_ids=entity_ids
+            )
+            if latest:
+                return _latest_per_entity(table, group.id_column, group.datetime_column)
+            return table
 
-        feature_groups = [
-            self.registry.get_feature_group_metadata(name) for name in feature_dict
-        ]
+        if lazy:
+            sources = [
+                (
+                    _deferred_source(functools.partial(download, group))
+                    if latest or _use_snapshot(group, start, end, latest)
+                    else self._lazy_source(
+                        group,
+                        columns=_requested_columns(group, feature_dict[group.name]),
+                        start=start,
+                        end=end,
+                        entity_ids=entity_ids,
+                    )
+                )
+                for group in feature_groups
+            ]
+        else:
+            sources = self._map_groups(download, feature_groups)
+
+        for i, group in enumerate(feature_groups):
+            if latest is None and _use_snapshot(group, start, end, latest):
+                history = self._lazy_source(
+                    group,
+                    columns=_requested_columns(group, feature_dict[group.name]),
+                    entity_ids=entity_ids,
+                )
+                sources[i] = _implicit_latest(sources[i], history)
+        return _build_dataset(
+            feature_groups, sources, feature_dict, self.instrumentation
+        )
+
+    def get_online_features(
+        self, feature_names: list[str], entity_ids: Iterable[Any]
+    ) -> pa.Table:
+        """Get the latest value of each feature for each entity from the online storage
+
+        Parameters
+        ----------
+        feature_names
+            The list of features that should be included
+        entity_ids
+            The ids to look up. The result has one row per id, in the same order, with
+            nulls for ids that have no online data
 
+        Returns
+        -------
+        pa.Table
+            The entity ids, followed by a column per feature
+        """
+        entity_ids = list(entity_ids)
+        feature_dict = _group_feature_names(feature_names)
+        feature_groups = self._get_feature_groups(feature_dict)
+
+        columns = {feature_groups[0].id_column: pa.array(entity_ids)}
         for group in feature_groups:
-            store = self.auth.get_store(group.location)
-            table = store.download_data(group)
-            for feature in group.features:
-                if feature.name in feature_dict[group.name]:
-                    feature.read_data(table)
+            with self.instrumentation.span(
+                "online_read", feature_group=group.name
+            ) as span:
+                table = self.online_storage.read_latest(
+                    group, feature_dict[group.name], entity_ids
+                )
+                span.rows, span.bytes = table.num_rows, table.nbytes
+            columns.update(zip(table.column_names, table.columns))
+        return pa.table(columns)
 
-        dataset = Dataset(
-            features=[
-                feature
-                for feature_group in feature_groups
-                for feature in feature_group.features
-                if feature.name in feature_dict[feature_group.name]
-            ]
+    def sync_online_storage(
+        self,
+        feature_group_name: str,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> FeatureGroup:
+        """Load the latest row per entity of a feature group into the online storage
+
+        Rows already in the online storage are only replaced by newer ones, so passing
+        `start` loads just the data added since the last sync
+
+        Parameters
+        ----------
+        feature_group_name
+            The name of the feature group
+        start
+            Only read rows where the datetime column is on or after this date
+        end
+            Only read rows where the datetime column is on or before this date
+        """
+        feature_group = self.registry.get_feature_group_metadata(feature_group_name)
+        if feature_group is None:
+            raise FeatureNotFoundException(
+                f"Feature group not found: {feature_group_name}"
+            )
+        table = self._download_group(feature_group, start=start, end=end)
+        self.online_storage.write_latest(feature_group, table)
+        return feature_group
+
+    def _get_feature_groups(
+        self, feature_dict: dict[str, list[str]]
+    ) -> list[FeatureGroup]:
+        with self.instrumentation.span("registry"):
+            return _order_feature_groups(
+                feature_dict,
+                self.registry.get_feature_groups_metadata(list(feature_dict)),
+            )
+
+    def _source_semaphore(self, location: str) -> Optional[threading.Semaphore]:
+        key, _, _ = location.partition("::")
+        if key not in self.source_concurrency:
+            return None
+        with self._semaphores_lock:
+            if key not in self._source_semaphores:
+                self._source_semaphores[key] = threading.Semaphore(
+                    self.source_concurrency[key]
+                )
+            return self._source_semaphores[key]
+
+    def _download_group(self, group: FeatureGroup, **kwargs: Any) -> pa.Table:
+        backend, _, _ = group.location.partition("::")
+        with self._source_semaphore(group.location) or contextlib.nullcontext():
+            with self.instrumentation.span(
+                "get_store", backend=backend, feature_group=group.name
+            ):
+                store = self.auth.get_store(group.location)
+            with self.instrumentation.span(
+                "download", backend=backend, feature_group=group.name
+            ) as span:
+                table = store.download_data(group, **kwargs)
+                span.rows, span.bytes = table.num_rows, table.nbytes
+            return table
+
+    def _download_snapshot(self, group: FeatureGroup, **kwargs: Any) -> pa.Table:
+        snapshot = group.snapshot
+        snapshot_rows = self._download_group(
+            _snapshot_group(group, snapshot.location), **kwargs
         )
-        return dataset
+        recent_rows = self._download_group(group, start=snapshot.watermark, **kwargs)
+        return _merge_snapshot(group, snapshot_rows, recent_rows)
+
+    def _lazy_source(self, group: FeatureGroup, **kwargs: Any) -> FeatureSource:
+        def download_batches(batch_size: Optional[int]) -> Iterator[pa.RecordBatch]:
+            store = self.auth.get_store(group.location)
+            return store.download_batches(group, batch_size=batch_size, **kwargs)
+
+        store = self.auth.get_store(group.location)
+        if not hasattr(store, "scan_polars"):
+            return FeatureSource(download_batches)
+
+        def scan() -> "pl.LazyFrame":
+            return store.scan_polars(group, **kwargs)
+
+        return FeatureSource(download_batches, scan=scan)
+
+    def _map_groups(
+        self,
+        func: Callable[[FeatureGroup], T],
+        feature_groups: list[FeatureGroup],
+    ) -> list[T]:
+        """Apply func to each feature group, concurrently if max_workers allows it
+
+        Results are returned in the same order as the feature groups. If any call fails,
+        pending calls are cancelled and the error of the first failing group is raised
+        """
+        if self.max_workers <= 1 or len(feature_groups) <= 1:
+            return [func(group) for group in feature_groups]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(feature_groups))
+        ) as executor:
+            futures = [executor.submit(func, group) for group in feature_groups]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
     def register_feature_group(
         self,
@@ -106,6 +477,63 @@ class Client:
         self.registry.add_feature_group_metadata(new_feature)
         return new_feature
 
+    def materialize(
+        self, feature_group_name: str, full_refresh: bool = False
+    ) -> FeatureGroup:
+        """Compact a feature group into a snapshot of the latest row per entity
+
+        The snapshot is written through the feature group's storage and recorded in the
+        registry. By default, only rows newer than the last snapshot's watermark are
+        read, and their latest rows appended to the snapshot. A full refresh rebuilds
+        the snapshot from the whole history in a new location, and deletes the old
+        snapshot once the registry points to the new one
+
+        Parameters
+        ----------
+        feature_group_name
+            The name of the feature group
+        full_refresh
+            Rebuild the snapshot instead of updating it incrementally
+        """
+        feature_group = self.registry.get_feature_group_metadata(feature_group_name)
+        if feature_group is None:
+            raise FeatureNotFoundException(
+                f"Feature group not found: {feature_group_name}"
+            )
+
+        previous = feature_group.snapshot
+        snapshot = None if full_refresh else previous
+        if snapshot is None:
+            rows = self._download_group(feature_group)
+            location = f"{feature_group.location}_snapshot_{uuid.uuid4().hex[:8]}"
+        else:
+            rows = self._download_group(feature_group, start=snapshot.watermark)
+            rows = rows.filter(
+                pc.field(feature_group.datetime_column) > snapshot.watermark
+            )
+            location = snapshot.location
+
+        if rows.num_rows == 0:
+            return feature_group
+
+        latest = _latest_per_entity(
+            rows, feature_group.id_column, feature_group.datetime_column
+        )
+        self.auth.get_store(location).upload_data(
+            latest.to_pandas(), _snapshot_group(feature_group, location)
+        )
+        feature_group.snapshot = Snapshot(
+            location=location,
+            watermark=pc.max(rows[feature_group.datetime_column]).as_py(),
+        )
+        self.registry.set_snapshot_metadata(feature_group.name, feature_group.snapshot)
+
+        if previous is not None and previous.location != location:
+            self.auth.get_store(previous.location).delete_data(
+                _snapshot_group(feature_group, previous.location)
+            )
+        return feature_group
+
     def get_feature(self, feature_name: str) -> Optional[Dataset]:
         """Get a single feature from the store
 
@@ -117,7 +545,7 @@ class Client:
         return self.get_features([feature_name])
 
     def upload_feature_data(
-        self, feature_group_name: str, data: pd.DataFrame
+        self, feature_group_name: str, data: "pd.DataFrame"
     ) -> FeatureGroup:
         """
         Upload data to the backend for a given feature
@@ -136,7 +564,7 @@ class Client:
         """
         feature_group = self.registry.get_feature_group_metadata(feature_group_name)
         store = self.auth.get_store(feature_group.location)
-        table = store.upload_data(data, feature_group)
+        source = FeatureSource.from_table(store.upload_data(data, feature_group))
         for feature in feature_group.features:
-            feature.read_data(table)
+            feature.read_source(source)
         return feature_group
@@ -1,28 +1,383 @@
 from __future__ import annotations
 
+import contextlib
+import copy
+import dataclasses
+import datetime
+import itertools
+import math
 from dataclasses import dataclass, field
 from functools import cached_property, reduce
-from typing import Any, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Iterator,
+    Literal,
+    Optional,
+    Union,
+)
 
-import pandas as pd
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 from typing_extensions import Self
 
-from feature_store.exceptions import MismatchedFeatureException, MissingDataException
+from feature_store.exceptions import (
+    FeatureDataException,
+    MismatchedFeatureException,
+    MissingDataException,
+)
 from feature_store.feature_storage.base import FeatureStorage
-from feature_store.feature_storage.parquet import ParquetFeatureStorage
-from feature_store.feature_storage.sql import SQLAlchemyFeatureStorage
+from feature_store.feature_storage.discovery import get_store_class
+from feature_store.tracing import Instrumentation, Span
 
-STORES: dict[str, Type[FeatureStorage]] = {
-    storage.type: storage
-    for storage in [ParquetFeatureStorage, SQLAlchemyFeatureStorage]
-}
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
 
+_UNBOUNDED_TOLERANCE = -(2**63 - 1)
 
-def _get_store_from_config(config: dict[str, Any]) -> Type[FeatureStorage]:
+_TICKS_PER_SECOND = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+
+def _get_store_from_config(config: dict[str, Any]) -> FeatureStorage:
     """Return the needed store to fetch the data"""
     store_type = config.pop("type")
-    return STORES[store_type](**config)
+    return get_store_class(store_type)(**config)
+
+
+def _tolerance_to_int(
+    tolerance: Optional[datetime.timedelta], data_type: pa.DataType
+) -> int:
+    """Convert a lookback tolerance into the units of the as-of key column"""
+    if tolerance is None:
+        return _UNBOUNDED_TOLERANCE
+
+    if pa.types.is_date32(data_type):
+        return -(tolerance // datetime.timedelta(days=1))
+
+    if pa.types.is_date64(data_type):
+        ticks_per_second = _TICKS_PER_SECOND["ms"]
+    elif pa.types.is_timestamp(data_type):
+        ticks_per_second = _TICKS_PER_SECOND[data_type.unit]
+    else:
+        raise MismatchedFeatureException(
+            f"Cannot apply a tolerance to a datetime column of type {data_type}"
+        )
+    microseconds = tolerance // datetime.timedelta(microseconds=1)
+    return -(microseconds * ticks_per_second // 1_000_000)
+
+
+def _integer_view_type(data_type: pa.DataType) -> Optional[pa.DataType]:
+    """The integer type a signed integer or temporal key can be viewed as, if any"""
+    is_integer_like = pa.types.is_signed_integer(data_type) or (
+        pa.types.is_temporal(data_type) and not pa.types.is_interval(data_type)
+    )
+    return {32: pa.int32(), 64: pa.int64()}.get(
+        data_type.bit_width if is_integer_like else None
+    )
+
+
+def _encode_key(column: pa.Array, max_codes: int) -> tuple[np.ndarray, int]:
+    """Encode a key column as dense integer codes, returning the codes and their count
+
+    Integer and temporal keys spanning a small range are numbered through a lookup
+    table instead of hashing. Other keys are dictionary encoded. Nulls get -1
+    """
+    integer_type = _integer_view_type(column.type)
+    if integer_type is not None:
+        values = column.view(integer_type).cast(pa.int64())
+        bounds = pc.min_max(values)
+        low, high = bounds["min"].as_py(), bounds["max"].as_py()
+        if low is None:
+            return np.full(len(column), -1, dtype=np.int64), 0
+        if high - low < max_codes:
+            offsets = pc.fill_null(pc.subtract(values, low), -1).to_numpy()
+            # Renumber the values that occur, so gaps in the range don't inflate it
+            present = np.zeros(high - low + 2, dtype=bool)
+            present[offsets] = True
+            present[-1] = False
+            renumber = np.cumsum(present) - 1
+            renumber[-1] = -1
+            return renumber[offsets], int(present.sum())
+
+    encoded = pc.dictionary_encode(column)
+    codes = pc.fill_null(encoded.indices, -1).to_numpy().astype(np.int64)
+    return codes, len(encoded.dictionary)
+
+
+def _key_codes(tables: list[pa.Table], keys: list[str]) -> tuple[list[np.ndarray], int]:
+    """Encode the composite keys of each table as integers in one shared range
+
+    Each key column is encoded once across all tables, and the per-column codes are
+    combined into a single code per row. Rows with a null key get -1. Returns the codes
+    per table and the size of the range
+    """
+    lengths = [table.num_rows for table in tables]
+    max_codes = 4 * max(lengths) + 1024
+    composite = np.zeros(sum(lengths), dtype=np.int64)
+    n_codes = 1
+    for key in keys:
+        key_type = tables[0].schema.field(key).type
+        column = pa.chunked_array(
+            [chunk for table in tables for chunk in table[key].cast(key_type).chunks],
+            type=key_type,
+        ).combine_chunks()
+        codes, cardinality = _encode_key(column, max_codes)
+        composite = np.where(
+            (composite < 0) | (codes < 0), -1, composite * cardinality + codes
+        )
+        n_codes *= cardinality
+
+    if n_codes > max_codes:
+        # Too sparse to index directly, so compact the combined codes
+        dense = pc.dictionary_encode(pa.array(composite, mask=composite < 0))
+        composite = pc.fill_null(dense.indices, -1).to_numpy().astype(np.int64)
+        n_codes = len(dense.dictionary)
+    return np.split(composite, np.cumsum(lengths)[:-1]), n_codes
+
+
+def _multi_join(tables: list[pa.Table], keys: list[str]) -> pa.Table:
+    """Left join every table onto the first in a single pass
+
+    Keys are encoded once for all tables, then each table's columns are gathered by
+    position into the output, instead of building a hash table and an intermediate
+    table per join. If a key occurs more than once in a joined table, its first row
+    is used
+    """
+    base, *others = tables
+    codes, n_codes = _key_codes(tables, keys)
+
+    # The extra last slot is never written, so null keys (-1) find no match
+    positions = np.full(n_codes + 1, -1, dtype=np.int64)
+    columns = {name: base[name] for name in base.column_names}
+    for table, table_codes in zip(others, codes[1:]):
+        rows = np.flatnonzero(table_codes >= 0)[::-1]
+        positions[table_codes[rows]] = rows
+        indices = positions[codes[0]]
+        positions[table_codes[rows]] = -1
+        take = pa.array(indices, mask=indices < 0)
+        for name in table.column_names:
+            if name not in keys:
+                columns[name] = table[name].take(take)
+    return pa.table(columns)
+
+
+class _KeyEncoder:
+    """Encodes values of a key column as codes of the distinct values of a reference column
+
+    Integer and temporal keys spanning a small range are numbered through a lookup table,
+    other keys by binary search in the sorted distinct values. Values that don't occur in
+    the reference column, and nulls, get -1
+    """
+
+    def __init__(self, column: pa.Array, max_codes: int):
+        self.type = column.type
+        self._integer_type = _integer_view_type(column.type)
+        self._renumber: Optional[np.ndarray] = None
+        values = pc.unique(column.drop_null())
+        if self._integer_type is not None:
+            integers = self._integers(values)
+            if len(integers) and integers.max() - integers.min() < max_codes:
+                self._low = int(integers.min())
+                self._renumber = np.full(int(integers.max()) - self._low + 1, -1)
+                self._renumber[np.sort(integers) - self._low] = np.arange(len(integers))
+                self.cardinality = len(integers)
+                return
+        self._sorted = self._numpy(pc.take(values, pc.sort_indices(values)))
+        self.cardinality = len(self._sorted)
+
+    def encode(self, column: pa.Array) -> np.ndarray:
+        column = column.cast(self.type)
+        if column.null_count:
+            codes = np.full(len(column), -1, dtype=np.int64)
+            valid = column.is_valid()
+            codes[np.asarray(valid)] = self._encode_values(
+                self._numpy(column.filter(valid))
+            )
+            return codes
+        return self._encode_values(self._numpy(column))
+
+    def _encode_values(self, values: np.ndarray) -> np.ndarray:
+        if self._renumber is not None:
+            offsets = values - self._low
+            inside = (offsets >= 0) & (offsets < len(self._renumber))
+            if inside.all():
+                return self._renumber[offsets]
+            return np.where(inside, self._renumber[np.where(inside, offsets, 0)], -1)
+
+        if not len(self._sorted):
+            return np.full(len(values), -1, dtype=np.int64)
+        found = np.searchsorted(self._sorted, values)
+        found[found == len(self._sorted)] = 0
+        return np.where(self._sorted[found] == values, found, -1)
+
+    def _numpy(self, values: pa.Array) -> np.ndarray:
+        if self._integer_type is not None:
+            return self._integers(values)
+        return values.to_numpy(zero_copy_only=False)
+
+    def _integers(self, values: pa.Array) -> np.ndarray:
+        return values.view(self._integer_type).cast(pa.int64()).to_numpy()
+
+
+class _KeyIndex:
+    """The row positions of the composite keys of a set of tables, for joining them onto
+    many batches
+
+    The tables' keys are encoded once, so joining a batch only encodes and looks up the
+    batch's own keys. If a key occurs more than once in a table, its first row is used
+    """
+
+    def __init__(self, tables: list[pa.Table], keys: list[str]):
+        self.tables = tables
+        self.keys = keys
+        lengths = [table.num_rows for table in tables]
+        max_codes = 4 * max(lengths) + 1024
+        columns = []
+        for key in keys:
+            key_type = tables[0].schema.field(key).type
+            columns.append(
+                pa.chunked_array(
+                    [
+                        chunk
+                        for table in tables
+                        for chunk in table[key].cast(key_type).chunks
+                    ],
+                    type=key_type,
+                ).combine_chunks()
+            )
+        self._encoders = [_KeyEncoder(column, max_codes) for column in columns]
+        composite = self._composite(columns)
+        # Dense codes index the positions directly. Sparse ones are first looked up in
+        # their sorted distinct values
+        self._codes: Optional[np.ndarray] = None
+        self._n_codes = math.prod(encoder.cardinality for encoder in self._encoders)
+        if self._n_codes > max_codes:
+            codes = np.sort(composite[composite >= 0])
+            self._codes = codes[np.r_[True, codes[1:] != codes[:-1]]]
+            self._n_codes = len(self._codes)
+
+        # The extra last slot is never written, so keys without a match find -1
+        self._positions = []
+        for table_codes in np.split(self._dense(composite), np.cumsum(lengths)[:-1]):
+            positions = np.full(self._n_codes + 1, -1, dtype=np.int64)
+            rows = np.flatnonzero(table_codes < self._n_codes)[::-1]
+            positions[table_codes[rows]] = rows
+            self._positions.append(positions)
+
+    def join(self, base: pa.Table) -> pa.Table:
+        """Left join every table onto `base`"""
+        dense = self._dense(
+            self._composite([base[key].combine_chunks() for key in self.keys])
+        )
+        columns = {name: base[name] for name in base.column_names}
+        for table, positions in zip(self.tables, self._positions):
+            indices = positions[dense]
+            take = pa.array(indices, mask=indices < 0)
+            for name in table.column_names:
+                if name not in self.keys:
+                    columns[name] = table[name].take(take)
+        return pa.table(columns)
+
+    def _dense(self, composite: np.ndarray) -> np.ndarray:
+        """Map composite codes to positions, with keys that don't occur in the tables
+        mapped to the extra last slot"""
+        if self._codes is None:
+            return np.where(composite < 0, self._n_codes, composite)
+        dense = np.searchsorted(self._codes, composite)
+        found = dense < self._n_codes
+        found[found] = self._codes[dense[found]] == composite[found]
+        return np.where(found & (composite >= 0), dense, self._n_codes)
+
+    def _composite(self, columns: list[pa.Array]) -> np.ndarray:
+        composite = np.zeros(len(columns[0]), dtype=np.int64)
+        for column, encoder in zip(columns, self._encoders):
+            codes = encoder.encode(column)
+            composite = np.where(
+                (composite < 0) | (codes < 0),
+                -1,
+                composite * encoder.cardinality + codes,
+            )
+        return composite
+
+
+class FeatureSource:
+    """
+    A lazily downloaded feature group table, shared by the features read from it
+
+    Parameters
+    ----------
+    download_batches:
+        Called with a batch size to stream the table from its storage backend
+    scan:
+        Called to scan the table lazily with Polars, if the backend supports it
+    latest_only:
+        Whether the table only holds the latest row per entity, because it was read
+        from a materialized snapshot without asking for it
+    history:
+        The full history of a latest-only table, which point-in-time joins read instead
+    """
+
+    def __init__(
+        self,
+        download_batches: Callable[[Optional[int]], Iterator[pa.RecordBatch]],
+        scan: Optional[Callable[[], pl.LazyFrame]] = None,
+        latest_only: bool = False,
+        history: Optional[FeatureSource] = None,
+    ):
+        self._download_batches = download_batches
+        self._scan = scan
+        self.latest_only = latest_only
+        self.history = history
+
+    @classmethod
+    def from_table(cls, table: pa.Table, **kwargs: Any) -> FeatureSource:
+        """A source for a table that has already been downloaded"""
+        source = cls(
+            lambda batch_size: iter(table.to_batches(max_chunksize=batch_size)),
+            **kwargs,
+        )
+        source.table = table
+        return source
+
+    @cached_property
+    def table(self) -> pa.Table:
+        return pa.Table.from_batches(list(self._download_batches(None)))
+
+    def iter_batches(
+        self, batch_size: Optional[int] = None
+    ) -> Iterator[pa.RecordBatch]:
+        if "table" in self.__dict__:
+            yield from self.table.to_batches(max_chunksize=batch_size)
+        else:
+            yield from self._download_batches(batch_size)
+
+    def scan_polars(self) -> pl.LazyFrame:
+        import polars as pl
+
+        if self._scan is not None and "table" not in self.__dict__:
+            return self._scan()
+        return pl.from_arrow(self.table).lazy()
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    A compacted copy of a feature group, holding the latest row per entity
+
+    Parameters
+    ----------
+    location:
+        Where the snapshot is stored. Passed to the backend
+    watermark:
+        The latest value of the datetime column included in the snapshot
+    """
+
+    location: str
+    watermark: Union[datetime.date, datetime.datetime]
 
 
 @dataclass(repr=False)
@@ -37,6 +392,7 @@ class FeatureGroup:
     description: str
     features: list[Feature] = field(default_factory=list)
     datetime_column: str = "date_time"
+    snapshot: Optional[Snapshot] = None
 
     def __repr__(self):
         return f"FeatureGroup(name={self.name}, location={self.location})"
@@ -57,27 +413,224 @@ class Feature:
     id_column: str
     datetime_column: str
     _data: pa.Table | None = field(init=False, default=None)
+    _source: FeatureSource | None = field(init=False, default=None, compare=False)
 
     def __repr__(self):
         return f"<Feature {self.name}>"
 
+    @property
+    def columns(self) -> list[str]:
+        return [self.id_column, self.datetime_column, self.name]
+
     def read_data(self, data: pa.Table) -> Self:
-        self._data = data.select([self.id_column, self.datetime_column, self.name])
+        self._data = data.select(self.columns)
+        self._source = None
+        return self
+
+    def read_source(self, source: FeatureSource) -> Self:
+        """Attach a source to download data from when it is first needed"""
+        self._data = None
+        self._source = source
         return self
 
     @property
     def data(self) -> pa.Table:
+        if self._data is None and self._source is not None:
+            self._data = self._source.table.select(self.columns)
         if self._data is None:
             raise MissingDataException(f"Feature {self.name} is missing data")
         return self._data
 
+    def scan_polars(self) -> pl.LazyFrame:
+        """Get the feature's data as a Polars LazyFrame, scanning its source if it has one"""
+        import polars as pl
+
+        if self._source is not None:
+            return self._source.scan_polars().select(self.columns)
+        return pl.from_arrow(self.data).lazy()
+
+    def iter_batches(
+        self, batch_size: Optional[int] = None, columns: Optional[list[str]] = None
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the feature's data, from its source if it has one
+
+        Parameters
+        ----------
+        batch_size
+            The maximum number of rows per batch
+        columns
+            The columns to include. Defaults to the id, datetime and feature columns
+        """
+        columns = columns or self.columns
+        if self._source is not None:
+            for batch in self._source.iter_batches(batch_size):
+                yield batch.select(columns)
+        else:
+            yield from self.data.select(columns).to_batches(max_chunksize=batch_size)
+
+
+def _with_history(feature: Feature) -> Feature:
+    """A copy of the feature reading its full history, if it only has the latest rows"""
+    source = feature._source
+    if source is None or not source.latest_only:
+        return feature
+    if source.history is None:
+        raise FeatureDataException(
+            f"Feature {feature.name} only holds the latest row per entity, read from a "
+            "materialized snapshot. Get it with latest=False to join it point-in-time"
+        )
+    return copy.copy(feature).read_source(source.history)
+
 
 @dataclass()
 class Dataset:
+    """
+    A collection of features joined on their id and datetime columns
+
+    Parameters
+    ----------
+    features:
+        The features to include in the dataset
+    point_in_time:
+        If True, join each feature as-of the spine - picking the latest value
+        at or before each spine timestamp - instead of on exact keys
+    spine:
+        The id and datetime rows to join features onto in point-in-time mode.
+        Defaults to the keys of the first feature
+    tolerance:
+        The maximum age of a feature value relative to the spine timestamp
+        in point-in-time mode. Older values are treated as missing
+    instrumentation:
+        Times reading, joining and converting the data. Set by the client
+    """
+
     features: list[Feature] = field(default_factory=list)
+    point_in_time: bool = False
+    spine: Optional[Union[pa.Table, pd.DataFrame]] = None
+    tolerance: Optional[datetime.timedelta] = None
+    instrumentation: Optional[Instrumentation] = field(
+        default=None, compare=False, repr=False
+    )
 
     def to_pandas(self) -> pd.DataFrame:
-        return self.data.to_pandas()
+        data = self.data
+        with self._span("to_pandas") as span:
+            span.rows, span.bytes = data.num_rows, data.nbytes
+            return data.to_pandas()
+
+    def to_polars(self, engine: Literal["arrow", "polars"] = "arrow") -> pl.DataFrame:
+        """Convert the dataset to a Polars DataFrame
+
+        Parameters
+        ----------
+        engine
+            "arrow" joins the features with Arrow and converts the result without
+            copying. "polars" runs `to_lazy_polars` on Polars' streaming engine
+        """
+        import polars as pl
+
+        if engine == "polars":
+            return self.to_lazy_polars().collect(engine="streaming")
+        return pl.from_arrow(self.data)
+
+    def to_lazy_polars(self) -> pl.LazyFrame:
+        """Build a Polars query joining the features, without reading any data
+
+        Features from lazily downloaded feature groups are scanned from their storage
+        where the backend supports it, so Polars can push column selections and filters
+        down into the scan. Point-in-time datasets are joined with Arrow first
+        """
+        import polars as pl
+
+        if self.point_in_time:
+            return pl.from_arrow(self.data).lazy()
+
+        keys = [self.id_column, self.datetime_column]
+        frames = []
+        for features in self._features_by_source():
+            columns = [*keys, *(feature.name for feature in features)]
+            source = features[0]._source
+            frame = (
+                source.scan_polars()
+                if source is not None
+                else pl.from_arrow(features[0].data).lazy()
+            )
+            frames.append(frame.select(columns))
+
+        def join_frames(left: pl.LazyFrame, right: pl.LazyFrame) -> pl.LazyFrame:
+            # Match the Arrow join, which uses the first row of duplicated keys
+            right = right.unique(subset=keys, keep="first", maintain_order=True)
+            return left.join(right, on=keys, how="left", maintain_order="left")
+
+        return reduce(join_frames, frames)
+
+    def iter_batches(self, batch_size: int = 65_536) -> Iterator[pa.RecordBatch]:
+        """Stream the joined dataset in batches of at most `batch_size` rows
+
+        The first feature is streamed from its storage backend, along with any other
+        features read from the same feature group. Features from other feature groups
+        are loaded and joined onto each batch, so memory is bounded by those feature
+        tables and the batch size rather than by the full joined dataset
+
+        Parameters
+        ----------
+        batch_size
+            The maximum number of rows per batch
+        """
+        if self.point_in_time:
+            yield from self._iter_as_of_batches(batch_size)
+            return
+
+        keys = [self.id_column, self.datetime_column]
+        streamed, *others = self._features_by_source()
+        lookups = [self._source_table(features) for features in others]
+
+        # The lookups' keys are indexed once, and each is joined onto the batch's own
+        # keys, so a key missing from one lookup doesn't drop the values of the others
+        index = _KeyIndex(lookups, keys) if lookups else None
+        columns = [*keys, *(feature.name for feature in streamed)]
+        for batch in streamed[0].iter_batches(batch_size, columns=columns):
+            table = pa.Table.from_batches([batch])
+            if index is not None:
+                table = index.join(table)
+            yield from table.to_batches(max_chunksize=batch_size)
+
+    def to_batch_reader(self, batch_size: int = 65_536) -> pa.RecordBatchReader:
+        """Export the dataset as a RecordBatchReader streaming `iter_batches`"""
+        batches = self.iter_batches(batch_size)
+        first_batch = next(batches, None)
+        if first_batch is None:
+            return pa.RecordBatchReader.from_batches(self.data.schema, [])
+        return pa.RecordBatchReader.from_batches(
+            first_batch.schema, itertools.chain([first_batch], batches)
+        )
+
+    def as_of(
+        self,
+        spine: Optional[Union[pa.Table, pd.DataFrame]] = None,
+        tolerance: Optional[datetime.timedelta] = None,
+    ) -> Dataset:
+        """Return a copy of the dataset which joins features point-in-time
+
+        Parameters
+        ----------
+        spine
+            The id and datetime rows to look up feature values for
+        tolerance
+            The maximum age of a feature value relative to the spine timestamp
+
+        Raises
+        ------
+        FeatureDataException
+            If a feature was read from a snapshot and its full history isn't available
+        """
+        return dataclasses.replace(
+            self,
+            features=[_with_history(feature) for feature in self.features],
+            point_in_time=True,
+            spine=spine,
+            tolerance=tolerance,
+        )
 
     @property
     def has_data(self) -> bool:
@@ -99,18 +652,104 @@ class Dataset:
             )
         return next(iter(datetime_col))
 
+    def _features_by_source(self) -> list[list[Feature]]:
+        """Group features that read from the same source, in order of first appearance"""
+        groups: dict[int, list[Feature]] = {}
+        for feature in self.features:
+            groups.setdefault(id(feature._source or feature), []).append(feature)
+        return list(groups.values())
+
+    def _source_table(self, features: list[Feature]) -> pa.Table:
+        """The keys and columns of features sharing a source, taken without joining"""
+        if len(features) == 1:
+            return features[0].data
+        columns = [self.id_column, self.datetime_column]
+        columns.extend(feature.name for feature in features)
+        return features[0]._source.table.select(columns)
+
+    def _span(self, stage: str) -> ContextManager[Span]:
+        if self.instrumentation is None:
+            return contextlib.nullcontext(Span(stage))
+        return self.instrumentation.span(stage)
+
     @cached_property
     def data(self) -> pa.Table:
-        if len(self.features) == 1:
-            return self.features[0].data
+        if self.point_in_time:
+            spine = self._get_spine()
+            with self._span("read_data"):
+                lookups = self._as_of_lookups(
+                    spine.schema.field(self.datetime_column).type
+                )
+            with self._span("join") as span:
+                table = self._join_as_of(spine, lookups)
+                span.rows, span.bytes = table.num_rows, table.nbytes
+            return table
+
+        with self._span("read_data") as span:
+            tables = [self._source_table(f) for f in self._features_by_source()]
+            span.rows = sum(table.num_rows for table in tables)
+            span.bytes = sum(table.nbytes for table in tables)
+        if len(tables) == 1:
+            return tables[0]
+        with self._span("join") as span:
+            table = _multi_join(tables, keys=[self.id_column, self.datetime_column])
+            span.rows, span.bytes = table.num_rows, table.nbytes
+        return table
+
+    def _get_spine(self) -> pa.Table:
+        if self.spine is None:
+            return self.features[0].data.select([self.id_column, self.datetime_column])
+        if isinstance(self.spine, pa.Table):
+            return self.spine
+        return pa.Table.from_pandas(self.spine, preserve_index=False)
+
+    def _as_of_lookups(self, datetime_type: pa.DataType) -> list[pa.Table]:
+        """Feature tables sorted and cast to the spine's datetime type, ready for join_asof
+
+        Features sharing a source are looked up together, in a single join
+        """
+        datetime_column = self.datetime_column
+        lookups = []
+        for features in self._features_by_source():
+            feature_data = self._source_table(features)
+            if feature_data.schema.field(datetime_column).type != datetime_type:
+                feature_data = feature_data.set_column(
+                    feature_data.schema.get_field_index(datetime_column),
+                    datetime_column,
+                    feature_data[datetime_column].cast(datetime_type),
+                )
+            lookups.append(feature_data.sort_by(datetime_column))
+        return lookups
+
+    def _join_as_of(self, spine: pa.Table, lookups: list[pa.Table]) -> pa.Table:
+        datetime_column = self.datetime_column
+        tolerance = _tolerance_to_int(
+            self.tolerance, spine.schema.field(datetime_column).type
+        )
+
+        def join_feature(table: pa.Table, lookup: pa.Table) -> pa.Table:
+            return table.join_asof(
+                lookup, on=datetime_column, by=self.id_column, tolerance=tolerance
+            )
+
+        return reduce(join_feature, lookups, spine.sort_by(datetime_column))
 
-        def join_features(table: pa.Table, feature_b: Feature) -> pa.Table:
-            return table.join(
-                feature_b.data, keys=[feature_b.id_column, feature_b.datetime_column]
+    def _iter_as_of_batches(self, batch_size: int) -> Iterator[pa.RecordBatch]:
+        if self.spine is None:
+            spine_batches = self.features[0].iter_batches(
+                batch_size, columns=[self.id_column, self.datetime_column]
             )
+        else:
+            spine_batches = self._get_spine().to_batches(max_chunksize=batch_size)
 
-        initial_table = self.features[0].data
-        return reduce(join_features, self.features[1:], initial_table)
+        lookups = None
+        for batch in spine_batches:
+            if lookups is None:
+                lookups = self._as_of_lookups(
+                    batch.schema.field(self.datetime_column).type
+                )
+            table = self._join_as_of(pa.Table.from_batches([batch]), lookups)
+            yield from table.to_batches(max_chunksize=batch_size)
 
     def __add__(self, other: Union[Dataset, Feature]):
         if not isinstance(other, (Dataset, Feature)):
@@ -129,6 +768,8 @@ class Dataset:
             )
         match other:
             case Dataset():
-                return Dataset(features=[*self.features, *other.features])
+                return dataclasses.replace(
+                    self, features=[*self.features, *other.features]
+                )
             case Feature():
-                return Dataset(features=[*self.features, other])
+                return dataclasses.replace(self, features=[*self.features, other])
@@ -1,5 +1,40 @@
-from feature_store.feature_storage.base import FeatureStorage
-from feature_store.feature_storage.parquet import ParquetFeatureStorage
-from feature_store.feature_storage.sql import SQLAlchemyFeatureStorage
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["FeatureStorage", "ParquetFeatureStorage", "SQLAlchemyFeatureStorage"]
+from feature_store.feature_storage.base import (
+    AsyncFeatureStorage,
+    FeatureStorage,
+    ThreadedFeatureStorage,
+)
+
+if TYPE_CHECKING:
+    from feature_store.feature_storage.arrow_ipc import ArrowIPCFeatureStorage
+    from feature_store.feature_storage.fsspec_parquet import FsspecParquetFeatureStorage
+    from feature_store.feature_storage.parquet import ParquetFeatureStorage
+    from feature_store.feature_storage.sql import SQLAlchemyFeatureStorage
+
+# Backends are imported on first access, so importing the package doesn't pull in
+# the dependencies of every backend
+_BACKENDS = {
+    "ArrowIPCFeatureStorage": "feature_store.feature_storage.arrow_ipc",
+    "FsspecParquetFeatureStorage": "feature_store.feature_storage.fsspec_parquet",
+    "ParquetFeatureStorage": "feature_store.feature_storage.parquet",
+    "SQLAlchemyFeatureStorage": "feature_store.feature_storage.sql",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _BACKENDS:
+        return getattr(importlib.import_module(_BACKENDS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "ArrowIPCFeatureStorage",
+    "AsyncFeatureStorage",
+    "FeatureStorage",
+    "FsspecParquetFeatureStorage",
+    "ParquetFeatureStorage",
+    "SQLAlchemyFeatureStorage",
+    "ThreadedFeatureStorage",
+]
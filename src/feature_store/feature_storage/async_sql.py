@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Optional
+
+import pandas as pd
+import pyarrow as pa
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from feature_store.feature_storage.sql import (
+    _build_query,
+    _cache_table,
+    _extract_table_parts,
+    _first_value_queries,
+    _get_cached_table,
+    _infer_type,
+    _new_table,
+    _pool_options,
+    _rows_to_batch,
+    _to_arrow_type,
+    invalidate_table_cache,
+)
+
+if TYPE_CHECKING:
+    from feature_store.feature import FeatureGroup
+
+# Async connections are bound to the event loop that opened them, so engines are shared per loop
+_ASYNC_ENGINES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    dict[tuple[str, tuple[tuple[str, int], ...]], AsyncEngine],
+] = weakref.WeakKeyDictionary()
+_ASYNC_ENGINES_LOCK = threading.Lock()
+
+
+def get_async_engine(db_url: str, **pool_options: int) -> AsyncEngine:
+    """Get the async engine for a database url shared within the running event loop
+
+    The url must use an async driver, such as sqlite+aiosqlite or postgresql+asyncpg
+    """
+    key = (db_url, tuple(sorted(pool_options.items())))
+    with _ASYNC_ENGINES_LOCK:
+        engines = _ASYNC_ENGINES.setdefault(asyncio.get_running_loop(), {})
+        if key not in engines:
+            engines[key] = create_async_engine(db_url, **pool_options)
+        return engines[key]
+
+
+async def dispose_async_engines() -> None:
+    """Close all pooled connections and forget the async engines of the running loop"""
+    with _ASYNC_ENGINES_LOCK:
+        engines = _ASYNC_ENGINES.pop(asyncio.get_running_loop(), {})
+    for engine in engines.values():
+        await engine.dispose()
+
+
+class AsyncSQLAlchemyFeatureStorage:
+    """
+    Async counterpart of SQLAlchemyFeatureStorage, built on SQLAlchemy's async engine
+
+    Takes the same configuration, so a source can be shared by Client and AsyncClient.
+    If `async_db_url` is set it is used instead of `db_url`, which lets the source
+    name a sync and an async driver for the same database. Sources with neither an
+    `async_db_url` nor an async driver in `db_url` are run in a thread by FileAuth
+    """
+
+    type = "sqlalchemy"
+
+    def __init__(
+        self,
+        db_url: str,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        batch_size: int = 10_000,
+        table_cache_ttl: Optional[float] = 300,
+        async_db_url: Optional[str] = None,
+    ):
+        self.db_url = async_db_url or db_url
+        self.batch_size = batch_size
+        self.table_cache_ttl = table_cache_ttl
+        self.pool_options = _pool_options(pool_size, max_overflow)
+
+    @classmethod
+    def supports(cls, config: dict[str, Any]) -> bool:
+        """Whether a source config names an async driver, which the async engine needs"""
+        if "async_db_url" in config:
+            return True
+        return sa.engine.make_url(config["db_url"]).get_dialect().is_async
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return get_async_engine(self.db_url, **self.pool_options)
+
+    async def upload_data(self, df: pd.DataFrame, feature: FeatureGroup) -> pa.Table:
+        data = pa.Table.from_pandas(df)
+        to_insert = data.select([str(column) for column in df.columns])
+        new_table = _new_table(feature.location, to_insert.schema)
+
+        async with self.engine.begin() as conn:
+            await conn.run_sync(new_table.create, checkfirst=True)
+        table = await self.get_table(feature.location)
+
+        async with self.engine.begin() as conn:
+            for batch in to_insert.to_batches(max_chunksize=self.batch_size):
+                await conn.execute(table.insert(), batch.to_pylist())
+        return data
+
+    async def download_data(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pa.Table:
+        batches = self.download_batches(
+            feature, columns=columns, start=start, end=end, entity_ids=entity_ids
+        )
+        return pa.Table.from_batches([batch async for batch in batches])
+
+    async def download_batches(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Stream the feature group as RecordBatches of at most `batch_size` rows, typing
+        columns without a declared type from their first non-null value"""
+        table = await self.get_table(feature.location)
+        sql = _build_query(
+            table, feature, columns=columns, start=start, end=end, entity_ids=entity_ids
+        )
+        names = [column.name for column in sql.selected_columns]
+        types = [_to_arrow_type(column.type) for column in sql.selected_columns]
+
+        async with self.engine.connect() as conn:
+            for i, query in _first_value_queries(sql, types).items():
+                types[i] = _infer_type((await conn.execute(query)).scalar())
+            result = await conn.stream(
+                sql, execution_options={"yield_per": batch_size or self.batch_size}
+            )
+            is_empty = True
+            async for rows in result.partitions():
+                is_empty = False
+                yield _rows_to_batch(rows, names, types)
+
+            if is_empty:
+                yield _rows_to_batch([], names, types)
+
+    async def get_table(self, location: str) -> sa.Table:
+        """Get the reflected table for a location, sharing the reflection cache"""
+        schema, table_name = _extract_table_parts(location)
+        key = (self.db_url, schema, table_name)
+        cached = _get_cached_table(key)
+        if cached is not None:
+            return cached
+
+        def reflect(conn: Connection) -> sa.Table:
+            return sa.Table(
+                table_name, sa.MetaData(), schema=schema, autoload_with=conn
+            )
+
+        async with self.engine.connect() as conn:
+            table = await conn.run_sync(reflect)
+        _cache_table(key, table, self.table_cache_ttl)
+        return table
+
+    def invalidate(self, location: Optional[str] = None) -> None:
+        """Forget cached reflections for this database, or only for a single location"""
+        if location is None:
+            invalidate_table_cache(self.db_url)
+        else:
+            schema, table = _extract_table_parts(location)
+            invalidate_table_cache(self.db_url, schema, table)
@@ -1,17 +1,86 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Protocol
+import asyncio
+import datetime
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Iterator, Optional, Protocol
 
-import pandas as pd
 import pyarrow as pa
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from feature_store.feature import FeatureGroup
 
 
 class FeatureStorage(Protocol):
     type: ClassVar[str]
 
-    def download_data(self, feature: FeatureGroup) -> pa.Table: ...
+    def download_data(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pa.Table: ...
+
+    def download_batches(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]: ...
 
     def upload_data(self, df: pd.DataFrame, feature: FeatureGroup) -> pa.Table: ...
+
+    def delete_data(self, feature: FeatureGroup) -> None:
+        """Delete all stored data of the feature group, if there is any"""
+        ...
+
+
+class AsyncFeatureStorage(Protocol):
+    type: ClassVar[str]
+
+    async def download_data(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pa.Table: ...
+
+    async def upload_data(
+        self, df: pd.DataFrame, feature: FeatureGroup
+    ) -> pa.Table: ...
+
+
+class ThreadedFeatureStorage:
+    """Adapts a synchronous FeatureStorage to the async protocol by running it in a thread"""
+
+    def __init__(self, storage: FeatureStorage):
+        self.storage = storage
+        self.type = storage.type
+
+    async def download_data(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pa.Table:
+        return await asyncio.to_thread(
+            self.storage.download_data,
+            feature,
+            columns=columns,
+            start=start,
+            end=end,
+            entity_ids=entity_ids,
+        )
+
+    async def upload_data(self, df: pd.DataFrame, feature: FeatureGroup) -> pa.Table:
+        return await asyncio.to_thread(self.storage.upload_data, df, feature)
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import datetime
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import uuid
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
+
+import pyarrow as pa
+
+from feature_store.feature_storage.base import FeatureStorage
+from feature_store.stats import CacheStats
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from feature_store.feature import FeatureGroup
+
+
+def _read_ipc(path: pathlib.Path) -> pa.Table:
+    """Read an Arrow IPC file memory-mapped, so the table isn't copied into memory"""
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def _write_ipc(path: pathlib.Path, table: pa.Table) -> None:
+    """Write an Arrow IPC file atomically, so readers never see a partial file"""
+    tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def _tee_ipc(
+    path: pathlib.Path, batches: Iterator[pa.RecordBatch]
+) -> Iterator[pa.RecordBatch]:
+    """Yield the batches while writing them to an Arrow IPC file, which is moved into
+    place only once every batch is written, so a stream that fails or is closed early
+    leaves no file behind"""
+    tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    try:
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            writer = None
+            for batch in batches:
+                if writer is None:
+                    writer = pa.ipc.new_file(sink, batch.schema)
+                writer.write_batch(batch)
+                yield batch
+            if writer is None:
+                return
+            writer.close()
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class CachedFeatureStorage:
+    """
+    Wraps a FeatureStorage, keeping downloaded tables as Arrow IPC files on local disk
+
+    Entries are keyed on the request and the wrapped storage's `fingerprint`, a cheap
+    check of whether the stored data has changed. Storages without a fingerprint are
+    never cached. When the cache grows past `max_bytes`, the least recently used
+    files are deleted
+
+    Parameters
+    ----------
+    storage:
+        The storage to read through to
+    path:
+        The directory to keep cached tables in
+    max_bytes:
+        The maximum total size of the cached files
+    namespace:
+        Distinguishes storages that could otherwise produce the same keys, such as two
+        sources with the same location names
+    """
+
+    def __init__(
+        self,
+        storage: FeatureStorage,
+        path: Union[str, pathlib.Path],
+        max_bytes: int = 1024**3,
+        namespace: str = "",
+    ):
+        self.storage = storage
+        self.type = storage.type
+        self.path = pathlib.Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self.stats = CacheStats()
+
+    def download_data(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pa.Table:
+        if entity_ids is not None:
+            entity_ids = list(entity_ids)
+
+        cache_file = self._cache_file(feature, columns, start, end, entity_ids)
+        if cache_file is None:
+            return self.storage.download_data(
+                feature, columns=columns, start=start, end=end, entity_ids=entity_ids
+            )
+
+        try:
+            table = _read_ipc(cache_file)
+        except FileNotFoundError:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+            cache_file.touch()
+            return table
+
+        table = self.storage.download_data(
+            feature, columns=columns, start=start, end=end, entity_ids=entity_ids
+        )
+        self.path.mkdir(parents=True, exist_ok=True)
+        _write_ipc(cache_file, table)
+        self._evict()
+        return table
+
+    def download_batches(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream from the cache if the request is cached, otherwise from the storage,
+        caching the streamed batches once the stream is read to the end"""
+        if entity_ids is not None:
+            entity_ids = list(entity_ids)
+
+        batches = functools.partial(
+            self.storage.download_batches,
+            feature,
+            columns=columns,
+            start=start,
+            end=end,
+            entity_ids=entity_ids,
+            batch_size=batch_size,
+        )
+        cache_file = self._cache_file(feature, columns, start, end, entity_ids)
+        if cache_file is None:
+            yield from batches()
+            return
+
+        try:
+            table = _read_ipc(cache_file)
+        except FileNotFoundError:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+            cache_file.touch()
+            yield from table.to_batches(max_chunksize=batch_size)
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        yield from _tee_ipc(cache_file, batches())
+        self._evict()
+
+    def upload_data(self, df: pd.DataFrame, feature: FeatureGroup) -> pa.Table:
+        return self.storage.upload_data(df, feature)
+
+    def delete_data(self, feature: FeatureGroup) -> None:
+        self.storage.delete_data(feature)
+
+    def clear(self) -> None:
+        """Delete every cached table"""
+        for cache_file in self.path.glob("*.arrow"):
+            cache_file.unlink(missing_ok=True)
+
+    def _cache_file(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]],
+        start: Optional[datetime.date],
+        end: Optional[datetime.date],
+        entity_ids: Optional[list[Any]],
+    ) -> Optional[pathlib.Path]:
+        fingerprint = getattr(self.storage, "fingerprint", None)
+        if fingerprint is None:
+            return None
+
+        key = json.dumps(
+            [
+                self.namespace,
+                self.type,
+                feature.location,
+                columns,
+                start,
+                end,
+                entity_ids,
+                fingerprint(feature),
+            ],
+            default=str,
+        )
+        return self.path.joinpath(f"{hashlib.sha256(key.encode()).hexdigest()}.arrow")
+
+    def _evict(self) -> None:
+        """Delete the least recently used files until the cache fits in max_bytes"""
+        entries = []
+        for cache_file in self.path.glob("*.arrow"):
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, cache_file))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, cache_file in sorted(entries, key=lambda entry: entry[0]):
+            if total_bytes <= self.max_bytes:
+                break
+            cache_file.unlink(missing_ok=True)
+            total_bytes -= size
+            self.stats.evictions += 1
@@ -0,0 +1,74 @@
+"""
+Storage backends are found by their type through entry points, so a location only
+imports the backend it names, and other packages can add backends by registering an
+entry point in the `feature_store.storage` or `feature_store.async_storage` group
+"""
+
+from __future__ import annotations
+
+import functools
+from importlib.metadata import EntryPoint, entry_points
+from typing import TYPE_CHECKING, Optional, Type
+
+from feature_store.exceptions import FeatureStoreException
+
+if TYPE_CHECKING:
+    from feature_store.feature_storage.base import AsyncFeatureStorage, FeatureStorage
+
+STORAGE_GROUP = "feature_store.storage"
+ASYNC_STORAGE_GROUP = "feature_store.async_storage"
+
+# The entry points of this package, for when it runs without installed metadata
+_BUILTIN_ENTRY_POINTS = {
+    STORAGE_GROUP: {
+        "parquet": "feature_store.feature_storage.parquet:ParquetFeatureStorage",
+        "sqlalchemy": "feature_store.feature_storage.sql:SQLAlchemyFeatureStorage",
+        "arrow_ipc": "feature_store.feature_storage.arrow_ipc:ArrowIPCFeatureStorage",
+        "fsspec_parquet": (
+            "feature_store.feature_storage.fsspec_parquet:FsspecParquetFeatureStorage"
+        ),
+    },
+    ASYNC_STORAGE_GROUP: {
+        "sqlalchemy": (
+            "feature_store.feature_storage.async_sql:AsyncSQLAlchemyFeatureStorage"
+        ),
+    },
+}
+
+
+@functools.cache
+def _entry_points(group: str) -> dict[str, EntryPoint]:
+    found = {
+        name: EntryPoint(name=name, value=value, group=group)
+        for name, value in _BUILTIN_ENTRY_POINTS[group].items()
+    }
+    found.update(
+        {entry_point.name: entry_point for entry_point in entry_points(group=group)}
+    )
+    return found
+
+
+def available_store_types() -> list[str]:
+    """The store types that can be used in a source config"""
+    return sorted(_entry_points(STORAGE_GROUP))
+
+
+@functools.cache
+def get_store_class(store_type: str) -> Type[FeatureStorage]:
+    """Import the storage backend registered for a store type"""
+    backends = _entry_points(STORAGE_GROUP)
+    if store_type not in backends:
+        raise FeatureStoreException(
+            f"Unknown store type: {store_type}. "
+            f"Available types are {', '.join(available_store_types())}"
+        )
+    return backends[store_type].load()
+
+
+@functools.cache
+def get_async_store_class(store_type: str) -> Optional[Type[AsyncFeatureStorage]]:
+    """Import the native async backend for a store type, if it has one"""
+    backends = _entry_points(ASYNC_STORAGE_GROUP)
+    if store_type not in backends:
+        return None
+    return backends[store_type].load()
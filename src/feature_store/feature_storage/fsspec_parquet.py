@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import bisect
+import collections
+import datetime
+import io
+import struct
+import threading
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+import fsspec
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
+
+from feature_store.feature_storage.parquet import (
+    ParquetFeatureStorage,
+    _as_date,
+    _build_filter,
+    _build_polars_filter,
+    _partition_column,
+)
+from feature_store.stats import CacheStats
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from feature_store.feature import FeatureGroup
+
+_FOOTER_SIZE = 8
+_MAGIC = b"PAR1"
+
+
+def _coalesce_ranges(
+    ranges: list[tuple[int, int]], hole_size_limit: int, range_size_limit: int
+) -> list[tuple[int, int]]:
+    """Merge (start, end) byte ranges that are at most `hole_size_limit` apart, as long as
+    the merged range stays under `range_size_limit`"""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged:
+            last_start, last_end = merged[-1]
+            if (
+                start - last_end <= hole_size_limit
+                and max(end, last_end) - last_start <= range_size_limit
+            ):
+                merged[-1] = (last_start, max(end, last_end))
+                continue
+        merged.append((start, end))
+    return merged
+
+
+class _RangeFile(io.RawIOBase):
+    """A read-only file served from prefetched byte ranges, fetching any other read"""
+
+    def __init__(
+        self,
+        fs: fsspec.AbstractFileSystem,
+        path: str,
+        size: int,
+        ranges: list[tuple[int, int]],
+        buffers: list[bytes],
+    ):
+        self._fs = fs
+        self._path = path
+        self._size = size
+        self._starts = [start for start, _ in ranges]
+        self._ranges = list(zip(ranges, buffers))
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = offset
+        return offset
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._position
+        end = self._size if size < 0 else min(start + size, self._size)
+        self._position = end
+        index = bisect.bisect_right(self._starts, start) - 1
+        if index >= 0:
+            (range_start, range_end), buffer = self._ranges[index]
+            if end <= range_end:
+                offset, stop = start - range_start, end - range_start
+                return buffer[offset:stop]
+        return self._fs.cat_file(self._path, start=start, end=end)
+
+
+@dataclass(frozen=True)
+class _ParquetPart:
+    path: str
+    size: int
+    version: Any
+    partition_value: Optional[str] = None
+
+
+class FsspecParquetFeatureStorage(ParquetFeatureStorage):
+    """
+    Stores feature groups in the Parquet layout of `ParquetFeatureStorage` on any fsspec
+    filesystem, reading them with as few requests as possible
+
+    Files of a dataset are read concurrently. Each file's footer is fetched with one
+    request for its last `footer_read_size` bytes and cached, and the column chunks a
+    read needs are fetched with one `cat_ranges` call, merging chunks that are close
+    together into a single range
+
+    Parameters
+    ----------
+    uri:
+        The fsspec url of the directory the datasets are stored in, e.g. "s3://bucket/x"
+    storage_options:
+        Passed to the fsspec filesystem, e.g. credentials
+    max_workers:
+        The number of files to read concurrently
+    footer_read_size:
+        The number of bytes to fetch from the end of a file to get its footer
+    footer_cache_size:
+        The number of file footers to keep
+    hole_size_limit:
+        Column chunks less than this many bytes apart are fetched as one range
+    range_size_limit:
+        The largest range chunks are merged into
+    """
+
+    type = "fsspec_parquet"
+
+    def __init__(
+        self,
+        uri: str,
+        storage_options: Optional[dict[str, Any]] = None,
+        max_workers: int = 8,
+        footer_read_size: int = 64 * 1024,
+        footer_cache_size: int = 1024,
+        hole_size_limit: int = 8 * 1024,
+        range_size_limit: int = 32 * 1024 * 1024,
+    ):
+        super().__init__(uri)
+        self.fs, self.root = fsspec.core.url_to_fs(uri, **(storage_options or {}))
+        self.max_workers = max_workers
+        self.footer_read_size = footer_read_size
+        self.footer_cache_size = footer_cache_size
+        self.hole_size_limit = hole_size_limit
+        self.range_size_limit = range_size_limit
+        self.footer_stats = CacheStats()
+        self._footers: OrderedDict[tuple, pq.FileMetaData] = OrderedDict()
+        self._footers_lock = threading.Lock()
+
+    def download_data(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pa.Table:
+        if entity_ids is not None:
+            entity_ids = list(entity_ids)
+        schema, parts = self._list_parts(feature, start=start, end=end)
+        if columns is not None:
+            schema = pa.schema([schema.field(column) for column in columns])
+        filters = _build_filter(feature, start=start, end=end, entity_ids=entity_ids)
+
+        def read(part: _ParquetPart) -> pa.Table:
+            return self._read_part(feature, part, schema, filters, entity_ids)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            tables = list(executor.map(read, parts))
+        return pa.concat_tables(tables) if tables else schema.empty_table()
+
+    def download_batches(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the feature group as RecordBatches of at most `batch_size` rows,
+        reading at most `max_workers` files ahead"""
+        if entity_ids is not None:
+            entity_ids = list(entity_ids)
+        schema, parts = self._list_parts(feature, start=start, end=end)
+        if columns is not None:
+            schema = pa.schema([schema.field(column) for column in columns])
+        filters = _build_filter(feature, start=start, end=end, entity_ids=entity_ids)
+
+        def read(part: _ParquetPart) -> pa.Table:
+            return self._read_part(feature, part, schema, filters, entity_ids)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: collections.deque[Future[pa.Table]] = collections.deque()
+            for part in parts:
+                pending.append(executor.submit(read, part))
+                if len(pending) > self.max_workers:
+                    table = pending.popleft().result()
+                    yield from table.to_batches(max_chunksize=batch_size or 131_072)
+            while pending:
+                table = pending.popleft().result()
+                yield from table.to_batches(max_chunksize=batch_size or 131_072)
+
+    def scan_polars(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pl.LazyFrame:
+        """Scan the feature group lazily with Polars, through a pyarrow dataset on the
+        fsspec filesystem"""
+        import polars as pl
+
+        dataset = self._get_dataset(feature)
+        partition_column = _partition_column(feature)
+        frame = pl.scan_pyarrow_dataset(dataset)
+        filters = _build_polars_filter(
+            feature,
+            start=start,
+            end=end,
+            entity_ids=entity_ids,
+            partition_column=(
+                partition_column if partition_column in dataset.schema.names else None
+            ),
+        )
+        if filters is not None:
+            frame = frame.filter(filters)
+        return frame.select(columns or self._data_columns(feature, dataset))
+
+    def _list_parts(
+        self,
+        feature: FeatureGroup,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> tuple[pa.Schema, list[_ParquetPart]]:
+        """The dataset schema, and the files of the partitions within the time range"""
+        _, path = self._get_path(feature)
+        if self.fs.isfile(path):
+            info = self.fs.info(path)
+            part = _ParquetPart(path, info["size"], _version(info))
+            return self._footer(part).schema.to_arrow_schema(), [part]
+
+        with self.fs.open(f"{path}/_common_metadata", "rb") as f:
+            schema = pq.read_schema(f)
+        prefix = f"{urllib.parse.quote(_partition_column(feature))}="
+        parts = []
+        for file, info in sorted(self.fs.find(path, detail=True).items()):
+            partition, _, name = file.removeprefix(path).strip("/").rpartition("/")
+            if not name.endswith(".parquet") or not partition.startswith(prefix):
+                continue
+            value = urllib.parse.unquote(partition.removeprefix(prefix))
+            parts.append(_ParquetPart(file, info["size"], _version(info), value))
+
+        if parts and (start is not None or end is not None):
+            dates = pa.array([part.partition_value for part in parts]).cast(pa.date32())
+            keep = pa.array([True] * len(parts))
+            if start is not None:
+                keep = pc.and_(keep, pc.greater_equal(dates, _as_date(start)))
+            if end is not None:
+                keep = pc.and_(keep, pc.less_equal(dates, _as_date(end)))
+            parts = [part for part, kept in zip(parts, keep.to_pylist()) if kept]
+        return schema, parts
+
+    def _footer(self, part: _ParquetPart) -> pq.FileMetaData:
+        """Get the metadata of a file, fetching its tail on a cache miss"""
+        key = (part.path, part.size, part.version)
+        with self._footers_lock:
+            if key in self._footers:
+                self._footers.move_to_end(key)
+                self.footer_stats.hits += 1
+                return self._footers[key]
+            self.footer_stats.misses += 1
+
+        tail_start = max(part.size - self.footer_read_size, 0)
+        tail = self.fs.cat_file(part.path, start=tail_start, end=part.size)
+        metadata_length, magic = struct.unpack("<I4s", tail[-_FOOTER_SIZE:])
+        if magic != _MAGIC:
+            raise OSError(f"{part.path} is not a Parquet file")
+        footer_start = part.size - metadata_length - _FOOTER_SIZE
+        if footer_start < tail_start:
+            tail = (
+                self.fs.cat_file(part.path, start=footer_start, end=tail_start) + tail
+            )
+        metadata = pq.read_metadata(pa.BufferReader(tail))
+
+        with self._footers_lock:
+            self._footers[key] = metadata
+            while len(self._footers) > self.footer_cache_size:
+                self._footers.popitem(last=False)
+                self.footer_stats.evictions += 1
+        return metadata
+
+    def _read_part(
+        self,
+        feature: FeatureGroup,
+        part: _ParquetPart,
+        schema: pa.Schema,
+        filters: Optional[pc.Expression],
+        entity_ids: Optional[list[Any]],
+    ) -> pa.Table:
+        """Read the columns of a file that are in the schema, prefetching its column
+        chunks in coalesced ranges"""
+        metadata = self._footer(part)
+        file_columns = [
+            name
+            for name in schema.names
+            if name in metadata.schema.to_arrow_schema().names
+        ]
+        row_groups = [
+            i
+            for i in range(metadata.num_row_groups)
+            if _may_contain(metadata.row_group(i), feature.id_column, entity_ids)
+        ]
+
+        chunks = []
+        for i in row_groups:
+            row_group = metadata.row_group(i)
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                if column.path_in_schema.split(".")[0] not in file_columns:
+                    continue
+                start = column.data_page_offset
+                if column.has_dictionary_page and column.dictionary_page_offset > 0:
+                    start = min(start, column.dictionary_page_offset)
+                chunks.append((start, start + column.total_compressed_size))
+        ranges = _coalesce_ranges(chunks, self.hole_size_limit, self.range_size_limit)
+        buffers = (
+            self.fs.cat_ranges(
+                [part.path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            )
+            if ranges
+            else []
+        )
+
+        source = pa.PythonFile(
+            _RangeFile(self.fs, part.path, part.size, ranges, buffers), mode="r"
+        )
+        table = pq.ParquetFile(
+            source, metadata=metadata, pre_buffer=False
+        ).read_row_groups(row_groups, columns=file_columns, use_threads=False)
+        for name in schema.names:
+            if name not in file_columns:
+                column = pa.nulls(table.num_rows, schema.field(name).type)
+                table = table.append_column(name, column)
+
+        table = table.select(schema.names).cast(schema)
+        return table.filter(filters) if filters is not None else table
+
+    def _get_path(self, feature: FeatureGroup) -> tuple[pa_fs.FileSystem, str]:
+        _, _, filename = feature.location.partition("::")
+        filesystem = pa_fs.PyFileSystem(pa_fs.FSSpecHandler(self.fs))
+        return filesystem, f"{self.root.rstrip('/')}/{filename}"
+
+
+def _version(info: dict[str, Any]) -> Any:
+    """The field of an fsspec file info that changes when the file is rewritten"""
+    for key in ["ETag", "etag", "mtime", "LastModified", "last_modified", "created"]:
+        if key in info:
+            return str(info[key])
+    return None
+
+
+def _may_contain(
+    row_group: pq.RowGroupMetaData, id_column: str, entity_ids: Optional[list[Any]]
+) -> bool:
+    """Whether the row group's id statistics overlap the range of requested ids"""
+    if not entity_ids:
+        return entity_ids is None
+    for j in range(row_group.num_columns):
+        column = row_group.column(j)
+        if column.path_in_schema != id_column:
+            continue
+        statistics = column.statistics
+        if statistics is None or not statistics.has_min_max:
+            return True
+        try:
+            return (
+                min(entity_ids) <= statistics.max and max(entity_ids) >= statistics.min
+            )
+        except TypeError:
+            return True
+    return True
@@ -1,31 +1,322 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import datetime
+import functools
+import operator
+import os
+import uuid
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pa_fs
 import pyarrow.parquet as pq
 
 if TYPE_CHECKING:
+    import polars as pl
+
     from feature_store.feature import FeatureGroup
 
 
+def _resolve_uri(uri: str) -> tuple[pa_fs.FileSystem, str]:
+    """The filesystem and path of a uri, where a uri without a scheme is a local path,
+    relative to the working directory"""
+    if "://" not in uri:
+        return pa_fs.LocalFileSystem(), os.path.abspath(uri)
+    return pa_fs.FileSystem.from_uri(uri)
+
+
+def _partition_column(feature: FeatureGroup) -> str:
+    """The hive partition column of a dataset, holding the date of each row's datetime"""
+    return f"{feature.datetime_column}__date"
+
+
+def _as_date(value: datetime.date) -> datetime.date:
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+
+def _build_filter(
+    feature: FeatureGroup,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    entity_ids: Optional[Iterable[Any]] = None,
+    partition_column: Optional[str] = None,
+) -> Optional[pc.Expression]:
+    """Build a dataset filter expression, letting pyarrow prune row groups by statistics
+
+    If `partition_column` is given, the time range is also applied to the dates in it, so
+    whole partitions outside the range are skipped
+    """
+    expressions = []
+    if start is not None:
+        expressions.append(pc.field(feature.datetime_column) >= start)
+        if partition_column is not None:
+            expressions.append(pc.field(partition_column) >= _as_date(start))
+    if end is not None:
+        expressions.append(pc.field(feature.datetime_column) <= end)
+        if partition_column is not None:
+            expressions.append(pc.field(partition_column) <= _as_date(end))
+    if entity_ids is not None:
+        expressions.append(pc.field(feature.id_column).isin(list(entity_ids)))
+
+    if not expressions:
+        return None
+    return functools.reduce(operator.and_, expressions)
+
+
+def _build_polars_filter(
+    feature: FeatureGroup,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    entity_ids: Optional[Iterable[Any]] = None,
+    partition_column: Optional[str] = None,
+) -> Optional[pl.Expr]:
+    """Build the Polars equivalent of `_build_filter`, for predicate pushdown in scans"""
+    import polars as pl
+
+    expressions = []
+    if start is not None:
+        expressions.append(pl.col(feature.datetime_column) >= start)
+        if partition_column is not None:
+            expressions.append(pl.col(partition_column) >= _as_date(start))
+    if end is not None:
+        expressions.append(pl.col(feature.datetime_column) <= end)
+        if partition_column is not None:
+            expressions.append(pl.col(partition_column) <= _as_date(end))
+    if entity_ids is not None:
+        expressions.append(pl.col(feature.id_column).is_in(list(entity_ids)))
+
+    if not expressions:
+        return None
+    return functools.reduce(operator.and_, expressions)
+
+
 class ParquetFeatureStorage:
+    """
+    Stores each feature group as a Parquet dataset, hive-partitioned on the date of its
+    datetime column
+
+    Uploads add new files to the daily partitions they cover, so ingest cost scales with
+    the new data rather than the full history. Reads go through pyarrow.dataset, so time-range
+    filters skip whole partitions. Groups stored as a single Parquet file by earlier
+    versions can still be read, and are converted to a dataset on their next upload
+
+    Parameters
+    ----------
+    uri:
+        The directory the datasets are stored in
+    """
+
     type = "parquet"
 
     def __init__(self, uri: str):
         self.uri = uri
 
-    def download_data(self, feature: FeatureGroup) -> pa.Table:
-        uri = self._get_uri(feature)
-        return pq.read_table(uri)
+    def download_data(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pa.Table:
+        dataset = self._get_dataset(feature)
+        return dataset.to_table(
+            columns=columns or self._data_columns(feature, dataset),
+            filter=self._filter(feature, dataset, start, end, entity_ids),
+        )
+
+    def download_batches(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the feature group as RecordBatches of at most `batch_size` rows"""
+        dataset = self._get_dataset(feature)
+        scanner = dataset.scanner(
+            columns=columns or self._data_columns(feature, dataset),
+            filter=self._filter(feature, dataset, start, end, entity_ids),
+            batch_size=batch_size or 131_072,
+        )
+        yield from scanner.to_batches()
+
+    def scan_polars(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pl.LazyFrame:
+        """Scan the feature group lazily with Polars, pushing down columns and filters"""
+        import polars as pl
+
+        filesystem, path = self._get_path(feature)
+        source = path if isinstance(filesystem, pa_fs.LocalFileSystem) else None
+        source = source or self._get_uri(feature)
+
+        partition_column = None
+        if filesystem.get_file_info(path).type == pa_fs.FileType.File:
+            frame = pl.scan_parquet(source)
+        else:
+            schema = pq.read_schema(f"{path}/_common_metadata", filesystem=filesystem)
+            partition_column = _partition_column(feature)
+            frame = pl.scan_parquet(
+                f"{source}/**/*.parquet",
+                hive_partitioning=True,
+                hive_schema={partition_column: pl.Date},
+            )
+            columns = columns or schema.names
+
+        filters = _build_polars_filter(
+            feature,
+            start=start,
+            end=end,
+            entity_ids=entity_ids,
+            partition_column=partition_column,
+        )
+        if filters is not None:
+            frame = frame.filter(filters)
+        return frame.select(columns) if columns is not None else frame
 
     def upload_data(self, df: pd.DataFrame, feature: FeatureGroup) -> pa.Table:
         data = pa.Table.from_pandas(df)
-        uri = self._get_uri(feature)
-        pq.write_table(data, uri)
+        filesystem, path = self._get_path(feature)
+
+        if filesystem.get_file_info(path).type == pa_fs.FileType.File:
+            self._convert_legacy_file(filesystem, path, feature)
+
+        self._append(filesystem, path, feature, data)
         return data
 
+    def _convert_legacy_file(
+        self, filesystem: pa_fs.FileSystem, path: str, feature: FeatureGroup
+    ) -> None:
+        """Rewrite a single-file group as a dataset next to it, then swap it in, so the
+        file is kept if the conversion fails"""
+        token = uuid.uuid4().hex
+        converted, backup = f"{path}.{token}.converting", f"{path}.{token}.legacy"
+        try:
+            existing = pq.read_table(path, filesystem=filesystem)
+            self._append(filesystem, converted, feature, existing)
+        except BaseException:
+            if filesystem.get_file_info(converted).type == pa_fs.FileType.Directory:
+                filesystem.delete_dir(converted)
+            raise
+
+        filesystem.move(path, backup)
+        try:
+            filesystem.move(converted, path)
+        except BaseException:
+            filesystem.move(backup, path)
+            raise
+        filesystem.delete_file(backup)
+
+    def delete_data(self, feature: FeatureGroup) -> None:
+        filesystem, path = self._get_path(feature)
+        info = filesystem.get_file_info(path)
+        if info.type == pa_fs.FileType.Directory:
+            filesystem.delete_dir(path)
+        elif info.type == pa_fs.FileType.File:
+            filesystem.delete_file(path)
+
+    def fingerprint(self, feature: FeatureGroup) -> str:
+        """A cheap identifier of the stored data, which changes when files are added"""
+        filesystem, path = self._get_path(feature)
+        info = filesystem.get_file_info(path)
+        if info.type != pa_fs.FileType.Directory:
+            return f"{info.mtime_ns}-{info.size}"
+
+        files = filesystem.get_file_info(pa_fs.FileSelector(path, recursive=True))
+        return (
+            f"{len(files)}-{max(f.mtime_ns or 0 for f in files)}-"
+            f"{sum(f.size or 0 for f in files)}"
+        )
+
+    def _append(
+        self,
+        filesystem: pa_fs.FileSystem,
+        path: str,
+        feature: FeatureGroup,
+        data: pa.Table,
+    ) -> None:
+        """Write the data as new files in its partitions, and record the dataset schema"""
+        data = data.replace_schema_metadata(None)
+        metadata_path = f"{path}/_common_metadata"
+        schema = data.schema
+        if filesystem.get_file_info(metadata_path).type == pa_fs.FileType.File:
+            existing_schema = pq.read_schema(metadata_path, filesystem=filesystem)
+            schema = pa.unify_schemas([existing_schema, schema])
+
+        dates = pc.cast(data[feature.datetime_column], pa.date32())
+        ds.write_dataset(
+            data.append_column(_partition_column(feature), dates),
+            path,
+            filesystem=filesystem,
+            format="parquet",
+            partitioning=self._partitioning(feature),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            max_partitions=max(len(pc.unique(dates)), 1),
+        )
+        pq.write_metadata(schema, metadata_path, filesystem=filesystem)
+
+    def _get_dataset(self, feature: FeatureGroup) -> ds.Dataset:
+        filesystem, path = self._get_path(feature)
+        if filesystem.get_file_info(path).type == pa_fs.FileType.File:
+            return ds.dataset(path, filesystem=filesystem, format="parquet")
+
+        schema = pq.read_schema(f"{path}/_common_metadata", filesystem=filesystem)
+        partitioning = self._partitioning(feature)
+        return ds.dataset(
+            path,
+            filesystem=filesystem,
+            format="parquet",
+            schema=pa.unify_schemas([schema, partitioning.schema]),
+            partitioning=partitioning,
+        )
+
+    @staticmethod
+    def _partitioning(feature: FeatureGroup) -> ds.Partitioning:
+        return ds.partitioning(
+            pa.schema([(_partition_column(feature), pa.date32())]), flavor="hive"
+        )
+
+    @staticmethod
+    def _data_columns(feature: FeatureGroup, dataset: ds.Dataset) -> list[str]:
+        """The columns of the dataset, without the derived partition column"""
+        return [
+            name for name in dataset.schema.names if name != _partition_column(feature)
+        ]
+
+    @staticmethod
+    def _filter(
+        feature: FeatureGroup,
+        dataset: ds.Dataset,
+        start: Optional[datetime.date],
+        end: Optional[datetime.date],
+        entity_ids: Optional[Iterable[Any]],
+    ) -> Optional[pc.Expression]:
+        partition_column = _partition_column(feature)
+        return _build_filter(
+            feature,
+            start=start,
+            end=end,
+            entity_ids=entity_ids,
+            partition_column=(
+                partition_column if partition_column in dataset.schema.names else None
+            ),
+        )
+
+    def _get_path(self, feature: FeatureGroup) -> tuple[pa_fs.FileSystem, str]:
+        return _resolve_uri(self._get_uri(feature))
+
     def _get_uri(self, feature: FeatureGroup) -> str:
         key, _, filename = feature.location.partition("::")
         return f"{self.uri}/{filename}"
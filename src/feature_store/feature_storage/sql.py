@@ -1,47 +1,384 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import datetime
+import io
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+)
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.csv as pa_csv
 import sqlalchemy as sa
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 
 if TYPE_CHECKING:
     from feature_store.feature import FeatureGroup
 
 
+_ARROW_TYPES: list[tuple[type[sa.types.TypeEngine[Any]], pa.DataType]] = [
+    (sa.Boolean, pa.bool_()),
+    (sa.Integer, pa.int64()),
+    (sa.Float, pa.float64()),
+    (sa.DateTime, pa.timestamp("us")),
+    (sa.Date, pa.date32()),
+    (sa.Time, pa.time64("us")),
+    (sa.Interval, pa.duration("us")),
+    (sa.String, pa.string()),
+    (sa.LargeBinary, pa.binary()),
+]
+
+_ENGINES: dict[tuple[str, tuple[tuple[str, int], ...]], Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+_TABLES: dict[tuple[str, str, str], tuple[float, sa.Table]] = {}
+_TABLES_LOCK = threading.Lock()
+
+
 def _extract_table_parts(location: str) -> tuple[str, str]:
     key, _, table_name = location.partition("::")
     schema, table = table_name.split(".")
     return schema, table
 
 
+def _to_arrow_type(sql_type: sa.types.TypeEngine[Any]) -> Optional[pa.DataType]:
+    """Map a declared SQL column type to an Arrow type. Returns None if it should be inferred"""
+    if isinstance(sql_type, sa.DateTime) and sql_type.timezone:
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(sql_type, sa.Numeric) and not isinstance(sql_type, sa.Float):
+        if not sql_type.asdecimal:
+            return pa.float64()
+        if sql_type.precision is not None:
+            return pa.decimal128(sql_type.precision, sql_type.scale or 0)
+        return None
+    for sql_class, arrow_type in _ARROW_TYPES:
+        if isinstance(sql_type, sql_class):
+            return arrow_type
+    return None
+
+
+def _to_sql_type(arrow_type: pa.DataType) -> sa.types.TypeEngine[Any]:
+    """Map an Arrow type to the SQL column type used when creating a new table"""
+    if pa.types.is_boolean(arrow_type):
+        return sa.Boolean()
+    if pa.types.is_integer(arrow_type):
+        return sa.BigInteger()
+    if pa.types.is_floating(arrow_type):
+        return sa.Float(precision=53)
+    if pa.types.is_decimal(arrow_type):
+        return sa.Numeric(arrow_type.precision, arrow_type.scale)
+    if pa.types.is_timestamp(arrow_type):
+        return sa.DateTime(timezone=arrow_type.tz is not None)
+    if pa.types.is_date(arrow_type):
+        return sa.Date()
+    if pa.types.is_time(arrow_type):
+        return sa.Time()
+    if pa.types.is_duration(arrow_type):
+        return sa.Interval()
+    if pa.types.is_binary(arrow_type) or pa.types.is_large_binary(arrow_type):
+        return sa.LargeBinary()
+    return sa.Text()
+
+
+def _rows_to_batch(
+    rows: Sequence[Sequence[Any]],
+    names: list[str],
+    types: list[Optional[pa.DataType]],
+) -> pa.RecordBatch:
+    """Build a RecordBatch column-wise from a chunk of result rows"""
+    columns = zip(*rows) if rows else [[] for _ in names]
+    arrays = [
+        pa.array(column, type=arrow_type) for column, arrow_type in zip(columns, types)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def _first_value_queries(
+    sql: sa.Select[Any], types: list[Optional[pa.DataType]]
+) -> dict[int, sa.Select[Any]]:
+    """Queries for the first non-null value of each selected column without a declared
+    type, so its type can be inferred before any batch is built"""
+    return {
+        i: sql.with_only_columns(column).where(column.is_not(None)).limit(1)
+        for i, (column, arrow_type) in enumerate(zip(sql.selected_columns, types))
+        if arrow_type is None
+    }
+
+
+def _infer_type(value: Any) -> Optional[pa.DataType]:
+    return None if value is None else pa.array([value]).type
+
+
+def _build_query(
+    table: sa.Table,
+    feature: FeatureGroup,
+    columns: Optional[list[str]] = None,
+    start: Optional[datetime.date] = None,
+    end: Optional[datetime.date] = None,
+    entity_ids: Optional[Iterable[Any]] = None,
+) -> sa.Select[Any]:
+    if columns is None:
+        sql = sa.select(table)
+    else:
+        sql = sa.select(*[table.c[column] for column in columns])
+
+    if start is not None:
+        sql = sql.where(table.c[feature.datetime_column] >= start)
+    if end is not None:
+        sql = sql.where(table.c[feature.datetime_column] <= end)
+    if entity_ids is not None:
+        sql = sql.where(table.c[feature.id_column].in_(list(entity_ids)))
+
+    return sql
+
+
+def _new_table(location: str, schema: pa.Schema) -> sa.Table:
+    """Define the table to create for a location, with columns matching the Arrow schema"""
+    db_schema, table_name = _extract_table_parts(location)
+    return sa.Table(
+        table_name,
+        sa.MetaData(),
+        *[sa.Column(f.name, _to_sql_type(f.type)) for f in schema],
+        schema=db_schema,
+    )
+
+
+def _pool_options(
+    pool_size: Optional[int], max_overflow: Optional[int]
+) -> dict[str, int]:
+    return {
+        key: value
+        for key, value in {"pool_size": pool_size, "max_overflow": max_overflow}.items()
+        if value is not None
+    }
+
+
+def _get_cached_table(key: tuple[str, str, str]) -> Optional[sa.Table]:
+    with _TABLES_LOCK:
+        cached = _TABLES.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    return None
+
+
+def _cache_table(
+    key: tuple[str, str, str], table: sa.Table, ttl: Optional[float]
+) -> None:
+    expires_at = float("inf") if ttl is None else time.monotonic() + ttl
+    with _TABLES_LOCK:
+        _TABLES[key] = (expires_at, table)
+
+
+def _insert_many(conn: Connection, table: sa.Table, batch: pa.RecordBatch) -> None:
+    """Insert a batch as a single multi-row executemany"""
+    conn.execute(table.insert(), batch.to_pylist())
+
+
+def _copy_into_postgres(
+    conn: Connection, table: sa.Table, batch: pa.RecordBatch
+) -> None:
+    """Stream a batch into Postgres with COPY, bypassing per-row INSERT overhead"""
+    buffer = io.BytesIO()
+    pa_csv.write_csv(batch, buffer)
+    buffer.seek(0)
+
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(name) for name in batch.schema.names)
+    copy_sql = (
+        f"COPY {preparer.format_table(table)} ({columns}) "
+        "FROM STDIN WITH (FORMAT csv, HEADER true)"
+    )
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(copy_sql, buffer)
+
+
+BULK_LOADERS: dict[
+    tuple[str, str], Callable[[Connection, sa.Table, pa.RecordBatch], None]
+] = {
+    ("postgresql", "psycopg2"): _copy_into_postgres,
+}
+
+
+def get_engine(db_url: str, **pool_options: int) -> Engine:
+    """Get the shared engine for a database url, creating it on first use
+
+    Engines are shared across the process, so every storage pointing at the same
+    database draws connections from the same pool
+    """
+    key = (db_url, tuple(sorted(pool_options.items())))
+    with _ENGINES_LOCK:
+        if key not in _ENGINES:
+            _ENGINES[key] = sa.create_engine(db_url, **pool_options)
+        return _ENGINES[key]
+
+
+def dispose_engines() -> None:
+    """Close all pooled connections and forget the shared engines"""
+    with _ENGINES_LOCK:
+        for engine in _ENGINES.values():
+            engine.dispose()
+        _ENGINES.clear()
+
+
+def invalidate_table_cache(
+    db_url: Optional[str] = None,
+    schema: Optional[str] = None,
+    table: Optional[str] = None,
+) -> None:
+    """Forget cached table reflections, so they are reflected again on next use
+
+    Any argument left as None matches every value, so calling without arguments clears
+    the whole cache
+    """
+    with _TABLES_LOCK:
+        for key in list(_TABLES):
+            if all(
+                expected is None or expected == actual
+                for expected, actual in zip((db_url, schema, table), key)
+            ):
+                del _TABLES[key]
+
+
 class SQLAlchemyFeatureStorage:
     type = "sqlalchemy"
 
-    def __init__(self, db_url: str):
-        self.meta = sa.MetaData()
+    def __init__(
+        self,
+        db_url: str,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        batch_size: int = 10_000,
+        table_cache_ttl: Optional[float] = 300,
+    ):
         self.db_url = db_url
+        self.batch_size = batch_size
+        self.table_cache_ttl = table_cache_ttl
+        self.pool_options = _pool_options(pool_size, max_overflow)
 
     @property
     def engine(self) -> Engine:
-        return sa.create_engine(self.db_url)
+        return get_engine(self.db_url, **self.pool_options)
 
     def upload_data(self, df: pd.DataFrame, feature: FeatureGroup) -> pa.Table:
-        schema, table = _extract_table_parts(feature.location)
-        df.to_sql(table, self.engine, schema=schema, if_exists="append", index=False)
-        return pa.Table.from_pandas(df)
+        """Append the data to the feature group's table in `batch_size` chunks
 
-    def download_data(self, feature: FeatureGroup) -> pa.Table:
+        All chunks are written in a single transaction. Dialects with a registered
+        bulk loader, such as Postgres COPY, use it instead of executemany
+        """
+        data = pa.Table.from_pandas(df)
+        to_insert = data.select([str(column) for column in df.columns])
+        table = self._get_or_create_table(feature.location, to_insert.schema)
+
+        with self.engine.begin() as conn:
+            load = BULK_LOADERS.get(
+                (conn.dialect.name, conn.dialect.driver), _insert_many
+            )
+            for batch in to_insert.to_batches(max_chunksize=self.batch_size):
+                load(conn, table, batch)
+        return data
+
+    def download_data(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+    ) -> pa.Table:
+        batches = self.download_batches(
+            feature, columns=columns, start=start, end=end, entity_ids=entity_ids
+        )
+        return pa.Table.from_batches(list(batches))
+
+    def download_batches(
+        self,
+        feature: FeatureGroup,
+        columns: Optional[list[str]] = None,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        entity_ids: Optional[Iterable[Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the feature group as RecordBatches of at most `batch_size` rows
+
+        Rows are fetched in chunks with a server-side cursor where the driver supports it,
+        and each chunk is converted column-wise using the declared column types, so memory
+        is bounded by the batch size rather than the size of the table. Columns without a
+        declared type get the type of their first non-null value, so every batch has the
+        same schema
+        """
         table = self.get_table(feature.location)
-        sql = sa.select(table)
+        sql = _build_query(
+            table, feature, columns=columns, start=start, end=end, entity_ids=entity_ids
+        )
+        names = [column.name for column in sql.selected_columns]
+        types = [_to_arrow_type(column.type) for column in sql.selected_columns]
+
+        with self.engine.connect() as conn:
+            for i, query in _first_value_queries(sql, types).items():
+                types[i] = _infer_type(conn.execute(query).scalar())
+            result = conn.execution_options(
+                yield_per=batch_size or self.batch_size
+            ).execute(sql)
+            is_empty = True
+            for rows in result.partitions():
+                is_empty = False
+                yield _rows_to_batch(rows, names, types)
 
+            if is_empty:
+                yield _rows_to_batch([], names, types)
+
+    def delete_data(self, feature: FeatureGroup) -> None:
+        schema, table_name = _extract_table_parts(feature.location)
+        sa.Table(table_name, sa.MetaData(), schema=schema).drop(
+            self.engine, checkfirst=True
+        )
+        self.invalidate(feature.location)
+
+    def fingerprint(self, feature: FeatureGroup) -> str:
+        """A cheap identifier of the stored data, which changes when rows are appended"""
+        table = self.get_table(feature.location)
+        sql = sa.select(
+            sa.func.count(), sa.func.max(table.c[feature.datetime_column])
+        ).select_from(table)
         with self.engine.connect() as conn:
-            results = conn.execute(sql).mappings().all()
-            return pa.Table.from_pylist(results)
+            row_count, max_datetime = conn.execute(sql).one()
+        return f"{row_count}-{max_datetime}"
+
+    def _get_or_create_table(self, location: str, schema: pa.Schema) -> sa.Table:
+        _new_table(location, schema).create(self.engine, checkfirst=True)
+        return self.get_table(location)
 
     def get_table(self, location: str) -> sa.Table:
-        schema, table = _extract_table_parts(location)
-        self.meta.reflect(self.engine, only=[table], schema=schema)
-        return self.meta.tables[f"{schema}.{table}"]
+        """Get the reflected table for a location
+
+        Reflections are cached for `table_cache_ttl` seconds and shared with every
+        storage using the same database url. A ttl of None caches them until invalidated
+        """
+        schema, table_name = _extract_table_parts(location)
+        key = (self.db_url, schema, table_name)
+        cached = _get_cached_table(key)
+        if cached is not None:
+            return cached
+
+        table = sa.Table(
+            table_name, sa.MetaData(), schema=schema, autoload_with=self.engine
+        )
+        _cache_table(key, table, self.table_cache_ttl)
+        return table
+
+    def invalidate(self, location: Optional[str] = None) -> None:
+        """Forget cached reflections for this database, or only for a single location"""
+        if location is None:
+            invalidate_table_cache(self.db_url)
+        else:
+            schema, table = _extract_table_parts(location)
+            invalidate_table_cache(self.db_url, schema, table)
@@ -0,0 +1,48 @@
+"""
+Materialize feature groups into latest-per-entity snapshots
+
+Usage: python -m feature_store.materialize customer [...] [--full-refresh]
+"""
+
+import argparse
+import pathlib
+from typing import Optional, Sequence
+
+from feature_store.auth.file_auth import FileAuth
+from feature_store.client import Client
+from feature_store.registry_backends.local import LocalRegistryBackend
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "feature_groups", nargs="+", help="Feature groups to materialize"
+    )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Rebuild the snapshots instead of updating them incrementally",
+    )
+    parser.add_argument(
+        "--config", type=pathlib.Path, default=pathlib.Path("featurestore.yaml")
+    )
+    parser.add_argument("--registry-url", default="sqlite:///features.db")
+    args = parser.parse_args(argv)
+
+    client = Client(
+        registry=LocalRegistryBackend(database_url=args.registry_url),
+        auth=FileAuth(config_file=args.config),
+    )
+    for name in args.feature_groups:
+        feature_group = client.materialize(name, full_refresh=args.full_refresh)
+        if feature_group.snapshot is None:
+            print(f"{name}: no data to materialize")
+        else:
+            print(
+                f"{name}: {feature_group.snapshot.location} "
+                f"up to {feature_group.snapshot.watermark}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+from typing import TYPE_CHECKING, Any
+
+from feature_store.online_storage.base import OnlineStorage
+from feature_store.online_storage.memory import InMemoryOnlineStorage
+
+if TYPE_CHECKING:
+    from feature_store.online_storage.sqlite import SQLiteOnlineStorage
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first access, so only users of the SQLite storage import SQLAlchemy
+    if name == "SQLiteOnlineStorage":
+        from feature_store.online_storage.sqlite import SQLiteOnlineStorage
+
+        return SQLiteOnlineStorage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["InMemoryOnlineStorage", "OnlineStorage", "SQLiteOnlineStorage"]
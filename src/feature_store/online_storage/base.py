@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Protocol
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+if TYPE_CHECKING:
+    from feature_store.feature import FeatureGroup
+
+
+def _latest_per_entity(
+    table: pa.Table, id_column: str, datetime_column: str
+) -> pa.Table:
+    """Keep the most recent row for each id, sorting once instead of grouping in Python"""
+    table = table.filter(pc.is_valid(table[id_column]))
+    if table.num_rows == 0:
+        return table
+
+    ordered = table.take(
+        pc.sort_indices(
+            table,
+            sort_keys=[(id_column, "ascending"), (datetime_column, "descending")],
+        )
+    )
+    ids = ordered[id_column].combine_chunks()
+    # After sorting, the latest row of each id is the first row where the id changes
+    is_first = pc.not_equal(ids.slice(1), ids.slice(0, len(ids) - 1))
+    return ordered.filter(pa.concat_arrays([pa.array([True]), is_first]))
+
+
+def _index_ids(ids: Iterable[Any]) -> dict[Any, int]:
+    return {entity_id: i for i, entity_id in enumerate(ids)}
+
+
+def _align_to_entities(
+    table: pa.Table, positions: dict[Any, int], entity_ids: Iterable[Any]
+) -> pa.Table:
+    """Reorder rows to follow entity_ids, with null rows for ids that weren't found"""
+    indices = pa.array([positions.get(e) for e in entity_ids], type=pa.int64())
+    return table.take(indices)
+
+
+class OnlineStorage(Protocol):
+    type: ClassVar[str]
+
+    def write_latest(self, feature: FeatureGroup, table: pa.Table) -> None:
+        """Store the latest row per entity, keeping stored rows that are newer"""
+        ...
+
+    def read_latest(
+        self, feature: FeatureGroup, columns: list[str], entity_ids: Iterable[Any]
+    ) -> pa.Table:
+        """Get the columns for each entity id, in order, with nulls for unknown ids"""
+        ...
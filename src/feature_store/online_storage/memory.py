@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Iterable
+
+import pyarrow as pa
+
+from feature_store.exceptions import MissingDataException
+from feature_store.online_storage.base import (
+    _align_to_entities,
+    _index_ids,
+    _latest_per_entity,
+)
+
+if TYPE_CHECKING:
+    from feature_store.feature import FeatureGroup
+
+
+class InMemoryOnlineStorage:
+    """
+    Keeps the latest row per entity in memory, with a hash index on the id column
+
+    Lookups don't leave the process, making this the fastest option when the online
+    features fit in memory and don't need to be shared between processes
+    """
+
+    type = "memory"
+
+    def __init__(self) -> None:
+        self._tables: dict[str, tuple[pa.Table, dict[Any, int]]] = {}
+        self._lock = threading.Lock()
+
+    def write_latest(self, feature: FeatureGroup, table: pa.Table) -> None:
+        with self._lock:
+            if feature.name in self._tables:
+                existing, _ = self._tables[feature.name]
+                table = pa.concat_tables(
+                    [existing, table], promote_options="permissive"
+                )
+            latest = _latest_per_entity(
+                table, feature.id_column, feature.datetime_column
+            )
+            self._tables[feature.name] = (
+                latest,
+                _index_ids(latest[feature.id_column].to_pylist()),
+            )
+
+    def read_latest(
+        self, feature: FeatureGroup, columns: list[str], entity_ids: Iterable[Any]
+    ) -> pa.Table:
+        try:
+            table, positions = self._tables[feature.name]
+        except KeyError:
+            raise MissingDataException(
+                f"No online data for feature group: {feature.name}"
+            ) from None
+        return _align_to_entities(table.select(columns), positions, entity_ids)
+
+    def clear(self, feature: FeatureGroup) -> None:
+        """Delete the stored rows of a feature group"""
+        with self._lock:
+            self._tables.pop(feature.name, None)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Iterable
+
+import pyarrow as pa
+import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Engine
+
+from feature_store.exceptions import FeatureDataException, MissingDataException
+from feature_store.feature_storage.sql import (
+    _rows_to_batch,
+    _to_arrow_type,
+    _to_sql_type,
+    get_engine,
+)
+from feature_store.online_storage.base import (
+    _align_to_entities,
+    _index_ids,
+    _latest_per_entity,
+)
+
+if TYPE_CHECKING:
+    from feature_store.feature import FeatureGroup
+
+
+class SQLiteOnlineStorage:
+    """
+    Keeps the latest row per entity in SQLite, with the id column as primary key
+
+    Parameters
+    ----------
+    db_url:
+        The SQLite database to store online features in
+    batch_size:
+        The number of rows written per statement
+    """
+
+    type = "sqlite"
+
+    def __init__(
+        self, db_url: str = "sqlite:///online_features.db", batch_size: int = 10_000
+    ):
+        self.db_url = db_url
+        self.batch_size = batch_size
+        self._tables: dict[str, sa.Table] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self) -> Engine:
+        return get_engine(self.db_url)
+
+    def write_latest(self, feature: FeatureGroup, table: pa.Table) -> None:
+        latest = _latest_per_entity(table, feature.id_column, feature.datetime_column)
+        sa_table = self._get_or_create_table(feature, latest.schema)
+
+        insert = sqlite.insert(sa_table)
+        upsert = insert.on_conflict_do_update(
+            index_elements=[feature.id_column],
+            set_={
+                name: insert.excluded[name]
+                for name in latest.column_names
+                if name != feature.id_column
+            },
+            where=(
+                insert.excluded[feature.datetime_column]
+                >= sa_table.c[feature.datetime_column]
+            ),
+        )
+        with self.engine.begin() as conn:
+            for batch in latest.to_batches(max_chunksize=self.batch_size):
+                conn.execute(upsert, batch.to_pylist())
+
+    def read_latest(
+        self, feature: FeatureGroup, columns: list[str], entity_ids: Iterable[Any]
+    ) -> pa.Table:
+        entity_ids = list(entity_ids)
+        sa_table = self._get_table(feature)
+        sql = sa.select(
+            sa_table.c[feature.id_column], *[sa_table.c[column] for column in columns]
+        ).where(sa_table.c[feature.id_column].in_(entity_ids))
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(sql).all()
+
+        found = _rows_to_batch(
+            rows,
+            [feature.id_column, *columns],
+            [_to_arrow_type(column.type) for column in sql.selected_columns],
+        )
+        positions = _index_ids(row[0] for row in rows)
+        return _align_to_entities(
+            pa.Table.from_batches([found]).select(columns), positions, entity_ids
+        )
+
+    def clear(self, feature: FeatureGroup) -> None:
+        """Delete the stored rows of a feature group"""
+        with self._lock:
+            self._tables.pop(feature.name, None)
+        sa.Table(feature.name, sa.MetaData()).drop(self.engine, checkfirst=True)
+
+    def _get_table(self, feature: FeatureGroup) -> sa.Table:
+        with self._lock:
+            if feature.name in self._tables:
+                return self._tables[feature.name]
+        try:
+            table = sa.Table(feature.name, sa.MetaData(), autoload_with=self.engine)
+        except sa.exc.NoSuchTableError:
+            raise MissingDataException(
+                f"No online data for feature group: {feature.name}"
+            ) from None
+        with self._lock:
+            self._tables[feature.name] = table
+        return table
+
+    def _get_or_create_table(
+        self, feature: FeatureGroup, schema: pa.Schema
+    ) -> sa.Table:
+        try:
+            table = self._get_table(feature)
+        except MissingDataException:
+            table = sa.Table(
+                feature.name,
+                sa.MetaData(),
+                *[
+                    sa.Column(
+                        f.name,
+                        _to_sql_type(f.type),
+                        primary_key=f.name == feature.id_column,
+                    )
+                    for f in schema
+                ],
+            )
+            table.create(self.engine, checkfirst=True)
+            with self._lock:
+                self._tables[feature.name] = table
+            return table
+
+        missing = [name for name in schema.names if name not in table.c]
+        if missing:
+            raise FeatureDataException(
+                f"Online table for {feature.name} is missing columns: "
+                f"{', '.join(missing)}. Clear it before writing the new columns"
+            )
+        return table
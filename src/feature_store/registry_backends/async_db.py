@@ -0,0 +1,75 @@
+import contextlib
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import AsyncGenerator, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from feature_store.feature import FeatureGroup, Snapshot
+from feature_store.registry_backends.db import Base, FeatureGroupTable
+
+
+@dataclass
+class AsyncDatabaseRegistryBackend:
+    """A DatabaseRegistryBackend using SQLAlchemy's async engine. Needs an async driver url"""
+
+    database_url: str
+    _tables_created: bool = field(init=False, default=False, repr=False)
+
+    @cached_property
+    def _engine(self) -> AsyncEngine:
+        return create_async_engine(self.database_url)
+
+    @contextlib.asynccontextmanager
+    async def _session(self) -> AsyncGenerator[AsyncSession, None]:
+        if not self._tables_created:
+            async with self._engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            self._tables_created = True
+
+        async with AsyncSession(self._engine) as session:
+            yield session
+
+    async def add_feature_group_metadata(self, feature_group: FeatureGroup) -> None:
+        new_row = FeatureGroupTable.from_feature_group(feature_group)
+        async with self._session() as session:
+            session.add(new_row)
+            await session.commit()
+
+    async def set_snapshot_metadata(
+        self, feature_group_name: str, snapshot: Snapshot
+    ) -> None:
+        sql = sa.select(FeatureGroupTable).where(
+            FeatureGroupTable.name == feature_group_name
+        )
+        async with self._session() as session:
+            row = (await session.execute(sql)).scalar_one()
+            row.set_snapshot(snapshot)
+            await session.commit()
+
+    async def get_feature_group_metadata(
+        self, feature_group_name: str
+    ) -> Optional[FeatureGroup]:
+        feature_groups = await self.get_feature_groups_metadata([feature_group_name])
+        return feature_groups.get(feature_group_name)
+
+    async def get_feature_groups_metadata(
+        self, feature_group_names: list[str]
+    ) -> dict[str, FeatureGroup]:
+        sql = (
+            sa.select(FeatureGroupTable)
+            .where(FeatureGroupTable.name.in_(feature_group_names))
+            .options(selectinload(FeatureGroupTable.features))
+        )
+
+        async with self._session() as session:
+            result = (await session.execute(sql)).scalars().all()
+            return {row.name: row.to_feature_group() for row in result}
+
+    async def get_available_feature_metadata(self) -> list[FeatureGroup]:
+        sql = sa.select(FeatureGroupTable)
+        async with self._session() as session:
+            result = (await session.execute(sql)).scalars().all()
+            return [f.to_feature_group() for f in result]
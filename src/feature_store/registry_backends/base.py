@@ -1,15 +1,80 @@
+import asyncio
 from typing import Optional, Protocol
 
-from feature_store.feature import FeatureGroup
+from feature_store.feature import FeatureGroup, Snapshot
 
 
 class RegistryBackend(Protocol):
     def add_feature_group_metadata(self, feature_group: FeatureGroup) -> None: ...
 
+    def set_snapshot_metadata(
+        self, feature_group_name: str, snapshot: Snapshot
+    ) -> None:
+        """Record the latest materialized snapshot of a feature group"""
+        ...
+
     def get_feature_group_metadata(
         self, feature_group_name: str
     ) -> Optional[FeatureGroup]: ...
 
+    def get_feature_groups_metadata(
+        self, feature_group_names: list[str]
+    ) -> dict[str, FeatureGroup]:
+        """Get several feature groups in one lookup, keyed by name. Missing groups are left out"""
+        ...
+
     def get_available_feature_metadata(self) -> list[FeatureGroup]:
         """Get names of available feature groups"""
         ...
+
+
+class AsyncRegistryBackend(Protocol):
+    async def add_feature_group_metadata(self, feature_group: FeatureGroup) -> None: ...
+
+    async def set_snapshot_metadata(
+        self, feature_group_name: str, snapshot: Snapshot
+    ) -> None: ...
+
+    async def get_feature_group_metadata(
+        self, feature_group_name: str
+    ) -> Optional[FeatureGroup]: ...
+
+    async def get_feature_groups_metadata(
+        self, feature_group_names: list[str]
+    ) -> dict[str, FeatureGroup]: ...
+
+    async def get_available_feature_metadata(self) -> list[FeatureGroup]: ...
+
+
+class ThreadedRegistryBackend:
+    """Adapts a synchronous RegistryBackend to the async protocol by running it in a thread"""
+
+    def __init__(self, backend: RegistryBackend):
+        self.backend = backend
+
+    async def add_feature_group_metadata(self, feature_group: FeatureGroup) -> None:
+        await asyncio.to_thread(self.backend.add_feature_group_metadata, feature_group)
+
+    async def set_snapshot_metadata(
+        self, feature_group_name: str, snapshot: Snapshot
+    ) -> None:
+        await asyncio.to_thread(
+            self.backend.set_snapshot_metadata, feature_group_name, snapshot
+        )
+
+    async def get_feature_group_metadata(
+        self, feature_group_name: str
+    ) -> Optional[FeatureGroup]:
+        return await asyncio.to_thread(
+            self.backend.get_feature_group_metadata, feature_group_name
+        )
+
+    async def get_feature_groups_metadata(
+        self, feature_group_names: list[str]
+    ) -> dict[str, FeatureGroup]:
+        return await asyncio.to_thread(
+            self.backend.get_feature_groups_metadata, feature_group_names
+        )
+
+    async def get_available_feature_metadata(self) -> list[FeatureGroup]:
+        return await asyncio.to_thread(self.backend.get_available_feature_metadata)
@@ -0,0 +1,107 @@
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from feature_store.feature import FeatureGroup, Snapshot
+from feature_store.registry_backends.base import RegistryBackend
+from feature_store.stats import CacheStats
+
+
+def _copy_feature_group(feature_group: FeatureGroup) -> FeatureGroup:
+    """Copy a feature group with fresh features, so cached metadata never carries data"""
+    return dataclasses.replace(
+        feature_group,
+        features=[dataclasses.replace(f) for f in feature_group.features],
+    )
+
+
+@dataclass
+class CachedRegistryBackend:
+    """
+    Wraps a RegistryBackend, caching feature group metadata in memory
+
+    Parameters
+    ----------
+    backend:
+        The registry backend to read through to
+    max_size:
+        The maximum number of feature groups to keep. The least recently used
+        group is evicted when the cache is full
+    ttl:
+        Seconds a cached feature group is valid for. None keeps it until evicted
+        or invalidated
+    """
+
+    backend: RegistryBackend
+    max_size: int = 1024
+    ttl: Optional[float] = 60
+    stats: CacheStats = field(default_factory=CacheStats)
+    _cache: OrderedDict[str, tuple[float, FeatureGroup]] = field(
+        init=False, default_factory=OrderedDict, repr=False
+    )
+    _lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False
+    )
+
+    def add_feature_group_metadata(self, feature_group: FeatureGroup) -> None:
+        self.backend.add_feature_group_metadata(feature_group)
+        self.invalidate(feature_group.name)
+
+    def set_snapshot_metadata(
+        self, feature_group_name: str, snapshot: Snapshot
+    ) -> None:
+        self.backend.set_snapshot_metadata(feature_group_name, snapshot)
+        self.invalidate(feature_group_name)
+
+    def get_feature_group_metadata(
+        self, feature_group_name: str
+    ) -> Optional[FeatureGroup]:
+        return self.get_feature_groups_metadata([feature_group_name]).get(
+            feature_group_name
+        )
+
+    def get_feature_groups_metadata(
+        self, feature_group_names: list[str]
+    ) -> dict[str, FeatureGroup]:
+        found: dict[str, FeatureGroup] = {}
+        now = time.monotonic()
+        with self._lock:
+            for name in feature_group_names:
+                cached = self._cache.get(name)
+                if cached is not None and now < cached[0]:
+                    self._cache.move_to_end(name)
+                    self.stats.hits += 1
+                    found[name] = _copy_feature_group(cached[1])
+                else:
+                    self.stats.misses += 1
+
+        missing = [name for name in feature_group_names if name not in found]
+        if not missing:
+            return found
+
+        fetched = self.backend.get_feature_groups_metadata(missing)
+        expires_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            for name, feature_group in fetched.items():
+                self._cache[name] = (expires_at, _copy_feature_group(feature_group))
+                self._cache.move_to_end(name)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.stats.evictions += 1
+
+        found.update(fetched)
+        return {name: found[name] for name in feature_group_names if name in found}
+
+    def get_available_feature_metadata(self) -> list[FeatureGroup]:
+        return self.backend.get_available_feature_metadata()
+
+    def invalidate(self, feature_group_name: Optional[str] = None) -> None:
+        """Drop a single feature group from the cache, or everything if no name is given"""
+        with self._lock:
+            if feature_group_name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(feature_group_name, None)
@@ -1,12 +1,20 @@
 import contextlib
+import datetime
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Generator, Optional
+from typing import Generator, Optional, Union
 
 import sqlalchemy as sa
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+    selectinload,
+)
 
-from feature_store.feature import Feature, FeatureGroup
+from feature_store.feature import Feature, FeatureGroup, Snapshot
 
 
 class Base(DeclarativeBase):
@@ -33,6 +41,35 @@ class FeatureTable(Base):
         )
 
 
+def _parse_watermark(value: str) -> Union[datetime.date, datetime.datetime]:
+    """Parse an ISO formatted watermark, keeping dates as dates"""
+    if "T" in value or " " in value:
+        return datetime.datetime.fromisoformat(value)
+    return datetime.date.fromisoformat(value)
+
+
+class SnapshotTable(Base):
+    __tablename__ = "feature_group_snapshots"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    feature_group_id: Mapped[int] = mapped_column(
+        sa.ForeignKey("feature_groups.id"), unique=True
+    )
+    location: Mapped[str]
+    watermark: Mapped[str]
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot) -> "SnapshotTable":
+        return SnapshotTable(
+            location=snapshot.location, watermark=snapshot.watermark.isoformat()
+        )
+
+    def to_snapshot(self) -> Snapshot:
+        return Snapshot(
+            location=self.location, watermark=_parse_watermark(self.watermark)
+        )
+
+
 class FeatureGroupTable(Base):
     __tablename__ = "feature_groups"
 
@@ -45,6 +82,9 @@ class FeatureGroupTable(Base):
     features: Mapped[list[FeatureTable]] = relationship(
         "FeatureTable", back_populates="feature_group", lazy="selectin"
     )
+    snapshot: Mapped[Optional[SnapshotTable]] = relationship(
+        lazy="selectin", cascade="all, delete-orphan"
+    )
 
     @classmethod
     def from_feature_group(cls, feature_group: FeatureGroup) -> "FeatureGroupTable":
@@ -62,8 +102,21 @@ class FeatureGroupTable(Base):
                 )
                 for f in feature_group.features
             ],
+            snapshot=(
+                None
+                if feature_group.snapshot is None
+                else SnapshotTable.from_snapshot(feature_group.snapshot)
+            ),
         )
 
+    def set_snapshot(self, snapshot: Snapshot) -> None:
+        """Record a new snapshot, updating the existing row in place"""
+        if self.snapshot is None:
+            self.snapshot = SnapshotTable.from_snapshot(snapshot)
+        else:
+            self.snapshot.location = snapshot.location
+            self.snapshot.watermark = snapshot.watermark.isoformat()
+
     def to_feature_group(self) -> FeatureGroup:
         return FeatureGroup(
             name=self.name,
@@ -72,6 +125,7 @@ class FeatureGroupTable(Base):
             location=self.location,
             description=self.description,
             features=[f.to_feature() for f in self.features],
+            snapshot=None if self.snapshot is None else self.snapshot.to_snapshot(),
         )
 
 
@@ -96,6 +150,17 @@ class DatabaseRegistryBackend:
             session.add(new_row)
             session.commit()
 
+    def set_snapshot_metadata(
+        self, feature_group_name: str, snapshot: Snapshot
+    ) -> None:
+        sql = sa.select(FeatureGroupTable).where(
+            FeatureGroupTable.name == feature_group_name
+        )
+        with self._session() as session:
+            row: FeatureGroupTable = session.execute(sql).scalar_one()
+            row.set_snapshot(snapshot)
+            session.commit()
+
     def get_feature_group_metadata(
         self, feature_group_name: str
     ) -> Optional[FeatureGroup]:
@@ -110,6 +175,19 @@ class DatabaseRegistryBackend:
 
         return None if result is None else result.to_feature_group()
 
+    def get_feature_groups_metadata(
+        self, feature_group_names: list[str]
+    ) -> dict[str, FeatureGroup]:
+        sql = (
+            sa.select(FeatureGroupTable)
+            .where(FeatureGroupTable.name.in_(feature_group_names))
+            .options(selectinload(FeatureGroupTable.features))
+        )
+
+        with self._session() as session:
+            result: list[FeatureGroupTable] = session.execute(sql).scalars().all()
+            return {row.name: row.to_feature_group() for row in result}
+
     def get_available_feature_metadata(self) -> list[FeatureGroup]:
         sql = sa.select(FeatureGroupTable)
         with self._session() as session:
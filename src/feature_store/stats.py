@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from feature_store.tracing import Span
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class ClientStats:
+    """Cumulative call counts, time, rows and bytes per stage"""
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            stage = self.stages.setdefault(span.stage, StageStats())
+            stage.calls += 1
+            stage.errors += span.error is not None
+            stage.seconds += span.duration
+            stage.rows += span.rows or 0
+            stage.bytes += span.bytes or 0
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """A snapshot of the totals, for exporting to a metrics system"""
+        with self._lock:
+            return {name: asdict(stage) for name, stage in self.stages.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages.clear()
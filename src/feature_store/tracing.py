@@ -0,0 +1,83 @@
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Protocol
+
+from feature_store.stats import ClientStats
+
+
+@dataclass
+class Span:
+    """
+    A timed stage of a request
+
+    Parameters
+    ----------
+    stage:
+        The name of the stage, such as "registry", "download" or "join"
+    duration:
+        Seconds the stage took
+    rows:
+        The number of rows the stage produced, where it produces a table
+    bytes:
+        The size of the table the stage produced
+    backend:
+        The source key of the location the stage read from, such as "local" for
+        "local::customer.parquet"
+    feature_group:
+        The feature group the stage worked on
+    error:
+        The name of the exception the stage raised, if it failed
+    """
+
+    stage: str
+    duration: float = 0.0
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+    backend: Optional[str] = None
+    feature_group: Optional[str] = None
+    error: Optional[str] = None
+
+
+class Tracer(Protocol):
+    def on_span(self, span: Span) -> None:
+        """Called with every finished span. Must be thread-safe"""
+        ...
+
+
+@dataclass
+class Instrumentation:
+    """
+    Times the stages of requests, passing spans to tracers and accumulating stats
+
+    Parameters
+    ----------
+    tracers:
+        Receive every span, for exporting to a tracing or metrics system
+    stats:
+        Cumulative totals per stage
+    """
+
+    tracers: list[Tracer] = field(default_factory=list)
+    stats: ClientStats = field(default_factory=ClientStats)
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        stage: str,
+        backend: Optional[str] = None,
+        feature_group: Optional[str] = None,
+    ) -> Iterator[Span]:
+        """Time the block as a stage. Set rows and bytes on the yielded span"""
+        span = Span(stage, backend=backend, feature_group=feature_group)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            self.stats.record(span)
+            for tracer in self.tracers:
+                tracer.on_span(span)
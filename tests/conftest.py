@@ -9,6 +9,7 @@ import yaml
 from feature_store import Client
 from feature_store.auth.file_auth import FileAuth
 from feature_store.feature import FeatureGroup
+from feature_store.online_storage import SQLiteOnlineStorage
 from feature_store.registry_backends.local import LocalRegistryBackend
 
 
@@ -56,8 +57,20 @@ def config(tmp_path: pathlib.Path) -> pathlib.Path:
             "local_sqlite": {
                 "type": "sqlalchemy",
                 "db_url": f"sqlite:///{tmp_path}/features.db",
+                "async_db_url": f"sqlite+aiosqlite:///{tmp_path}/features.db",
             },
             "local": {"type": "parquet", "uri": f"file:///{tmp_path}"},
+            "local_fsspec": {"type": "fsspec_parquet", "uri": f"file://{tmp_path}"},
+            "memory_fsspec": {
+                "type": "fsspec_parquet",
+                "uri": f"memory://{tmp_path.name}",
+            },
+            "local_ipc": {"type": "arrow_ipc", "uri": f"file:///{tmp_path}"},
+            "local_ipc_lz4": {
+                "type": "arrow_ipc",
+                "uri": f"file:///{tmp_path}",
+                "compression": "lz4",
+            },
         }
     }
     config_file = tmp_path.joinpath("config.yaml")
@@ -71,7 +84,10 @@ def client(tmp_path: pathlib.Path, config: pathlib.Path) -> Client:
         database_url=f"sqlite:///{tmp_path.joinpath('store.db')}"
     )
     auth = FileAuth(config_file=config)
-    return Client(registry=backend, auth=auth)
+    online_storage = SQLiteOnlineStorage(
+        db_url=f"sqlite:///{tmp_path.joinpath('online.db')}"
+    )
+    return Client(registry=backend, auth=auth, online_storage=online_storage)
 
 
 @pytest.fixture()
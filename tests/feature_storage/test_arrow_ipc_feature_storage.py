@@ -0,0 +1,93 @@
+import datetime
+import pathlib
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from feature_store import Client
+from feature_store.feature import FeatureGroup
+from feature_store.feature_storage import ArrowIPCFeatureStorage
+
+
+@pytest.fixture(params=["local_ipc", "local_ipc_lz4"])
+def customer_feature_group_ipc(
+    request: pytest.FixtureRequest, client: Client, customer_table_df: pd.DataFrame
+) -> FeatureGroup:
+    feature_group = client.register_feature_group(
+        "customer",
+        id_column="customer_id",
+        location=f"{request.param}::customer.arrow",
+        description="Customer features",
+        features=["age", "height"],
+    )
+    client.upload_feature_data(feature_group.name, customer_table_df)
+    return feature_group
+
+
+def test_can_get_features_from_arrow_ipc(
+    client: Client,
+    customer_table_df: pd.DataFrame,
+    customer_feature_group_ipc: FeatureGroup,
+):
+    store = client.auth.get_store(customer_feature_group_ipc.location)
+    assert isinstance(store, ArrowIPCFeatureStorage)
+
+    result = client.get_features(["customer.age", "customer.height"]).to_pandas()
+    pd.testing.assert_frame_equal(result, customer_table_df, check_like=True)
+
+
+def test_uncompressed_files_are_read_without_copying(
+    client: Client, customer_table_df: pd.DataFrame
+):
+    client.register_feature_group(
+        "customer",
+        id_column="customer_id",
+        location="local_ipc::customer.arrow",
+        description="Customer features",
+        features=["age", "height"],
+    )
+    group = client.upload_feature_data("customer", customer_table_df)
+    store = client.auth.get_store(group.location)
+
+    allocated = pa.total_allocated_bytes()
+    store.download_data(group)
+    assert pa.total_allocated_bytes() == allocated
+
+
+def test_arrow_ipc_applies_filters(
+    client: Client, customer_feature_group_ipc: FeatureGroup
+):
+    store = client.auth.get_store(customer_feature_group_ipc.location)
+    result = store.download_data(
+        customer_feature_group_ipc,
+        columns=["customer_id", "date_time", "age"],
+        start=datetime.date(2022, 1, 15),
+        entity_ids=[1, 2],
+    )
+    assert result.column_names == ["customer_id", "date_time", "age"]
+    assert sorted(result["customer_id"].to_pylist()) == [1, 2]
+
+
+def test_relative_uri_is_resolved_against_the_working_directory(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    customer_table_df: pd.DataFrame,
+):
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath("data").mkdir()
+    group = FeatureGroup(
+        name="customer",
+        location="local_ipc::customer.arrow",
+        id_column="customer_id",
+        description="Customer features",
+    )
+    store = ArrowIPCFeatureStorage("data")
+
+    store.upload_data(customer_table_df, group)
+
+    assert tmp_path.joinpath("data", "customer.arrow").is_file()
+    assert store.download_data(group).num_rows == len(customer_table_df)
+    assert store.fingerprint(group)
+    store.delete_data(group)
+    assert not tmp_path.joinpath("data", "customer.arrow").exists()
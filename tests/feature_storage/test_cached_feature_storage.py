@@ -0,0 +1,136 @@
+import pathlib
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+import yaml
+
+from feature_store import Client
+from feature_store.auth.file_auth import FileAuth
+from feature_store.feature import FeatureGroup
+from feature_store.feature_storage import ParquetFeatureStorage
+from feature_store.feature_storage.cache import CachedFeatureStorage
+
+
+@pytest.fixture()
+def cached_config(tmp_path: pathlib.Path) -> pathlib.Path:
+    cache_config = {"path": str(tmp_path.joinpath("cache")), "max_bytes": 10**6}
+    auth_dict = {
+        "sources": {
+            "local_sqlite": {
+                "type": "sqlalchemy",
+                "db_url": f"sqlite:///{tmp_path}/features.db",
+                "cache": cache_config,
+            },
+            "local": {
+                "type": "parquet",
+                "uri": f"file:///{tmp_path}",
+                "cache": cache_config,
+            },
+        }
+    }
+    config_file = tmp_path.joinpath("cached_config.yaml")
+    config_file.write_text(yaml.safe_dump(auth_dict))
+    return config_file
+
+
+@pytest.fixture()
+def cached_client(client: Client, cached_config: pathlib.Path) -> Client:
+    client.auth = FileAuth(config_file=cached_config)
+    return client
+
+
+@pytest.mark.parametrize(
+    "feature_group", ["customer_feature_group_parquet", "customer_feature_group_sql"]
+)
+def test_repeated_downloads_are_served_from_cache(
+    cached_client: Client, feature_group: str, request: pytest.FixtureRequest
+):
+    group: FeatureGroup = request.getfixturevalue(feature_group)
+    store = cached_client.auth.get_store(group.location)
+    assert isinstance(store, CachedFeatureStorage)
+
+    first = store.download_data(group, columns=["customer_id", "date_time", "age"])
+    second = store.download_data(group, columns=["customer_id", "date_time", "age"])
+
+    assert first == second
+    assert store.stats.misses == 1
+    assert store.stats.hits == 1
+
+
+def test_cache_is_bypassed_when_data_changes(
+    cached_client: Client,
+    customer_feature_group_sql: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    store = cached_client.auth.get_store(customer_feature_group_sql.location)
+    store.download_data(customer_feature_group_sql)
+
+    cached_client.upload_feature_data("customer", customer_table_df)
+    result = store.download_data(customer_feature_group_sql)
+
+    assert result.num_rows == 2 * len(customer_table_df)
+    assert store.stats.misses == 2
+
+
+def test_least_recently_used_files_are_evicted(
+    cached_client: Client, customer_feature_group_parquet: FeatureGroup
+):
+    store = cached_client.auth.get_store(customer_feature_group_parquet.location)
+    store.download_data(customer_feature_group_parquet, columns=["customer_id"])
+    store.max_bytes = next(store.path.glob("*.arrow")).stat().st_size
+
+    store.download_data(customer_feature_group_parquet, columns=["date_time"])
+
+    assert store.stats.evictions == 1
+    assert len(list(store.path.glob("*.arrow"))) == 1
+
+
+@pytest.mark.parametrize(
+    "feature_group", ["customer_feature_group_parquet", "customer_feature_group_sql"]
+)
+def test_streamed_downloads_fill_the_cache(
+    cached_client: Client, feature_group: str, request: pytest.FixtureRequest
+):
+    group: FeatureGroup = request.getfixturevalue(feature_group)
+    store = cached_client.auth.get_store(group.location)
+
+    streamed = pa.Table.from_batches(list(store.download_batches(group, batch_size=7)))
+    assert store.stats.misses == 1
+    assert len(list(store.path.glob("*.arrow"))) == 1
+
+    again = pa.Table.from_batches(list(store.download_batches(group, batch_size=7)))
+    assert store.download_data(group) == streamed == again
+    assert store.stats.hits == 2
+
+
+def test_partly_read_stream_is_not_cached(
+    cached_client: Client, customer_feature_group_sql: FeatureGroup
+):
+    store = cached_client.auth.get_store(customer_feature_group_sql.location)
+    batches = store.download_batches(customer_feature_group_sql, batch_size=7)
+    next(batches)
+    batches.close()
+
+    assert store.stats.misses == 1
+    assert list(store.path.glob("*")) == []
+
+
+def test_relative_parquet_uri_can_be_cached(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    customer_table_df: pd.DataFrame,
+):
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath("data").mkdir()
+    group = FeatureGroup(
+        name="customer",
+        location="local::customer.parquet",
+        id_column="customer_id",
+        description="Customer features",
+    )
+    store = CachedFeatureStorage(ParquetFeatureStorage("data"), path="cache")
+    store.upload_data(customer_table_df, group)
+
+    assert store.download_data(group) == store.download_data(group)
+    assert (store.stats.misses, store.stats.hits) == (1, 1)
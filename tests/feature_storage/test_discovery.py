@@ -0,0 +1,50 @@
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from feature_store.exceptions import FeatureStoreException
+from feature_store.feature_storage import discovery
+from feature_store.feature_storage.arrow_ipc import ArrowIPCFeatureStorage
+from feature_store.feature_storage.parquet import ParquetFeatureStorage
+
+
+@pytest.fixture()
+def clear_discovery_cache():
+    yield
+    for func in [
+        discovery._entry_points,
+        discovery.get_store_class,
+        discovery.get_async_store_class,
+    ]:
+        func.cache_clear()
+
+
+def test_store_types_are_resolved_to_backends():
+    assert discovery.get_store_class("parquet") is ParquetFeatureStorage
+    assert discovery.get_async_store_class("parquet") is None
+    assert discovery.get_async_store_class("sqlalchemy").type == "sqlalchemy"
+
+
+def test_unknown_store_type_lists_available_types():
+    with pytest.raises(
+        FeatureStoreException, match="arrow_ipc, fsspec_parquet, parquet, sqlalchemy"
+    ):
+        discovery.get_store_class("idontexist")
+
+
+@pytest.mark.usefixtures("clear_discovery_cache")
+def test_backends_from_other_packages_are_discovered(monkeypatch: pytest.MonkeyPatch):
+    plugin = EntryPoint(
+        name="plugin",
+        value="feature_store.feature_storage.arrow_ipc:ArrowIPCFeatureStorage",
+        group=discovery.STORAGE_GROUP,
+    )
+    monkeypatch.setattr(
+        discovery,
+        "entry_points",
+        lambda group: [plugin] if group == discovery.STORAGE_GROUP else [],
+    )
+    discovery._entry_points.cache_clear()
+
+    assert discovery.get_store_class("plugin") is ArrowIPCFeatureStorage
+    assert "plugin" in discovery.available_store_types()
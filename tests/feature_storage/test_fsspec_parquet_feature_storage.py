@@ -0,0 +1,130 @@
+import datetime
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from feature_store import Client
+from feature_store.feature import FeatureGroup
+from feature_store.feature_storage.fsspec_parquet import (
+    FsspecParquetFeatureStorage,
+    _coalesce_ranges,
+)
+
+
+@pytest.fixture(params=["local_fsspec", "memory_fsspec"])
+def customer_feature_group_fsspec(
+    client: Client, customer_table_df: pd.DataFrame, request: pytest.FixtureRequest
+) -> FeatureGroup:
+    group = client.register_feature_group(
+        "customer",
+        id_column="customer_id",
+        location=f"{request.param}::customer.parquet",
+        description="Customer features",
+        features=["age", "height"],
+    )
+    yield client.upload_feature_data(group.name, customer_table_df)
+    store = client.auth.get_store(group.location)
+    store.fs.rm(store.root, recursive=True)
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    return df.sort_values(["customer_id", "date_time"]).reset_index(drop=True)
+
+
+def test_can_get_features_through_fsspec(
+    client: Client,
+    customer_feature_group_fsspec: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    result = client.get_features(["customer.age", "customer.height"]).to_pandas()
+    assert_frame_equal(_sorted(result), _sorted(customer_table_df), check_like=True)
+
+
+def test_download_data_filters_columns_time_range_and_entities(
+    client: Client,
+    customer_feature_group_fsspec: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    store = client.auth.get_store(customer_feature_group_fsspec.location)
+    result = store.download_data(
+        customer_feature_group_fsspec,
+        columns=["customer_id", "date_time", "age"],
+        start=datetime.date(2022, 2, 1),
+        entity_ids=[1, 2, 3],
+    ).to_pandas()
+
+    expected = customer_table_df[
+        (customer_table_df.date_time >= datetime.date(2022, 2, 1))
+        & customer_table_df.customer_id.isin([1, 2, 3])
+    ][["customer_id", "date_time", "age"]]
+    assert list(result.columns) == ["customer_id", "date_time", "age"]
+    assert_frame_equal(_sorted(result), _sorted(expected))
+
+
+def test_download_batches_streams_all_rows(
+    client: Client,
+    customer_feature_group_fsspec: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    store = client.auth.get_store(customer_feature_group_fsspec.location)
+    batches = list(store.download_batches(customer_feature_group_fsspec, batch_size=30))
+
+    assert all(batch.num_rows <= 30 for batch in batches)
+    assert sum(batch.num_rows for batch in batches) == len(customer_table_df)
+
+
+def test_footers_are_cached_between_reads(
+    client: Client, customer_feature_group_fsspec: FeatureGroup
+):
+    store: FsspecParquetFeatureStorage = client.auth.get_store(
+        customer_feature_group_fsspec.location
+    )
+    store.download_data(customer_feature_group_fsspec)
+    misses = store.footer_stats.misses
+    store.download_data(customer_feature_group_fsspec)
+
+    assert misses == 2
+    assert store.footer_stats.misses == misses
+    assert store.footer_stats.hits == misses
+
+
+def test_appended_partitions_are_read(
+    client: Client,
+    customer_feature_group_fsspec: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    new_rows = customer_table_df.head(5).assign(date_time=datetime.date(2022, 3, 1))
+    client.upload_feature_data("customer", new_rows)
+
+    store = client.auth.get_store(customer_feature_group_fsspec.location)
+    result = store.download_data(
+        customer_feature_group_fsspec, start=datetime.date(2022, 3, 1)
+    )
+    assert result.num_rows == 5
+
+
+def test_lazy_dataset_can_be_collected_with_polars(
+    client: Client,
+    customer_feature_group_fsspec: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    dataset = client.get_features(["customer.age"], entity_ids=[1, 2], lazy=True)
+    result = dataset.to_polars(engine="polars").to_arrow().to_pandas()
+    expected = customer_table_df[customer_table_df.customer_id.isin([1, 2])]
+    assert_frame_equal(
+        _sorted(result), _sorted(expected[["customer_id", "date_time", "age"]])
+    )
+
+
+def test_close_ranges_are_coalesced():
+    ranges = [(200, 300), (0, 100), (110, 150), (5000, 6000)]
+    assert _coalesce_ranges(ranges, hole_size_limit=64, range_size_limit=1000) == [
+        (0, 300),
+        (5000, 6000),
+    ]
+    assert _coalesce_ranges(ranges, hole_size_limit=64, range_size_limit=200) == [
+        (0, 150),
+        (200, 300),
+        (5000, 6000),
+    ]
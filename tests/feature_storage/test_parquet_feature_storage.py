@@ -0,0 +1,197 @@
+import datetime
+import pathlib
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
+import pytest
+
+from feature_store import Client
+from feature_store.feature import FeatureGroup
+from feature_store.feature_storage.parquet import ParquetFeatureStorage, _build_filter
+
+
+def test_download_data_only_reads_requested_columns(
+    client: Client, customer_feature_group_parquet: FeatureGroup
+):
+    store = client.auth.get_store(customer_feature_group_parquet.location)
+    result = store.download_data(
+        customer_feature_group_parquet, columns=["customer_id", "date_time", "age"]
+    )
+    assert result.column_names == ["customer_id", "date_time", "age"]
+
+
+def test_download_data_reads_all_columns_by_default(
+    client: Client,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    store = client.auth.get_store(customer_feature_group_parquet.location)
+    result = store.download_data(customer_feature_group_parquet)
+    assert set(result.column_names) == set(customer_table_df.columns)
+
+
+def test_upload_data_appends_new_partitions(
+    client: Client,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    new_df = customer_table_df.assign(date_time=datetime.date(2022, 3, 1))
+    store = client.auth.get_store(customer_feature_group_parquet.location)
+    store.upload_data(new_df, customer_feature_group_parquet)
+
+    result = store.download_data(customer_feature_group_parquet)
+    assert result.num_rows == len(customer_table_df) * 2
+    assert result.schema.field("date_time").type == pa.date32()
+
+
+def test_upload_data_writes_hive_partitions(
+    client: Client, customer_feature_group_parquet: FeatureGroup
+):
+    store = client.auth.get_store(customer_feature_group_parquet.location)
+    filesystem, path = store._get_path(customer_feature_group_parquet)
+    partitions = filesystem.get_file_info(pa_fs.FileSelector(path))
+
+    assert sorted(p.base_name for p in partitions) == [
+        "_common_metadata",
+        "date_time__date=2022-01-01",
+        "date_time__date=2022-02-01",
+    ]
+
+
+def test_time_range_filter_prunes_partitions(
+    client: Client, customer_feature_group_parquet: FeatureGroup
+):
+    store = client.auth.get_store(customer_feature_group_parquet.location)
+    dataset = store._get_dataset(customer_feature_group_parquet)
+    fragments = dataset.get_fragments(
+        filter=_build_filter(
+            customer_feature_group_parquet,
+            start=datetime.date(2022, 2, 1),
+            partition_column="date_time__date",
+        )
+    )
+    assert len(list(fragments)) == 1
+
+
+def test_timestamps_are_partitioned_by_date(client: Client):
+    group = client.register_feature_group(
+        "events",
+        id_column="customer_id",
+        location="local::events.parquet",
+        description="Events",
+        features=["clicks"],
+    )
+    timestamps = pd.date_range("2022-01-01", periods=48 * 60, freq="min")
+    df = pd.DataFrame(
+        {"customer_id": 1, "clicks": range(len(timestamps)), "date_time": timestamps}
+    )
+    store = client.auth.get_store(group.location)
+    store.upload_data(df, group)
+
+    filesystem, path = store._get_path(group)
+    partitions = filesystem.get_file_info(pa_fs.FileSelector(path))
+    assert sorted(p.base_name for p in partitions) == [
+        "_common_metadata",
+        "date_time__date=2022-01-01",
+        "date_time__date=2022-01-02",
+    ]
+
+    start = datetime.datetime(2022, 1, 2, 12)
+    dataset = store._get_dataset(group)
+    fragments = dataset.get_fragments(
+        filter=store._filter(group, dataset, start, None, None)
+    )
+    assert len(list(fragments)) == 1
+    result = store.download_data(group, start=start)
+    assert result.column_names == ["customer_id", "clicks", "date_time"]
+    assert result.num_rows == 12 * 60
+
+
+def test_legacy_single_file_is_read_and_converted_on_upload(
+    client: Client, customer_table_df: pd.DataFrame
+):
+    group = client.register_feature_group(
+        "customer",
+        id_column="customer_id",
+        location="local::customer.parquet",
+        description="Customer features",
+        features=["age", "height"],
+    )
+    store = client.auth.get_store(group.location)
+    filesystem, path = store._get_path(group)
+    pq.write_table(pa.Table.from_pandas(customer_table_df), path, filesystem=filesystem)
+
+    assert store.download_data(group).num_rows == len(customer_table_df)
+
+    new_df = customer_table_df.assign(date_time=datetime.date(2022, 3, 1))
+    store.upload_data(new_df, group)
+
+    assert filesystem.get_file_info(path).type == pa_fs.FileType.Directory
+    assert store.download_data(group).num_rows == len(customer_table_df) * 2
+
+
+def test_legacy_single_file_is_kept_when_conversion_fails(
+    client: Client, customer_table_df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+):
+    group = client.register_feature_group(
+        "customer",
+        id_column="customer_id",
+        location="local::customer.parquet",
+        description="Customer features",
+        features=["age", "height"],
+    )
+    store = client.auth.get_store(group.location)
+    filesystem, path = store._get_path(group)
+    pq.write_table(pa.Table.from_pandas(customer_table_df), path, filesystem=filesystem)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "_append", fail)
+    with pytest.raises(OSError, match="disk full"):
+        store.upload_data(customer_table_df, group)
+
+    assert filesystem.get_file_info(path).type == pa_fs.FileType.File
+    assert store.download_data(group).num_rows == len(customer_table_df)
+    parent = path.rsplit("/", 1)[0]
+    siblings = filesystem.get_file_info(pa_fs.FileSelector(parent))
+    assert [info.path for info in siblings if info.path.startswith(path)] == [path]
+
+
+def test_fingerprint_changes_on_append(
+    client: Client,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    store = client.auth.get_store(customer_feature_group_parquet.location)
+    before = store.fingerprint(customer_feature_group_parquet)
+    store.upload_data(customer_table_df, customer_feature_group_parquet)
+    assert store.fingerprint(customer_feature_group_parquet) != before
+
+
+def test_relative_uri_is_resolved_against_the_working_directory(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    customer_table_df: pd.DataFrame,
+):
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath("data").mkdir()
+    group = FeatureGroup(
+        name="customer",
+        location="local::customer.parquet",
+        id_column="customer_id",
+        description="Customer features",
+    )
+    store = ParquetFeatureStorage("data")
+
+    store.upload_data(customer_table_df, group)
+    before = store.fingerprint(group)
+    store.upload_data(customer_table_df, group)
+
+    assert tmp_path.joinpath("data", "customer.parquet").is_dir()
+    assert store.download_data(group).num_rows == len(customer_table_df) * 2
+    assert store.fingerprint(group) != before
+    store.delete_data(group)
+    assert not tmp_path.joinpath("data", "customer.parquet").exists()
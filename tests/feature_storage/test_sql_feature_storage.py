@@ -1,7 +1,17 @@
+import datetime
+import pathlib
+
 import pandas as pd
+import pyarrow as pa
+import pytest
+import sqlalchemy as sa
+import yaml
 
 from feature_store import Client
+from feature_store.auth.file_auth import FileAuth
 from feature_store.feature import FeatureGroup
+from feature_store.feature_storage import SQLAlchemyFeatureStorage
+from feature_store.feature_storage.sql import BULK_LOADERS
 
 
 def test_can_get_feature(
@@ -9,3 +19,194 @@ def test_can_get_feature(
 ):
     result = client.get_feature("customer.age")
     pd.testing.assert_frame_equal(result.to_pandas(), age_df, check_like=True)
+
+
+def test_download_data_only_selects_requested_columns(
+    client: Client, customer_feature_group_sql: FeatureGroup
+):
+    store = client.auth.get_store(customer_feature_group_sql.location)
+    result = store.download_data(
+        customer_feature_group_sql, columns=["customer_id", "date_time", "height"]
+    )
+    assert result.column_names == ["customer_id", "date_time", "height"]
+
+
+def test_download_data_with_no_matching_rows_keeps_columns(
+    client: Client, customer_feature_group_sql: FeatureGroup
+):
+    store = client.auth.get_store(customer_feature_group_sql.location)
+    result = store.download_data(
+        customer_feature_group_sql,
+        columns=["customer_id", "date_time", "age"],
+        entity_ids=[-1],
+    )
+    assert result.num_rows == 0
+    assert result.column_names == ["customer_id", "date_time", "age"]
+
+
+def test_storages_with_same_db_url_share_engine(tmp_path: pathlib.Path):
+    db_url = f"sqlite:///{tmp_path}/shared.db"
+    first = SQLAlchemyFeatureStorage(db_url)
+    second = SQLAlchemyFeatureStorage(db_url)
+    assert first.engine is second.engine
+
+
+def test_pool_options_are_read_from_config(tmp_path: pathlib.Path):
+    config_file = tmp_path.joinpath("featurestore.yaml")
+    config_file.write_text(
+        yaml.safe_dump(
+            {
+                "sources": {
+                    "pooled": {
+                        "type": "sqlalchemy",
+                        "db_url": f"sqlite:///{tmp_path}/pooled.db",
+                        "pool_size": 3,
+                        "max_overflow": 7,
+                    }
+                }
+            }
+        )
+    )
+    store = FileAuth(config_file=config_file).get_store("pooled::main.table")
+    assert store.engine.pool.size() == 3
+    assert store.engine.pool._max_overflow == 7
+
+
+def test_download_batches_are_bounded_by_batch_size(
+    client: Client, customer_feature_group_sql: FeatureGroup
+):
+    store = client.auth.get_store(customer_feature_group_sql.location)
+    store.batch_size = 30
+    batches = list(store.download_batches(customer_feature_group_sql))
+
+    assert [batch.num_rows for batch in batches] == [30, 30, 30, 10]
+
+
+def test_download_data_uses_declared_column_types(
+    client: Client, customer_feature_group_sql: FeatureGroup
+):
+    store = client.auth.get_store(customer_feature_group_sql.location)
+    result = store.download_data(customer_feature_group_sql)
+
+    assert result.schema.field("customer_id").type == pa.int64()
+    assert result.schema.field("date_time").type == pa.date32()
+
+
+def test_upload_data_appends_in_chunks(
+    client: Client,
+    customer_feature_group_sql: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    store = client.auth.get_store(customer_feature_group_sql.location)
+    store.batch_size = 40
+    inserted_batches = []
+
+    def record_batch(conn, table, batch):
+        inserted_batches.append(batch.num_rows)
+        conn.execute(table.insert(), batch.to_pylist())
+
+    monkeypatch.setitem(BULK_LOADERS, ("sqlite", "pysqlite"), record_batch)
+    result = store.upload_data(customer_table_df, customer_feature_group_sql)
+
+    assert inserted_batches == [40, 40, 20]
+    assert result.num_rows == len(customer_table_df)
+    assert store.download_data(customer_feature_group_sql).num_rows == 200
+
+
+def test_reflected_tables_are_shared_across_storages(
+    client: Client, customer_feature_group_sql: FeatureGroup
+):
+    location = customer_feature_group_sql.location
+    first = client.auth.get_store(location).get_table(location)
+    second = client.auth.get_store(location).get_table(location)
+    assert first is second
+
+
+def test_invalidating_table_cache_reflects_table_again(
+    client: Client, customer_feature_group_sql: FeatureGroup
+):
+    location = customer_feature_group_sql.location
+    store = client.auth.get_store(location)
+    first = store.get_table(location)
+    store.invalidate(location)
+    assert store.get_table(location) is not first
+
+
+def test_expired_table_reflections_are_refreshed(
+    client: Client, customer_feature_group_sql: FeatureGroup
+):
+    location = customer_feature_group_sql.location
+    store = client.auth.get_store(location)
+    store.table_cache_ttl = 0
+    store.invalidate(location)
+    assert store.get_table(location) is not store.get_table(location)
+
+
+def _create_untyped_events(db_url: str) -> None:
+    """An events table whose payload column has no Arrow type, and is NULL at first"""
+    table = sa.Table(
+        "events",
+        sa.MetaData(),
+        sa.Column("customer_id", sa.Integer),
+        sa.Column("date_time", sa.Date),
+        sa.Column("payload", sa.JSON),
+    )
+    engine = sa.create_engine(db_url)
+    table.create(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            table.insert(),
+            [
+                {
+                    "customer_id": i,
+                    "date_time": datetime.date(2022, 1, 1),
+                    "payload": sa.null() if i < 2 else {"value": i},
+                }
+                for i in range(5)
+            ],
+        )
+    engine.dispose()
+
+
+def test_untyped_column_that_starts_with_nulls_is_downloaded(tmp_path: pathlib.Path):
+    db_url = f"sqlite:///{tmp_path}/untyped.db"
+    _create_untyped_events(db_url)
+    group = FeatureGroup(
+        name="events",
+        location="untyped::main.events",
+        id_column="customer_id",
+        description="Events",
+    )
+
+    result = SQLAlchemyFeatureStorage(db_url, batch_size=2).download_data(group)
+
+    assert result.num_rows == 5
+    assert result["payload"].to_pylist() == [None, None] + [
+        {"value": i} for i in range(2, 5)
+    ]
+
+
+def test_untyped_column_that_starts_with_nulls_streams_one_schema(
+    client: Client, tmp_path: pathlib.Path
+):
+    _create_untyped_events(f"sqlite:///{tmp_path}/features.db")
+    group = client.register_feature_group(
+        "events",
+        id_column="customer_id",
+        location="local_sqlite::main.events",
+        description="Events",
+        features=["payload"],
+    )
+    store = client.auth.get_store(group.location)
+    store.batch_size = 2
+
+    schemas = {batch.schema for batch in store.download_batches(group)}
+    assert len(schemas) == 1
+
+    dataset = client.get_features(["events.payload"], lazy=True)
+    assert dataset.data["payload"].to_pylist() == [None, None] + [
+        {"value": i} for i in range(2, 5)
+    ]
+    reader = client.get_features(["events.payload"], lazy=True).to_batch_reader(2)
+    assert reader.read_all().num_rows == 5
@@ -0,0 +1,105 @@
+import datetime
+import pathlib
+
+import pyarrow as pa
+import pytest
+
+from feature_store.exceptions import FeatureDataException, MissingDataException
+from feature_store.feature import FeatureGroup
+from feature_store.online_storage import (
+    InMemoryOnlineStorage,
+    OnlineStorage,
+    SQLiteOnlineStorage,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def online_storage(request, tmp_path: pathlib.Path) -> OnlineStorage:
+    if request.param == "memory":
+        return InMemoryOnlineStorage()
+    return SQLiteOnlineStorage(db_url=f"sqlite:///{tmp_path.joinpath('online.db')}")
+
+
+@pytest.fixture()
+def feature_group() -> FeatureGroup:
+    return FeatureGroup(
+        name="customer",
+        location="local::customer.parquet",
+        id_column="customer_id",
+        datetime_column="date_time",
+        description="Customer features",
+    )
+
+
+@pytest.fixture()
+def history() -> pa.Table:
+    return pa.table(
+        {
+            "customer_id": [1, 2, 1, 2, 3],
+            "date_time": [
+                datetime.date(2022, 1, 1),
+                datetime.date(2022, 1, 1),
+                datetime.date(2022, 2, 1),
+                datetime.date(2021, 12, 1),
+                datetime.date(2022, 1, 1),
+            ],
+            "age": [30, 40, 31, 39, 50],
+        }
+    )
+
+
+def test_read_latest_returns_newest_row_per_entity(
+    online_storage: OnlineStorage, feature_group: FeatureGroup, history: pa.Table
+):
+    online_storage.write_latest(feature_group, history)
+    result = online_storage.read_latest(feature_group, ["age"], [1, 2, 3])
+    assert result.to_pydict() == {"age": [31, 40, 50]}
+
+
+def test_read_latest_follows_requested_order_with_nulls_for_unknown_ids(
+    online_storage: OnlineStorage, feature_group: FeatureGroup, history: pa.Table
+):
+    online_storage.write_latest(feature_group, history)
+    result = online_storage.read_latest(feature_group, ["date_time", "age"], [3, 99, 1])
+    assert result.to_pydict() == {
+        "date_time": [datetime.date(2022, 1, 1), None, datetime.date(2022, 2, 1)],
+        "age": [50, None, 31],
+    }
+
+
+def test_write_latest_keeps_newer_stored_rows(
+    online_storage: OnlineStorage, feature_group: FeatureGroup, history: pa.Table
+):
+    online_storage.write_latest(feature_group, history)
+    online_storage.write_latest(
+        feature_group,
+        pa.table(
+            {
+                "customer_id": [1, 2],
+                "date_time": [datetime.date(2022, 1, 15), datetime.date(2022, 3, 1)],
+                "age": [0, 41],
+            }
+        ),
+    )
+    result = online_storage.read_latest(feature_group, ["age"], [1, 2])
+    assert result.to_pydict() == {"age": [31, 41]}
+
+
+def test_read_latest_raises_without_online_data(
+    online_storage: OnlineStorage, feature_group: FeatureGroup
+):
+    with pytest.raises(MissingDataException):
+        online_storage.read_latest(feature_group, ["age"], [1])
+
+
+def test_sqlite_write_latest_raises_on_new_columns(
+    tmp_path: pathlib.Path, feature_group: FeatureGroup, history: pa.Table
+):
+    storage = SQLiteOnlineStorage(db_url=f"sqlite:///{tmp_path.joinpath('online.db')}")
+    storage.write_latest(feature_group, history.drop_columns(["age"]))
+    with pytest.raises(FeatureDataException):
+        storage.write_latest(feature_group, history)
+
+    storage.clear(feature_group)
+    storage.write_latest(feature_group, history)
+    assert storage.read_latest(feature_group, ["age"], [1]).to_pydict() == {"age": [31]}
@@ -0,0 +1,86 @@
+import pytest
+
+from feature_store.feature import Feature, FeatureGroup
+from feature_store.registry_backends.cache import CachedRegistryBackend
+from feature_store.registry_backends.db import Base, DatabaseRegistryBackend
+
+
+@pytest.fixture()
+def backend() -> CachedRegistryBackend:
+    db_backend = DatabaseRegistryBackend("sqlite:///:memory:")
+    Base.metadata.create_all(db_backend._engine)
+    return CachedRegistryBackend(db_backend, max_size=2)
+
+
+def make_feature_group(name: str) -> FeatureGroup:
+    return FeatureGroup(
+        name=name,
+        id_column="customer_id",
+        location=f"local::{name}.parquet",
+        description=f"{name} of customer",
+        features=[
+            Feature(
+                name=f"{name}_feature",
+                id_column="customer_id",
+                datetime_column="date_time",
+            )
+        ],
+    )
+
+
+def test_repeated_lookups_are_served_from_cache(backend: CachedRegistryBackend):
+    backend.add_feature_group_metadata(make_feature_group("age"))
+
+    first = backend.get_feature_group_metadata("age")
+    second = backend.get_feature_group_metadata("age")
+
+    assert first == second
+    assert backend.stats.misses == 1
+    assert backend.stats.hits == 1
+
+
+def test_cached_feature_groups_are_copies(backend: CachedRegistryBackend):
+    backend.add_feature_group_metadata(make_feature_group("age"))
+
+    first = backend.get_feature_group_metadata("age")
+    second = backend.get_feature_group_metadata("age")
+
+    assert first.features[0] is not second.features[0]
+
+
+def test_least_recently_used_group_is_evicted(backend: CachedRegistryBackend):
+    for name in ["age", "height", "weight"]:
+        backend.add_feature_group_metadata(make_feature_group(name))
+        backend.get_feature_group_metadata(name)
+
+    assert backend.stats.evictions == 1
+    backend.get_feature_group_metadata("age")
+    assert backend.stats.hits == 0
+
+
+def test_expired_entries_are_fetched_again(backend: CachedRegistryBackend):
+    backend.ttl = 0
+    backend.add_feature_group_metadata(make_feature_group("age"))
+
+    backend.get_feature_group_metadata("age")
+    backend.get_feature_group_metadata("age")
+
+    assert backend.stats.misses == 2
+
+
+def test_missing_groups_are_not_cached(backend: CachedRegistryBackend):
+    assert backend.get_feature_group_metadata("age") is None
+    backend.add_feature_group_metadata(make_feature_group("age"))
+    assert backend.get_feature_group_metadata("age") is not None
+
+
+def test_bulk_lookup_only_fetches_uncached_groups(backend: CachedRegistryBackend):
+    for name in ["age", "height"]:
+        backend.add_feature_group_metadata(make_feature_group(name))
+    backend.get_feature_group_metadata("age")
+
+    result = backend.get_feature_groups_metadata(["height", "age", "missing"])
+
+    assert list(result) == ["height", "age"]
+    assert backend.stats.hits == 1
+    assert backend.stats.misses == 3
@@ -1,6 +1,8 @@
+import datetime
+
 import pytest
 
-from feature_store.feature import FeatureGroup
+from feature_store.feature import Feature, FeatureGroup, Snapshot
 from feature_store.registry_backends.db import Base, DatabaseRegistryBackend
 
 
@@ -40,3 +42,48 @@ def test_adding_new_feature_shows_up_in_all_features(backend: DatabaseRegistryBa
     backend.add_feature_group_metadata(new_feature)
     result = backend.get_available_feature_metadata()
     assert result == [new_feature]
+
+
+def test_can_get_multiple_feature_groups_at_once(backend: DatabaseRegistryBackend):
+    feature_groups = [
+        FeatureGroup(
+            name=name,
+            id_column="id",
+            location=f"local::{name}.parquet",
+            description="test",
+            features=[Feature(name=name, id_column="id", datetime_column="date_time")],
+        )
+        for name in ["age", "height", "weight"]
+    ]
+    for feature_group in feature_groups:
+        backend.add_feature_group_metadata(feature_group)
+
+    result = backend.get_feature_groups_metadata(["weight", "age", "missing"])
+
+    assert result == {"weight": feature_groups[2], "age": feature_groups[0]}
+
+
+def test_can_set_and_update_snapshot_metadata(backend: DatabaseRegistryBackend):
+    backend.add_feature_group_metadata(
+        FeatureGroup(
+            name="snapshotted",
+            id_column="id",
+            location="local::snapshotted.parquet",
+            description="test",
+        )
+    )
+    first = Snapshot("local::first", datetime.date(2022, 1, 1))
+    backend.set_snapshot_metadata("snapshotted", first)
+    assert backend.get_feature_group_metadata("snapshotted").snapshot == first
+
+    second = Snapshot("local::second", datetime.datetime(2022, 2, 1, 12, 30))
+    backend.set_snapshot_metadata("snapshotted", second)
+    assert backend.get_feature_groups_metadata(["snapshotted"]) == {
+        "snapshotted": FeatureGroup(
+            name="snapshotted",
+            id_column="id",
+            location="local::snapshotted.parquet",
+            description="test",
+            snapshot=second,
+        )
+    }
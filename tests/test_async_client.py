@@ -0,0 +1,152 @@
+import asyncio
+import pathlib
+
+import pandas as pd
+import pytest
+import yaml
+from pandas.testing import assert_frame_equal
+
+from feature_store import AsyncClient, Client
+from feature_store.auth.file_auth import FileAuth
+from feature_store.exceptions import FeatureDataException, FeatureNotFoundException
+from feature_store.feature import FeatureGroup
+from feature_store.feature_storage import ThreadedFeatureStorage
+from feature_store.feature_storage.async_sql import AsyncSQLAlchemyFeatureStorage
+from feature_store.registry_backends.async_db import AsyncDatabaseRegistryBackend
+from feature_store.registry_backends.base import ThreadedRegistryBackend
+
+
+@pytest.fixture()
+def async_client(tmp_path: pathlib.Path, config: pathlib.Path) -> AsyncClient:
+    registry = AsyncDatabaseRegistryBackend(
+        f"sqlite+aiosqlite:///{tmp_path.joinpath('async_store.db')}"
+    )
+    return AsyncClient(registry=registry, auth=FileAuth(config_file=config))
+
+
+def test_async_client_can_upload_and_get_features(
+    async_client: AsyncClient,
+    age_df: pd.DataFrame,
+    height_df: pd.DataFrame,
+    customer_table_df: pd.DataFrame,
+):
+    async def run() -> pd.DataFrame:
+        await async_client.register_feature_group(
+            "age",
+            id_column="customer_id",
+            location="local::age.parquet",
+            description="Customer age",
+            features=["age"],
+        )
+        await async_client.register_feature_group(
+            "height",
+            id_column="customer_id",
+            location="local_sqlite::main.height",
+            description="Customer height",
+            features=["height"],
+        )
+        await async_client.upload_feature_data("age", age_df)
+        await async_client.upload_feature_data("height", height_df)
+        dataset = await async_client.get_features(["age.age", "height.height"])
+        return dataset.to_pandas()
+
+    result = asyncio.run(run())
+    assert_frame_equal(result, customer_table_df, check_like=True)
+
+
+def test_async_client_reads_data_uploaded_by_sync_client(
+    client: Client,
+    config: pathlib.Path,
+    customer_feature_group_sql: FeatureGroup,
+    age_df: pd.DataFrame,
+):
+    async_client = AsyncClient(
+        registry=ThreadedRegistryBackend(client.registry),
+        auth=FileAuth(config_file=config),
+    )
+
+    result = asyncio.run(async_client.get_feature("customer.age")).to_pandas()
+    assert_frame_equal(result, age_df, check_like=True)
+
+
+def test_async_client_raises_for_missing_feature_group(async_client: AsyncClient):
+    with pytest.raises(FeatureNotFoundException):
+        asyncio.run(async_client.get_features(["idontexist.age"]))
+
+
+def test_async_client_reads_materialized_snapshot(
+    client: Client,
+    config: pathlib.Path,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    client.materialize("customer")
+    async_client = AsyncClient(
+        registry=ThreadedRegistryBackend(client.registry),
+        auth=FileAuth(config_file=config),
+    )
+
+    result = asyncio.run(async_client.get_features(["customer.age"])).to_pandas()
+    assert len(result) == customer_table_df.customer_id.nunique()
+
+
+def test_async_snapshot_dataset_cannot_be_joined_point_in_time(
+    client: Client,
+    config: pathlib.Path,
+    customer_feature_group_parquet: FeatureGroup,
+):
+    client.materialize("customer")
+    async_client = AsyncClient(
+        registry=ThreadedRegistryBackend(client.registry),
+        auth=FileAuth(config_file=config),
+    )
+    dataset = asyncio.run(async_client.get_features(["customer.age"]))
+
+    with pytest.raises(FeatureDataException, match="latest=False"):
+        dataset.as_of()
+    history = asyncio.run(async_client.get_features(["customer.age"], latest=False))
+    assert history.as_of().data.num_rows == 100
+
+
+def test_async_client_runs_sql_source_with_sync_url_in_a_thread(
+    tmp_path: pathlib.Path, age_df: pd.DataFrame
+):
+    db_url = f"sqlite:///{tmp_path}/sync.db"
+    config = tmp_path.joinpath("sync.yaml")
+    config.write_text(
+        yaml.safe_dump(
+            {
+                "sources": {
+                    "sync_sqlite": {"type": "sqlalchemy", "db_url": db_url},
+                    "async_sqlite": {
+                        "type": "sqlalchemy",
+                        "db_url": db_url.replace("sqlite", "sqlite+aiosqlite", 1),
+                    },
+                }
+            }
+        )
+    )
+    registry = AsyncDatabaseRegistryBackend(
+        f"sqlite+aiosqlite:///{tmp_path.joinpath('async_store.db')}"
+    )
+    auth = FileAuth(config_file=config)
+    async_client = AsyncClient(registry=registry, auth=auth)
+
+    async def run() -> pd.DataFrame:
+        await async_client.register_feature_group(
+            "age",
+            id_column="customer_id",
+            location="sync_sqlite::main.age",
+            description="Customer age",
+            features=["age"],
+        )
+        await async_client.upload_feature_data("age", age_df)
+        dataset = await async_client.get_features(["age.age"])
+        return dataset.to_pandas()
+
+    result = asyncio.run(run())
+    assert_frame_equal(result, age_df, check_like=True)
+    assert isinstance(auth.get_async_store("sync_sqlite::x"), ThreadedFeatureStorage)
+    assert isinstance(
+        auth.get_async_store("async_sqlite::x"), AsyncSQLAlchemyFeatureStorage
+    )
@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 import pytest
@@ -54,3 +55,30 @@ def test_auth_gets_correct_correct_storage_based_on_location(
 ):
     result = client.auth.get_store(location)
     assert isinstance(result, store)
+
+
+def _write_sources(config_file: pathlib.Path, sources: dict, mtime_ns: int) -> None:
+    with config_file.open("w") as f:
+        yaml.dump({"sources": sources}, f)
+    os.utime(config_file, ns=(mtime_ns, mtime_ns))
+
+
+def test_auth_reuses_stores_and_rebuilds_only_changed_sources(tmp_path: pathlib.Path):
+    config_file = tmp_path.joinpath("featurestore.yaml")
+    sources = {
+        "parquet": {"type": "parquet", "uri": f"file:///{tmp_path}/a"},
+        "sql": {"type": "sqlalchemy", "db_url": f"sqlite:///{tmp_path / 'a.db'}"},
+    }
+    _write_sources(config_file, sources, mtime_ns=1_000_000_000)
+    auth = FileAuth(config_file=config_file)
+
+    parquet = auth.get_store("parquet::table")
+    sql = auth.get_store("sql::main.table")
+    assert auth.get_store("parquet::other") is parquet
+
+    sources["parquet"]["uri"] = f"file:///{tmp_path}/b"
+    _write_sources(config_file, sources, mtime_ns=2_000_000_000)
+
+    assert auth.get_store("parquet::table") is not parquet
+    assert auth.get_store("parquet::table").uri == f"file:///{tmp_path}/b"
+    assert auth.get_store("sql::main.table") is sql
@@ -0,0 +1,46 @@
+import json
+import pathlib
+
+from benchmarks.generator import Scale, generate_feature_group
+from benchmarks.harness import Result, measure
+from benchmarks.import_time import measure_import
+from benchmarks.run import compare, main
+
+
+def test_generator_scales_rows_features_and_entities():
+    names, df = generate_feature_group(Scale(rows=30, features=3, entities=10), group=1)
+    assert names == ["g1_f0", "g1_f1", "g1_f2"]
+    assert len(df) == 30
+    assert df.entity_id.nunique() == 10
+    assert df.date_time.nunique() == 3
+
+
+def test_benchmark_suite_saves_baseline(tmp_path: pathlib.Path):
+    baseline = tmp_path.joinpath("baseline.json")
+    args = ["--rows", "40", "--entities", "10", "--repeat", "1"]
+
+    assert main([*args, "--save", str(baseline)]) == 0
+    results = json.loads(baseline.read_text())["results"]
+    assert "get_features[parquet]" in results
+    assert "upload_feature_data[sql]" in results
+
+
+def test_compare_reports_benchmarks_slower_than_threshold():
+    results = [
+        Result("fast", 1, 0.1, 0.1, 0.1, 0.1, 10.0, 0, 0),
+        Result("slow", 1, 0.2, 0.2, 0.2, 0.2, 5.0, 0, 0),
+        Result("new", 1, 0.2, 0.2, 0.2, 0.2, 5.0, 0, 0),
+    ]
+    baselines = {"fast": {"p50": 0.1}, "slow": {"p50": 0.1}}
+    assert compare(results, baselines, threshold=0.2) == ["slow"]
+
+
+def test_measure_reports_python_heap_peak_next_to_arrow():
+    result = measure("alloc", lambda: bytearray(2**24), rows=1, repeat=1, warmup=0)
+    assert result.peak_python_bytes >= 2**24
+    assert result.peak_arrow_bytes == 0
+
+
+def test_importing_the_client_does_not_load_backend_dependencies():
+    result = measure_import("from feature_store import Client", repeat=1)
+    assert not {"pandas", "sqlalchemy", "polars", "yaml"} & set(result.modules)
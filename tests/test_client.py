@@ -1,10 +1,20 @@
+import collections
+import dataclasses
+import datetime
+import threading
+import time
+from typing import Any, Callable
+
 import pandas as pd
+import pyarrow as pa
 import pytest
+import sqlalchemy as sa
 from pandas.testing import assert_frame_equal
 
 from feature_store import Client
 from feature_store.exceptions import FeatureNotFoundException
 from feature_store.feature import FeatureGroup
+from feature_store.tracing import Instrumentation, Span
 
 
 def test_can_list_existing_features(client: Client):
@@ -47,3 +57,413 @@ def test_can_get_multiple_features(
 def test_getting_a_feature_that_doesnt_exist_raises_not_found_exception(client: Client):
     with pytest.raises(FeatureNotFoundException):
         client.get_feature("idontexist")
+
+
+@pytest.mark.parametrize(
+    "feature_group", ["customer_feature_group_parquet", "customer_feature_group_sql"]
+)
+def test_can_filter_features_by_date_range(
+    client: Client,
+    customer_table_df: pd.DataFrame,
+    feature_group: str,
+    request: pytest.FixtureRequest,
+):
+    request.getfixturevalue(feature_group)
+    start = datetime.date(year=2022, month=1, day=15)
+    end = datetime.date(year=2022, month=2, day=1)
+
+    result = client.get_features(
+        ["customer.age", "customer.height"], start=start, end=end
+    ).to_pandas()
+
+    expected = customer_table_df[customer_table_df.date_time >= start].reset_index(
+        drop=True
+    )
+    assert_frame_equal(result, expected, check_like=True)
+
+
+@pytest.mark.parametrize(
+    "feature_group", ["customer_feature_group_parquet", "customer_feature_group_sql"]
+)
+def test_can_filter_features_by_entity_ids(
+    client: Client,
+    age_df: pd.DataFrame,
+    feature_group: str,
+    request: pytest.FixtureRequest,
+):
+    request.getfixturevalue(feature_group)
+
+    result = client.get_features(["customer.age"], entity_ids=[1, 2, 3]).to_pandas()
+
+    expected = age_df[age_df.customer_id.isin([1, 2, 3])].reset_index(drop=True)
+    assert_frame_equal(result, expected, check_like=True)
+
+
+def test_getting_a_feature_from_a_missing_group_raises_not_found_exception(
+    client: Client,
+):
+    with pytest.raises(FeatureNotFoundException, match="idontexist"):
+        client.get_features(["idontexist.age"])
+
+
+@pytest.fixture()
+def split_feature_groups(
+    client: Client, age_df: pd.DataFrame, height_df: pd.DataFrame
+) -> list[FeatureGroup]:
+    age = client.register_feature_group(
+        "age",
+        id_column="customer_id",
+        location="local::age.parquet",
+        description="Customer age",
+        features=["age"],
+    )
+    height = client.register_feature_group(
+        "height",
+        id_column="customer_id",
+        location="local_sqlite::main.height",
+        description="Customer height",
+        features=["height"],
+    )
+    client.upload_feature_data(age.name, age_df)
+    client.upload_feature_data(height.name, height_df)
+    return [age, height]
+
+
+@pytest.mark.usefixtures("split_feature_groups")
+def test_can_download_feature_groups_concurrently(
+    client: Client, customer_table_df: pd.DataFrame
+):
+    client.max_workers = 4
+    result = client.get_features(["age.age", "height.height"]).to_pandas()
+    assert_frame_equal(result, customer_table_df, check_like=True)
+
+
+@pytest.mark.usefixtures("split_feature_groups")
+def test_concurrent_download_raises_error_of_first_failing_group(client: Client):
+    client.max_workers = 4
+
+    def fail(group: FeatureGroup, **kwargs):
+        raise RuntimeError(group.name)
+
+    client._download_group = fail
+    with pytest.raises(RuntimeError, match="age"):
+        client.get_features(["age.age", "height.height"])
+
+
+class _InFlightRecorder:
+    """Wraps stores so the maximum number of concurrent downloads per source is recorded"""
+
+    def __init__(self, get_store: Callable[[str], Any]):
+        self._get_store = get_store
+        self._lock = threading.Lock()
+        self.in_flight: collections.Counter = collections.Counter()
+        self.peak: collections.Counter = collections.Counter()
+
+    def get_store(self, location: str) -> Any:
+        store = self._get_store(location)
+        source, _, _ = location.partition("::")
+        recorder = self
+
+        class Recording:
+            def __getattr__(self, name: str) -> Any:
+                return getattr(store, name)
+
+            def download_data(self, *args: Any, **kwargs: Any) -> pa.Table:
+                with recorder._lock:
+                    recorder.in_flight[source] += 1
+                    recorder.peak[source] = max(
+                        recorder.peak[source], recorder.in_flight[source]
+                    )
+                try:
+                    time.sleep(0.05)
+                    return store.download_data(*args, **kwargs)
+                finally:
+                    with recorder._lock:
+                        recorder.in_flight[source] -= 1
+
+        return Recording()
+
+
+@pytest.mark.parametrize("limit", [1, 2])
+def test_source_concurrency_limits_parallel_downloads(
+    client: Client, age_df: pd.DataFrame, height_df: pd.DataFrame, limit: int
+):
+    names = [f"age_{i}" for i in range(4)]
+    for name in names:
+        client.register_feature_group(
+            name,
+            id_column="customer_id",
+            location=f"local::{name}.parquet",
+            description="Customer age",
+            features=[name],
+        )
+        client.upload_feature_data(name, age_df.rename(columns={"age": name}))
+    client.register_feature_group(
+        "height",
+        id_column="customer_id",
+        location="local_sqlite::main.height",
+        description="Customer height",
+        features=["height"],
+    )
+    client.upload_feature_data("height", height_df)
+
+    recorder = _InFlightRecorder(client.auth.get_store)
+    client.auth.get_store = recorder.get_store
+    client.max_workers = 5
+    client.source_concurrency = {"local": limit}
+
+    client.get_features([f"{name}.{name}" for name in names] + ["height.height"])
+
+    assert 1 <= recorder.peak["local"] <= limit
+    assert recorder.peak["local_sqlite"] == 1
+
+
+@pytest.mark.parametrize(
+    "feature_group", ["customer_feature_group_parquet", "customer_feature_group_sql"]
+)
+def test_lazy_dataset_can_be_streamed_in_batches(
+    client: Client,
+    customer_table_df: pd.DataFrame,
+    feature_group: str,
+    request: pytest.FixtureRequest,
+):
+    request.getfixturevalue(feature_group)
+    dataset = client.get_features(["customer.age", "customer.height"], lazy=True)
+
+    batches = list(dataset.iter_batches(batch_size=30))
+
+    assert all(batch.num_rows <= 30 for batch in batches)
+    result = pa.Table.from_batches(batches).to_pandas()
+    assert_frame_equal(result, customer_table_df, check_like=True)
+
+
+@pytest.mark.usefixtures("split_feature_groups")
+def test_lazy_dataset_streams_joins_across_groups(
+    client: Client, customer_table_df: pd.DataFrame
+):
+    dataset = client.get_features(["age.age", "height.height"], lazy=True)
+
+    reader = dataset.to_batch_reader(batch_size=25)
+    result = reader.read_all().to_pandas()
+
+    expected = customer_table_df.sort_values(["customer_id", "date_time"])
+    assert_frame_equal(
+        result.sort_values(["customer_id", "date_time"]).reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_like=True,
+    )
+
+
+@pytest.mark.usefixtures("split_feature_groups")
+def test_lazy_dataset_can_be_collected_with_polars(
+    client: Client, customer_table_df: pd.DataFrame
+):
+    dataset = client.get_features(
+        ["age.age", "height.height"], entity_ids=[1, 2, 3], lazy=True
+    )
+
+    plan = dataset.to_lazy_polars().explain()
+    assert "is_in" in plan
+
+    result = dataset.to_polars(engine="polars").to_arrow().to_pandas()
+    expected = customer_table_df[customer_table_df.customer_id.isin([1, 2, 3])]
+    assert_frame_equal(
+        result.sort_values(["customer_id", "date_time"]).reset_index(drop=True),
+        expected.sort_values(["customer_id", "date_time"]).reset_index(drop=True),
+        check_like=True,
+    )
+
+
+def test_get_online_features_returns_latest_value_per_entity(
+    client: Client,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    client.sync_online_storage(customer_feature_group_parquet.name)
+    result = client.get_online_features(["customer.age", "customer.height"], [3, 7])
+
+    latest = customer_table_df[
+        customer_table_df.date_time == datetime.date(2022, 2, 1)
+    ].set_index("customer_id")
+    assert result.column_names == ["customer_id", "age", "height"]
+    assert result.to_pydict() == {
+        "customer_id": [3, 7],
+        "age": latest.loc[[3, 7], "age"].tolist(),
+        "height": latest.loc[[3, 7], "height"].tolist(),
+    }
+
+
+def _latest_rows(df: pd.DataFrame) -> pd.DataFrame:
+    return (
+        df.sort_values("date_time")
+        .groupby("customer_id")
+        .tail(1)
+        .sort_values("customer_id")
+        .reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize(
+    "feature_group", ["customer_feature_group_parquet", "customer_feature_group_sql"]
+)
+def test_get_features_reads_materialized_snapshot_without_time_range(
+    client: Client,
+    customer_table_df: pd.DataFrame,
+    feature_group: str,
+    request: pytest.FixtureRequest,
+):
+    request.getfixturevalue(feature_group)
+    materialized = client.materialize("customer")
+
+    assert materialized.snapshot.watermark == datetime.date(2022, 2, 1)
+    assert client.registry.get_feature_group_metadata("customer").snapshot == (
+        materialized.snapshot
+    )
+
+    result = client.get_features(["customer.age", "customer.height"]).to_pandas()
+    assert_frame_equal(result, _latest_rows(customer_table_df), check_like=True)
+
+    history = client.get_features(["customer.age"], latest=False).to_pandas()
+    assert len(history) == len(customer_table_df)
+
+
+def test_snapshot_reads_include_rows_uploaded_after_materializing(
+    client: Client,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    client.materialize("customer")
+    new_rows = customer_table_df.head(5).assign(date_time=datetime.date(2022, 3, 1))
+    client.upload_feature_data("customer", new_rows)
+
+    result = client.get_features(["customer.age", "customer.height"]).to_pandas()
+    expected = _latest_rows(pd.concat([customer_table_df, new_rows]))
+    assert_frame_equal(result, expected, check_like=True)
+
+
+def test_incremental_materialize_appends_only_new_rows(
+    client: Client,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    first = client.materialize("customer").snapshot
+    assert client.materialize("customer").snapshot == first
+
+    new_rows = customer_table_df.head(5).assign(date_time=datetime.date(2022, 3, 1))
+    client.upload_feature_data("customer", new_rows)
+    second = client.materialize("customer").snapshot
+
+    assert second.location == first.location
+    assert second.watermark == datetime.date(2022, 3, 1)
+    snapshot_group = client.registry.get_feature_group_metadata("customer")
+    snapshot_rows = client.auth.get_store(second.location).download_data(
+        dataclasses.replace(snapshot_group, location=second.location)
+    )
+    assert snapshot_rows.num_rows == 50 + 5
+
+    refreshed = client.materialize("customer", full_refresh=True).snapshot
+    assert refreshed.location != first.location
+
+
+@pytest.mark.parametrize(
+    "feature_group", ["customer_feature_group_parquet", "customer_feature_group_sql"]
+)
+def test_full_refresh_deletes_previous_snapshot(
+    client: Client, feature_group: str, request: pytest.FixtureRequest
+):
+    request.getfixturevalue(feature_group)
+    first = client.materialize("customer").snapshot
+    refreshed = client.materialize("customer", full_refresh=True).snapshot
+
+    group = client.registry.get_feature_group_metadata("customer")
+    old_snapshot = dataclasses.replace(group, location=first.location, snapshot=None)
+    with pytest.raises((FileNotFoundError, sa.exc.NoSuchTableError)):
+        client.auth.get_store(first.location).download_data(old_snapshot)
+
+    result = client.get_features(["customer.age"]).to_pandas()
+    assert refreshed.location != first.location
+    assert len(result) == 50
+
+
+def test_latest_without_snapshot_is_computed_from_history(
+    client: Client,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    result = client.get_features(
+        ["customer.age", "customer.height"], latest=True
+    ).to_pandas()
+    assert_frame_equal(result, _latest_rows(customer_table_df), check_like=True)
+
+
+class RecordingTracer:
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def on_span(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+@pytest.mark.usefixtures("split_feature_groups")
+def test_client_traces_each_stage_of_get_features(client: Client):
+    tracer = RecordingTracer()
+    client.instrumentation = Instrumentation(tracers=[tracer])
+
+    client.get_features(["age.age", "height.height"]).to_pandas()
+
+    stages = [span.stage for span in tracer.spans]
+    assert stages == [
+        "registry",
+        "get_store",
+        "download",
+        "get_store",
+        "download",
+        "read_data",
+        "join",
+        "to_pandas",
+    ]
+    downloads = [span for span in tracer.spans if span.stage == "download"]
+    assert [(span.backend, span.feature_group) for span in downloads] == [
+        ("local", "age"),
+        ("local_sqlite", "height"),
+    ]
+    assert all(span.rows == 100 and span.bytes > 0 for span in downloads)
+    assert all(span.duration >= 0 for span in tracer.spans)
+
+    client.get_features(["age.age"])
+    stats = client.stats.as_dict()
+    assert stats["registry"]["calls"] == 2
+    assert stats["download"]["calls"] == 3
+    assert stats["download"]["rows"] == 300
+
+
+@pytest.mark.usefixtures("split_feature_groups")
+def test_failing_stage_is_counted_as_an_error(client: Client):
+    client.auth.get_store = lambda location: (_ for _ in ()).throw(KeyError(location))
+
+    with pytest.raises(KeyError):
+        client.get_features(["age.age"])
+
+    assert client.stats.stages["get_store"].errors == 1
+    assert "download" not in client.stats.stages
+
+
+def test_point_in_time_join_reads_history_of_materialized_group(
+    client: Client,
+    customer_feature_group_parquet: FeatureGroup,
+    customer_table_df: pd.DataFrame,
+):
+    client.materialize("customer")
+    spine = pa.table(
+        {
+            "customer_id": [1, 1],
+            "date_time": [datetime.date(2022, 1, 15), datetime.date(2022, 2, 15)],
+        }
+    )
+
+    result = client.get_features(["customer.age"]).as_of(spine=spine).to_pandas()
+
+    ages = customer_table_df[customer_table_df.customer_id == 1].sort_values(
+        "date_time"
+    )
+    assert result.age.tolist() == ages.age.tolist()
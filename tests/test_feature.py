@@ -1,10 +1,12 @@
 import copy
+import datetime
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from feature_store.exceptions import MismatchedFeatureException, MissingDataException
-from feature_store.feature import Dataset, Feature, FeatureGroup
+from feature_store.feature import Dataset, Feature, FeatureGroup, _tolerance_to_int
 
 
 @pytest.fixture()
@@ -56,3 +58,291 @@ def test_adding_feature_with_mismatched_id_columns_will_error(
     new_feature.id_column = "someothercolumn"
     with pytest.raises(MismatchedFeatureException):
         dataset + new_feature
+
+
+@pytest.fixture()
+def monthly_feature() -> Feature:
+    feature = Feature(name="age", id_column="customer_id", datetime_column="date_time")
+    return feature.read_data(
+        pa.table(
+            {
+                "customer_id": [1, 2, 1],
+                "date_time": [
+                    datetime.date(2022, 1, 1),
+                    datetime.date(2022, 1, 1),
+                    datetime.date(2022, 2, 1),
+                ],
+                "age": [30, 40, 31],
+            }
+        )
+    )
+
+
+@pytest.fixture()
+def daily_feature() -> Feature:
+    feature = Feature(
+        name="balance", id_column="customer_id", datetime_column="date_time"
+    )
+    return feature.read_data(
+        pa.table(
+            {
+                "customer_id": [1, 2, 2],
+                "date_time": [
+                    datetime.date(2022, 1, 5),
+                    datetime.date(2022, 1, 5),
+                    datetime.date(2022, 3, 5),
+                ],
+                "balance": [100, 200, 300],
+            }
+        )
+    )
+
+
+def test_point_in_time_join_uses_latest_value_before_spine(
+    monthly_feature: Feature, daily_feature: Feature
+):
+    dataset = Dataset(features=[daily_feature, monthly_feature]).as_of()
+    result = dataset.to_pandas().sort_values(["customer_id", "date_time"])
+
+    assert result.balance.tolist() == [100, 200, 300]
+    assert result.age.tolist() == [30, 40, 40]
+
+
+def test_point_in_time_join_respects_tolerance(
+    monthly_feature: Feature, daily_feature: Feature
+):
+    dataset = Dataset(features=[daily_feature, monthly_feature]).as_of(
+        tolerance=datetime.timedelta(days=10)
+    )
+    result = dataset.to_pandas().sort_values(["customer_id", "date_time"])
+
+    assert result.age.tolist()[:2] == [30, 40]
+    assert pd.isna(result.age.tolist()[2])
+
+
+def test_point_in_time_join_can_use_explicit_spine(monthly_feature: Feature):
+    spine = pd.DataFrame(
+        {
+            "customer_id": [1, 1],
+            "date_time": [datetime.date(2021, 12, 31), datetime.date(2022, 3, 1)],
+            "label": [0, 1],
+        }
+    )
+    result = Dataset(features=[monthly_feature]).as_of(spine=spine).to_pandas()
+
+    assert result.columns.tolist() == ["customer_id", "date_time", "label", "age"]
+    assert pd.isna(result.age[0])
+    assert result.age[1] == 31
+
+
+def test_point_in_time_dataset_can_be_streamed_in_batches(
+    monthly_feature: Feature, daily_feature: Feature
+):
+    dataset = Dataset(features=[daily_feature, monthly_feature]).as_of()
+
+    batches = list(dataset.iter_batches(batch_size=2))
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert pa.Table.from_batches(batches).sort_by("date_time") == dataset.data
+
+
+def test_point_in_time_tolerance_works_with_nanosecond_timestamps(
+    monthly_feature: Feature,
+):
+    spine = pa.table(
+        {
+            "customer_id": [1, 1],
+            "date_time": pa.array(
+                [datetime.datetime(2022, 1, 2), datetime.datetime(2022, 1, 3)],
+                pa.timestamp("ns"),
+            ),
+        }
+    )
+    result = (
+        Dataset(features=[monthly_feature])
+        .as_of(spine=spine, tolerance=datetime.timedelta(hours=36))
+        .to_pandas()
+    )
+    assert result.age[0] == 30
+    assert pd.isna(result.age[1])
+
+
+@pytest.mark.parametrize(
+    "data_type,expected",
+    [
+        (pa.date32(), -1),
+        (pa.date64(), -129_600_000),
+        (pa.timestamp("s"), -129_600),
+        (pa.timestamp("ms"), -129_600_000),
+        (pa.timestamp("us"), -129_600_000_000),
+        (pa.timestamp("ns"), -129_600_000_000_000),
+    ],
+)
+def test_tolerance_is_converted_to_ticks_of_the_datetime_column(
+    data_type: pa.DataType, expected: int
+):
+    assert _tolerance_to_int(datetime.timedelta(hours=36), data_type) == expected
+
+
+def test_tolerance_on_non_temporal_column_raises():
+    with pytest.raises(MismatchedFeatureException):
+        _tolerance_to_int(datetime.timedelta(hours=1), pa.int64())
+
+
+def test_exact_join_keeps_first_feature_rows_in_order_with_nulls_for_missing_keys():
+    dates = [datetime.date(2022, 1, 1), datetime.date(2022, 2, 1)]
+    age = Feature(name="age", id_column="id", datetime_column="date_time").read_data(
+        pa.table({"id": [3, 1, 2], "date_time": [dates[0]] * 3, "age": [30, 10, 20]})
+    )
+    height = Feature(
+        name="height", id_column="id", datetime_column="date_time"
+    ).read_data(
+        pa.table(
+            {
+                "id": [1, 3, 3, None],
+                "date_time": [dates[0], dates[0], dates[1], dates[0]],
+                "height": [1.1, 3.3, 9.9, 0.0],
+            }
+        )
+    )
+    weight = Feature(
+        name="weight", id_column="id", datetime_column="date_time"
+    ).read_data(pa.table({"id": [2], "date_time": [dates[0]], "weight": [2.2]}))
+
+    result = Dataset(features=[age, height, weight]).data
+
+    assert result.to_pydict() == {
+        "id": [3, 1, 2],
+        "date_time": [dates[0]] * 3,
+        "age": [30, 10, 20],
+        "height": [3.3, 1.1, None],
+        "weight": [None, None, 2.2],
+    }
+
+
+def test_streamed_batches_keep_values_missing_from_a_sparse_middle_feature():
+    date = datetime.date(2022, 1, 1)
+
+    def feature(name: str, ids: list[int], values: list[int]) -> Feature:
+        return Feature(
+            name=name, id_column="id", datetime_column="date_time"
+        ).read_data(pa.table({"id": ids, "date_time": [date] * len(ids), name: values}))
+
+    dataset = Dataset(
+        features=[
+            feature("a", [1, 2, 3], [1, 2, 3]),
+            feature("b", [1], [4]),
+            feature("c", [1, 2, 3], [7, 8, 9]),
+        ]
+    )
+
+    result = pa.Table.from_batches(list(dataset.iter_batches(batch_size=2)))
+
+    assert result.to_pydict()["c"] == [7, 8, 9]
+    assert result == dataset.data
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [
+        [1, 2, 3, None, 5],
+        [10**12, 1, -(10**12), None, 7],
+        ["a", "b", "c", None, "e"],
+    ],
+    ids=["dense", "sparse", "strings"],
+)
+def test_streamed_batches_match_the_joined_table(ids: list):
+    dates = [datetime.date(2022, 1, day) for day in [1, 1, 2, 2, 3]]
+
+    def feature(name: str, rows: list[int]) -> Feature:
+        return Feature(
+            name=name, id_column="id", datetime_column="date_time"
+        ).read_data(
+            pa.table(
+                {
+                    "id": [ids[row] for row in rows],
+                    "date_time": [dates[row] for row in rows],
+                    name: [row * 10 for row in rows],
+                }
+            )
+        )
+
+    dataset = Dataset(
+        features=[feature("a", [0, 1, 2, 3, 4]), feature("b", [4, 3, 1, 1])]
+    )
+
+    result = pa.Table.from_batches(list(dataset.iter_batches(batch_size=2)))
+
+    assert result.to_pydict()["b"] == [None, 10, None, None, 40]
+    assert result == dataset.data
+
+
+def test_streamed_batches_match_the_joined_table_for_many_distinct_keys():
+    n = 3000
+    start = datetime.date(2000, 1, 1)
+    keys = {
+        "id": list(range(n)),
+        "date_time": [start + datetime.timedelta(days=i) for i in range(n)],
+    }
+    a = Feature(name="a", id_column="id", datetime_column="date_time").read_data(
+        pa.table({**keys, "a": list(range(n))})
+    )
+    b = Feature(name="b", id_column="id", datetime_column="date_time").read_data(
+        pa.table({**keys, "b": list(range(n))}).take(list(range(0, n, 2)))
+    )
+    dataset = Dataset(features=[a, b])
+
+    result = pa.Table.from_batches(list(dataset.iter_batches(batch_size=256)))
+
+    assert result.to_pydict()["b"][:4] == [0, None, 2, None]
+    assert result == dataset.data
+
+
+def test_exact_join_uses_first_row_for_duplicate_keys():
+    date = datetime.date(2022, 1, 1)
+    base = Feature(name="a", id_column="id", datetime_column="date_time").read_data(
+        pa.table({"id": [1, None], "date_time": [date, date], "a": [1, 2]})
+    )
+    duplicated = Feature(
+        name="b", id_column="id", datetime_column="date_time"
+    ).read_data(
+        pa.table({"id": [1, 1, None], "date_time": [date] * 3, "b": [10, 20, 30]})
+    )
+
+    result = Dataset(features=[base, duplicated]).data
+    assert result.to_pydict()["b"] == [10, None]
+
+
+@pytest.mark.parametrize(
+    "ids", [["a", "b", "c"], [10**15, 1, -(10**15)]], ids=["strings", "sparse_ints"]
+)
+def test_exact_join_matches_keys_of_any_type(ids: list):
+    date = datetime.datetime(2022, 1, 1, 12)
+    a = Feature(name="a", id_column="id", datetime_column="date_time").read_data(
+        pa.table({"id": ids, "date_time": [date] * 3, "a": [1, 2, 3]})
+    )
+    b = Feature(name="b", id_column="id", datetime_column="date_time").read_data(
+        pa.table({"id": ids[::-1], "date_time": [date] * 3, "b": [3, 2, 1]})
+    )
+    assert Dataset(features=[a, b]).data.to_pydict()["b"] == [1, 2, 3]
+
+
+@pytest.mark.parametrize("engine", ["arrow", "polars"])
+def test_dataset_can_convert_to_polars(dataset: Dataset, engine: str):
+    result = dataset.to_polars(engine=engine)
+    assert result.to_arrow().to_pylist() == dataset.data.to_pylist()
+
+
+def test_features_sharing_a_source_are_not_joined(
+    dataset: Dataset, monkeypatch: pytest.MonkeyPatch
+):
+    def fail(*args, **kwargs):
+        raise AssertionError("Features from the same group should not be joined")
+
+    monkeypatch.setattr("feature_store.feature._multi_join", fail)
+
+    source_table = dataset.features[0]._source.table
+    assert dataset.features[1]._source is dataset.features[0]._source
+    assert dataset.data.to_pydict() == (
+        source_table.select(["customer_id", "date_time", "age", "height"]).to_pydict()
+    )
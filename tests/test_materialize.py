@@ -0,0 +1,30 @@
+import pathlib
+
+import pytest
+
+from feature_store import Client
+from feature_store.feature import FeatureGroup
+from feature_store.materialize import main
+
+
+def test_materialize_command_records_snapshot(
+    client: Client,
+    config: pathlib.Path,
+    customer_feature_group_parquet: FeatureGroup,
+    capsys: pytest.CaptureFixture,
+):
+    main(
+        [
+            "customer",
+            "--config",
+            str(config),
+            "--registry-url",
+            client.registry.database_url,
+        ]
+    )
+
+    snapshot = client.registry.get_feature_group_metadata("customer").snapshot
+    assert snapshot is not None
+    assert capsys.readouterr().out == (
+        f"customer: {snapshot.location} up to {snapshot.watermark}\n"
+    )